@@ -1,18 +1,13 @@
-import asyncio
-from asyncio.base_events import BaseEventLoop
-from concurrent.futures import Executor, ProcessPoolExecutor
 from datetime import datetime
 from enum import Enum, Flag
 from functools import lru_cache, partial, wraps
 import io
 import keyword
 import logging
-from multiprocessing import Manager
 import os
 from pathlib import Path
 import pickle
 import re
-import signal
 import sys
 import tokenize
 from typing import (
@@ -29,6 +24,7 @@ from typing import (
     Pattern,
     Sequence,
     Set,
+    TYPE_CHECKING,
     Tuple,
     TypeVar,
     Union,
@@ -36,16 +32,21 @@ from typing import (
 )
 
 from appdirs import user_cache_dir
-from attr import dataclass, Factory
+from attr import attrib, dataclass, Factory
 import click
-import toml
 
 # lib2to3 fork
 from blib2to3.pytree import Node, Leaf, type_repr
 from blib2to3 import pygram, pytree
 from blib2to3.pgen2 import driver, token
+from blib2to3.pgen2.tokenize import TokenBuffer, TokenError, tokenize_string
 from blib2to3.pgen2.parse import ParseError
 
+if TYPE_CHECKING:
+    # Only imported where used, to keep `import black` fast for API users.
+    import asyncio
+    from asyncio.base_events import BaseEventLoop
+    from concurrent.futures import Executor
 
 __version__ = "18.6b4"
 DEFAULT_LINE_LENGTH = 88
@@ -71,6 +72,8 @@ Timestamp = float
 FileSize = int
 CacheInfo = Tuple[Timestamp, FileSize]
 Cache = Dict[Path, CacheInfo]
+GrammarIndex = int
+GrammarCache = Dict[Path, Tuple[CacheInfo, GrammarIndex]]
 out = partial(click.secho, bold=True, err=True)
 err = partial(click.secho, fg="red", err=True)
 
@@ -138,6 +141,8 @@ def read_pyproject_toml(
     Returns the path to a successfully found and read configuration file, None
     otherwise.
     """
+    import toml
+
     assert not isinstance(value, (int, bool)), "Invalid parameter type passed"
     if not value:
         root = find_project_root(ctx.params.get("src", ()))
@@ -339,6 +344,9 @@ def main(
             report=report,
         )
     else:
+        import asyncio
+        from concurrent.futures import ProcessPoolExecutor
+
         loop = asyncio.get_event_loop()
         executor = ProcessPoolExecutor(max_workers=os.cpu_count())
         try:
@@ -391,18 +399,29 @@ def reformat_one(
                 res_src = src.resolve()
                 if res_src in cache and cache[res_src] == get_cache_info(res_src):
                     changed = Changed.CACHED
+            grammar_cache: GrammarCache = {}
+            grammar_choice = GrammarChoice()
+            if changed is not Changed.CACHED:
+                grammar_cache = read_grammar_cache()
+                grammar_choice.index = get_grammar_hint(grammar_cache, src)
+            hint = grammar_choice.index
             if changed is not Changed.CACHED and format_file_in_place(
                 src,
                 line_length=line_length,
                 fast=fast,
                 write_back=write_back,
                 mode=mode,
+                grammar_choice=grammar_choice,
             ):
                 changed = Changed.YES
             if (write_back is WriteBack.YES and changed is not Changed.CACHED) or (
                 write_back is WriteBack.CHECK and changed is Changed.NO
             ):
                 write_cache(cache, [src], line_length, mode)
+            if grammar_choice.index != hint and not (
+                write_back is WriteBack.YES and changed is Changed.YES
+            ):
+                write_grammar_cache(grammar_cache, {src: grammar_choice.index})
         report.done(src, changed)
     except Exception as exc:
         report.failed(src, str(exc))
@@ -415,8 +434,8 @@ async def schedule_formatting(
     write_back: WriteBack,
     mode: FileMode,
     report: "Report",
-    loop: BaseEventLoop,
-    executor: Executor,
+    loop: "BaseEventLoop",
+    executor: "Executor",
 ) -> None:
     """Run formatting of `sources` in parallel using the provided `executor`.
 
@@ -425,6 +444,10 @@ async def schedule_formatting(
     `line_length`, `write_back`, `fast`, and `pyi` options are passed to
     :func:`format_file_in_place`.
     """
+    import asyncio
+    from multiprocessing import Manager
+    import signal
+
     cache: Cache = {}
     if write_back != WriteBack.DIFF:
         cache = read_cache(line_length, mode)
@@ -436,6 +459,9 @@ async def schedule_formatting(
 
     cancelled = []
     sources_to_cache = []
+    grammars_to_cache: Dict[Path, GrammarIndex] = {}
+    grammar_cache = read_grammar_cache()
+    hints = {src: get_grammar_hint(grammar_cache, src) for src in sources}
     lock = None
     if write_back == WriteBack.DIFF:
         # For diff output, we need locks to ensure we don't interleave output
@@ -445,17 +471,18 @@ async def schedule_formatting(
     tasks = {
         loop.run_in_executor(
             executor,
-            format_file_in_place,
+            format_file_in_place_with_grammar,
             src,
             line_length,
             fast,
             write_back,
             mode,
             lock,
+            hints[src],
         ): src
         for src in sorted(sources)
     }
-    pending: Iterable[asyncio.Task] = tasks.keys()
+    pending: Iterable["asyncio.Future[Tuple[bool, GrammarIndex]]"] = tasks.keys()
     try:
         loop.add_signal_handler(signal.SIGINT, cancel, pending)
         loop.add_signal_handler(signal.SIGTERM, cancel, pending)
@@ -471,18 +498,26 @@ async def schedule_formatting(
             elif task.exception():
                 report.failed(src, str(task.exception()))
             else:
-                changed = Changed.YES if task.result() else Changed.NO
+                result, grammar_index = task.result()
+                changed = Changed.YES if result else Changed.NO
                 # If the file was written back or was successfully checked as
                 # well-formatted, store this information in the cache.
                 if write_back is WriteBack.YES or (
                     write_back is WriteBack.CHECK and changed is Changed.NO
                 ):
                     sources_to_cache.append(src)
+                # The grammar is only worth remembering for unchanged contents.
+                if grammar_index != hints[src] and not (
+                    write_back is WriteBack.YES and changed is Changed.YES
+                ):
+                    grammars_to_cache[src] = grammar_index
                 report.done(src, changed)
     if cancelled:
         await asyncio.gather(*cancelled, loop=loop, return_exceptions=True)
     if sources_to_cache:
         write_cache(cache, sources_to_cache, line_length, mode)
+    if grammars_to_cache:
+        write_grammar_cache(grammar_cache, grammars_to_cache)
 
 
 def format_file_in_place(
@@ -492,12 +527,14 @@ def format_file_in_place(
     write_back: WriteBack = WriteBack.NO,
     mode: FileMode = FileMode.AUTO_DETECT,
     lock: Any = None,  # multiprocessing.Manager().Lock() is some crazy proxy
+    grammar_choice: Optional["GrammarChoice"] = None,
 ) -> bool:
     """Format file under `src` path. Return True if changed.
 
     If `write_back` is DIFF, write a diff to stdout. If it is YES, write reformatted
     code to the file.
-    `line_length` and `fast` options are passed to :func:`format_file_contents`.
+    `line_length`, `fast` and `grammar_choice` options are passed to
+    :func:`format_file_contents`.
     """
     if src.suffix == ".pyi":
         mode |= FileMode.PYI
@@ -505,9 +542,33 @@ def format_file_in_place(
     then = datetime.utcfromtimestamp(src.stat().st_mtime)
     with open(src, "rb") as buf:
         src_contents, encoding, newline = decode_bytes(buf.read())
+    if fast and write_back == WriteBack.YES:
+        # Without the safety checks, the chunks can go to the file as they are.
+        if not src_contents.strip():
+            return False
+
+        chunks = list(
+            format_str_iter(
+                src_contents,
+                line_length=line_length,
+                mode=mode,
+                grammar_choice=grammar_choice,
+            )
+        )
+        if is_same_contents(src_contents, chunks):
+            return False
+
+        with open(src, "w", encoding=encoding, newline=newline) as f:
+            f.writelines(chunks)
+        return True
+
     try:
         dst_contents = format_file_contents(
-            src_contents, line_length=line_length, fast=fast, mode=mode
+            src_contents,
+            line_length=line_length,
+            fast=fast,
+            mode=mode,
+            grammar_choice=grammar_choice,
         )
     except NothingChanged:
         return False
@@ -537,6 +598,28 @@ def format_file_in_place(
     return True
 
 
+def format_file_in_place_with_grammar(
+    src: Path,
+    line_length: int,
+    fast: bool,
+    write_back: WriteBack,
+    mode: FileMode,
+    lock: Any,
+    grammar_index: GrammarIndex,
+) -> Tuple[bool, GrammarIndex]:
+    """Format file under `src` path starting with the grammar at `grammar_index`.
+
+    Return whether the file changed and the index of the grammar that parsed it.
+    This is what :func:`schedule_formatting` runs in its executor since changes
+    to a :class:`GrammarChoice` don't travel back from child processes.
+    """
+    grammar_choice = GrammarChoice(grammar_index)
+    changed = format_file_in_place(
+        src, line_length, fast, write_back, mode, lock, grammar_choice=grammar_choice
+    )
+    return changed, grammar_choice.index
+
+
 def format_stdin_to_stdout(
     line_length: int,
     fast: bool,
@@ -580,17 +663,20 @@ def format_file_contents(
     line_length: int,
     fast: bool,
     mode: FileMode = FileMode.AUTO_DETECT,
+    grammar_choice: Optional["GrammarChoice"] = None,
 ) -> FileContent:
     """Reformat contents a file and return new contents.
 
     If `fast` is False, additionally confirm that the reformatted code is
     valid by calling :func:`assert_equivalent` and :func:`assert_stable` on it.
-    `line_length` is passed to :func:`format_str`.
+    `line_length` and `grammar_choice` are passed to :func:`format_str`.
     """
     if src_contents.strip() == "":
         raise NothingChanged
 
-    dst_contents = format_str(src_contents, line_length=line_length, mode=mode)
+    dst_contents = format_str(
+        src_contents, line_length=line_length, mode=mode, grammar_choice=grammar_choice
+    )
     if src_contents == dst_contents:
         raise NothingChanged
 
@@ -601,14 +687,37 @@ def format_file_contents(
 
 
 def format_str(
-    src_contents: str, line_length: int, *, mode: FileMode = FileMode.AUTO_DETECT
+    src_contents: str,
+    line_length: int,
+    *,
+    mode: FileMode = FileMode.AUTO_DETECT,
+    grammar_choice: Optional["GrammarChoice"] = None,
 ) -> FileContent:
     """Reformat a string and return new contents.
 
     `line_length` determines how many characters per line are allowed.
+    `grammar_choice` is passed to :func:`lib2to3_parse`.
     """
-    src_node = lib2to3_parse(src_contents)
-    dst_contents = ""
+    return "".join(
+        format_str_iter(
+            src_contents, line_length, mode=mode, grammar_choice=grammar_choice
+        )
+    )
+
+
+def format_str_iter(
+    src_contents: str,
+    line_length: int,
+    *,
+    mode: FileMode = FileMode.AUTO_DETECT,
+    grammar_choice: Optional["GrammarChoice"] = None,
+) -> Iterator[str]:
+    """Reformat a string and yield the new contents in chunks.
+
+    The chunks are the formatted lines and the empty lines between them, yielded
+    as they are produced.  Arguments are the same as for :func:`format_str`.
+    """
+    src_node = lib2to3_parse(src_contents, grammar_choice)
     future_imports = get_future_imports(src_node)
     is_pyi = bool(mode & FileMode.PYI)
     py36 = bool(mode & FileMode.PYTHON36) or is_python36(src_node)
@@ -625,13 +734,23 @@ def format_str(
     after = 0
     for current_line in lines.visit(src_node):
         for _ in range(after):
-            dst_contents += str(empty_line)
+            yield str(empty_line)
         before, after = elt.maybe_empty_lines(current_line)
         for _ in range(before):
-            dst_contents += str(empty_line)
+            yield str(empty_line)
         for line in split_line(current_line, line_length=line_length, py36=py36):
-            dst_contents += str(line)
-    return dst_contents
+            yield str(line)
+
+
+def is_same_contents(src_contents: str, chunks: Iterable[str]) -> bool:
+    """Return True if `chunks` add up to `src_contents`, without joining them."""
+    position = 0
+    for chunk in chunks:
+        if not src_contents.startswith(chunk, position):
+            return False
+
+        position += len(chunk)
+    return position == len(src_contents)
 
 
 def decode_bytes(src: bytes) -> Tuple[FileContent, Encoding, NewLine]:
@@ -656,20 +775,112 @@ GRAMMARS = [
     pygram.python_grammar_no_print_statement,
     pygram.python_grammar,
 ]
+STMT_KEYWORDS = {"print", "exec"}
+KEYWORD_OPERATORS = {"and", "else", "for", "if", "in", "is", "not", "or"}
+OPERAND_TOKENS = {token.NUMBER, token.STRING}
+OPERAND_OPENERS = {"{", "`", "~"}
+OPENING_BRACKET_VALUES = {"(", "[", "{"}
+CLOSING_BRACKET_VALUES = {")", "]", "}"}
+STATEMENT_SEPARATORS = {";", ":"}
+STATEMENT_START_TOKENS = {token.NEWLINE, token.INDENT, token.DEDENT}
+PREDICTION_TOKENS = {token.NAME, token.OP}
+
+
+@dataclass
+class GrammarChoice:
+    """The entry of `GRAMMARS` to try first when parsing a file.
+
+    :func:`lib2to3_parse` replaces `index` with the entry that ended up working,
+    and `offsets` with where the top-level statements of the source start, for
+    :func:`lib2to3_reparse`.
+    """
+
+    index: GrammarIndex = 0
+    offsets: List[int] = Factory(list)
+
+
+def predict_grammar(tokens: TokenBuffer) -> GrammarIndex:
+    """Return the index of the first entry in `GRAMMARS` that can parse `tokens`.
+
+    This is a quick scan for `print` and `exec` statements, i.e. those keywords
+    at the start of a statement directly followed by an operand.  Such code is
+    invalid in the grammars that treat them as names, so trying those first
+    would be a wasted parse.  Without any such statement, returns 0.
+    """
+    source = tokens.source
+    types = tokens.types
+    starts = tokens.starts
+    ends = tokens.ends
+    result = 0
+    depth = 0
+    at_statement_start = True
+    keyword = ""
+    for i in range(len(types)):
+        type = types[i]
+        if type == token.COMMENT or type == token.NL:
+            continue
+
+        value = source[starts[i] : ends[i]] if type in PREDICTION_TOKENS else ""
+        if keyword:
+            if (
+                type == token.NAME
+                and value not in KEYWORD_OPERATORS
+                or type in OPERAND_TOKENS
+                or value in OPERAND_OPENERS
+            ):
+                for index, grammar in enumerate(GRAMMARS):
+                    if keyword in grammar.keywords:
+                        result = max(result, index)
+                        break
+
+            keyword = ""
+        if type == token.OP:
+            if value in OPENING_BRACKET_VALUES:
+                depth += 1
+            elif value in CLOSING_BRACKET_VALUES:
+                depth -= 1
+            at_statement_start = depth == 0 and value in STATEMENT_SEPARATORS
+        elif type in STATEMENT_START_TOKENS:
+            at_statement_start = True
+        else:
+            if at_statement_start and type == token.NAME and value in STMT_KEYWORDS:
+                keyword = value
+            at_statement_start = False
+    return result
+
+
+def lib2to3_parse(src_txt: str, grammar_choice: GrammarChoice = None) -> Node:
+    """Given a string with source, return the lib2to3 Node.
 
+    Entries of `GRAMMARS` that :func:`predict_grammar` rules out are only tried
+    as a last resort.  So are the ones before `grammar_choice`, if given; that
+    is then updated with the grammar that succeeded.
 
-def lib2to3_parse(src_txt: str) -> Node:
-    """Given a string with source, return the lib2to3 Node."""
-    grammar = pygram.python_grammar_no_print_statement
+    Black never looks at `was_changed`, so the nodes don't track changes.
+    """
     if src_txt[-1:] != "\n":
         src_txt += "\n"
-    for grammar in GRAMMARS:
-        drv = driver.Driver(grammar, pytree.convert)
+    # The grammars only differ in keywords so the same tokens can be replayed.
+    tokens = tokenize_string(src_txt)
+    first = predict_grammar(tokens)
+    if grammar_choice is not None:
+        first = max(first, grammar_choice.index)
+    for index in (*range(first, len(GRAMMARS)), *range(first)):
+        drv = driver.Driver(
+            GRAMMARS[index],
+            pytree.convert,
+            collect_used_names=False,
+            track_changes=False,
+        )
         try:
-            result = drv.parse_string(src_txt, True)
+            result = drv.parse_tokens(tokens, True)
             break
 
         except ParseError as pe:
+            if index != len(GRAMMARS) - 1:
+                continue
+
+            # Report the failure of the most permissive grammar.
             lineno, column = pe.context[1]
             lines = src_txt.splitlines()
             try:
@@ -682,9 +893,170 @@ def lib2to3_parse(src_txt: str) -> Node:
 
     if isinstance(result, Leaf):
         result = Node(syms.file_input, [result])
+    if grammar_choice is not None:
+        grammar_choice.index = index
+        grammar_choice.offsets = statement_offsets(result, tokens)
     return result
 
 
+def lib2to3_reparse(
+    old_src: str, old_node: Node, new_src: str, grammar_choice: GrammarChoice = None
+) -> Node:
+    """Given `new_src`, an edit of `old_src`, return its lib2to3 Node.
+
+    `old_node` has to be the unmodified result of :func:`lib2to3_parse` on
+    `old_src` and `grammar_choice` the one that was passed to it.  Top-level
+    statements the edit can't affect are moved over from `old_node`, which
+    must not be used afterwards.  Only the source between them is parsed again,
+    with the same grammar.  If that isn't possible, `new_src` is parsed in full.
+
+    The statements are found through the offsets `grammar_choice` keeps, so the
+    old tree isn't rendered again.  Statements after the edit keep the `lineno`
+    of their leaves in `old_src`.
+    """
+    if old_src[-1:] != "\n":
+        old_src += "\n"
+    if new_src[-1:] != "\n":
+        new_src += "\n"
+    old_children = old_node.children
+    if (
+        grammar_choice is None
+        or old_node.type != syms.file_input
+        or len(grammar_choice.offsets) != len(old_children) + 1
+        or grammar_choice.offsets[-1] != len(old_src)
+    ):
+        return lib2to3_parse(new_src, grammar_choice)
+
+    if new_src == old_src:
+        return old_node
+
+    starts = grammar_choice.offsets
+    end = len(old_children) - 1  # the ENDMARKER
+    head = reusable_head(old_children, starts, old_src, new_src)
+    middle_start = starts[head]
+    shift = len(new_src) - len(old_src)
+    tail = reusable_tail(starts, old_src, new_src, head, shift)
+    middle_end = len(new_src)
+    if tail < end:
+        middle_end = (
+            starts[tail] + shift + len(first_leaf_of(old_children[tail]).prefix)
+        )
+    tokens = tokenize_string(new_src[middle_start:middle_end])
+    if predict_grammar(tokens) > grammar_choice.index:
+        return lib2to3_parse(new_src, grammar_choice)
+
+    drv = driver.Driver(
+        GRAMMARS[grammar_choice.index],
+        pytree.convert,
+        collect_used_names=False,
+        track_changes=False,
+    )
+    try:
+        result = drv.parse_tokens(tokens)
+    except (ParseError, TokenError, IndentationError):
+        return lib2to3_parse(new_src, grammar_choice)
+
+    if isinstance(result, Leaf):
+        result = Node(syms.file_input, [result])
+    middle = result.children
+    middle_offsets = statement_offsets(result, tokens)
+    offsets = starts[:head] + [middle_start + offset for offset in middle_offsets]
+    lines = new_src.count("\n", 0, middle_start)
+    if lines:
+        for child in middle:
+            for leaf in child.leaves():
+                leaf.lineno += lines
+    endmarker = middle.pop()
+    if tail < end:
+        first_leaf_of(old_children[tail]).prefix = endmarker.prefix
+        # The ENDMARKER of the middle starts where the first reused statement
+        # does now; the offsets of the statements after that only shift.
+        del offsets[-1]
+        offsets.extend(start + shift for start in starts[tail + 1 :])
+        children = old_children[:head] + middle + old_children[tail:]
+    else:
+        children = old_children[:head] + middle + [endmarker]
+    for child in children:
+        child.parent = None
+    old_children.clear()
+    grammar_choice.offsets = offsets
+    return Node(syms.file_input, children)
+
+
+def reusable_head(
+    old_children: List[LN], starts: List[int], old_src: str, new_src: str
+) -> int:
+    """Return how many top-level statements in front of an edit can be reused.
+
+    `starts` are the offsets of `old_children` in `old_src`, followed by its
+    length.  A statement is only safe to reuse once the first token of the next
+    one is intact, followed by one more character: before that, the edit could
+    turn it into e.g. an `else` clause or an indented line that extends the block.
+    """
+    end = len(old_children) - 1  # the ENDMARKER
+    head = 0
+    while head < end and new_src.startswith(
+        old_src[starts[head] : starts[head + 1]], starts[head]
+    ):
+        head += 1
+    first = first_leaf_of(old_children[head])
+    token_end = starts[head] + len(first.prefix) + len(first.value)
+    if token_end >= len(old_src) or not new_src.startswith(
+        old_src[starts[head] : token_end + 1], starts[head]
+    ):
+        head = max(head - 1, 0)
+    return head
+
+
+def reusable_tail(
+    starts: List[int], old_src: str, new_src: str, head: int, shift: int
+) -> int:
+    """Return the index of the first reusable top-level statement after an edit.
+
+    Statements are reused if their source ends `new_src` too and begins on a new
+    line there, `shift` characters away from their offset in `starts`.  The new
+    code in front of them might claim the comments that precede them, so those
+    are parsed along with it.  The ENDMARKER, last but one in `starts`, is never
+    reused.
+    """
+    end = len(starts) - 2
+    middle_start = starts[head]
+    tail = end
+    if not new_src.endswith(old_src[starts[end] :]):
+        return tail  # the edit is in the comments after the last statement
+
+    while (
+        tail > head
+        and starts[tail - 1] + shift >= middle_start
+        and new_src.startswith(
+            old_src[starts[tail - 1] : starts[tail]], starts[tail - 1] + shift
+        )
+    ):
+        tail -= 1
+    while (
+        tail < end
+        and starts[tail] + shift > middle_start
+        and new_src[starts[tail] + shift - 1] != "\n"
+    ):
+        tail += 1
+    return tail
+
+
+def statement_offsets(node: Node, tokens: TokenBuffer) -> List[int]:
+    """Return where the top-level statements of `node` start in the source.
+
+    `node` has to be parsed from `tokens`, whose line offsets locate the first
+    leaf of every statement.  The length of the source comes last.
+    """
+    row_offsets = tokens.row_offsets
+    offsets = []
+    for child in node.children:
+        leaf = first_leaf_of(child)
+        offsets.append(row_offsets[leaf.lineno - 1] + leaf.column - len(leaf.prefix))
+    offsets.append(len(tokens.source))
+    return offsets
+
+
 def lib2to3_unparse(node: Node) -> str:
     """Given a lib2to3 node, return its string representation."""
     code = str(node)
@@ -879,6 +1251,7 @@ class BracketTracker:
     previous: Optional[Leaf] = None
     _for_loop_variable: int = 0
     _lambda_arguments: int = 0
+    _complex_subscripts: Dict[LeafID, Tuple[LN, bool]] = Factory(dict)
 
     def mark(self, leaf: Leaf) -> None:
         """Mark `leaf` with bracket-related metadata. Keep track of delimiters.
@@ -904,6 +1277,8 @@ class BracketTracker:
             self.depth -= 1
             opening_bracket = self.bracket_match.pop((self.depth, leaf.type))
             leaf.opening_bracket = opening_bracket
+            if leaf.type == token.RSQB:
+                self._complex_subscripts.pop(id(opening_bracket), None)
         leaf.bracket_depth = self.depth
         if self.depth == 0:
             delim = is_split_before_delimiter(leaf, self.previous)
@@ -991,6 +1366,22 @@ class BracketTracker:
         """Return the most recent opening square bracket (if any)."""
         return self.bracket_match.get((self.depth - 1, token.RSQB))
 
+    def is_complex_subscript_part(self, opening_bracket: Leaf, part: LN) -> bool:
+        """Return True iff `part` of the subscript in `opening_bracket` is complex.
+
+        That is, if it contains non-trivial expressions.  The last answer for an
+        opening bracket is kept until it closes.  Leaves arrive in order, so each
+        part of the subscript is only looked at once.
+        """
+        key = id(opening_bracket)
+        cached = self._complex_subscripts.get(key)
+        if cached is not None and cached[0] is part:
+            return cached[1]
+
+        result = any(n.type in TEST_DESCENDANTS for n in part.pre_order())
+        self._complex_subscripts[key] = part, result
+        return result
+
 
 @dataclass
 class Line:
@@ -998,10 +1389,15 @@ class Line:
 
     depth: int = 0
     leaves: List[Leaf] = Factory(list)
-    comments: List[Tuple[Index, Leaf]] = Factory(list)
+    # Inline comments, by the `id()` of the leaf they follow.
+    comments: Dict[LeafID, List[Leaf]] = Factory(dict)
     bracket_tracker: BracketTracker = Factory(BracketTracker)
     inside_brackets: bool = False
     should_explode: bool = False
+    # What `str()` returned last, with the state of the line it is valid for.
+    _rendered: Optional[Tuple[Tuple[int, int], str]] = attrib(
+        default=None, init=False, repr=False, cmp=False
+    )
 
     def append(self, leaf: Leaf, preformatted: bool = False) -> None:
         """Add a new `leaf` to the end of the line.
@@ -1017,6 +1413,7 @@ class Line:
         if not has_value:
             return
 
+        self._rendered = None
         if token.COLON == leaf.type and self.is_class_paren_empty:
             del self.leaves[-2:]
         if self.leaves and not preformatted:
@@ -1205,44 +1602,32 @@ class Line:
         if comment.type != token.COMMENT:
             return False
 
-        after = len(self.leaves) - 1
-        if after == -1:
+        if not self.leaves:
             comment.type = STANDALONE_COMMENT
             comment.prefix = ""
             return False
 
         else:
-            self.comments.append((after, comment))
+            self.comments.setdefault(id(self.leaves[-1]), []).append(comment)
+            self._rendered = None
             return True
 
     def comments_after(self, leaf: Leaf, _index: int = -1) -> Iterator[Leaf]:
         """Generate comments that should appear directly after `leaf`.
 
-        Provide a non-negative leaf `_index` to speed up the function.
+        `_index` is not needed anymore and only accepted for compatibility.
         """
-        if not self.comments:
-            return
-
-        if _index == -1:
-            for _index, _leaf in enumerate(self.leaves):
-                if leaf is _leaf:
-                    break
-
-            else:
-                return
-
-        for index, comment_after in self.comments:
-            if _index == index:
-                yield comment_after
+        return iter(self.comments.get(id(leaf), ()))
 
     def remove_trailing_comma(self) -> None:
         """Remove the trailing comma and moves the comments attached to it."""
-        comma_index = len(self.leaves) - 1
-        for i in range(len(self.comments)):
-            comment_index, comment = self.comments[i]
-            if comment_index == comma_index:
-                self.comments[i] = (comma_index - 1, comment)
-        self.leaves.pop()
+        trailing_comma = self.leaves.pop()
+        trailing_comma_comments = self.comments.pop(id(trailing_comma), [])
+        if trailing_comma_comments:
+            self.comments.setdefault(id(self.leaves[-1]), []).extend(
+                trailing_comma_comments
+            )
+        self._rendered = None
 
     def is_complex_subscript(self, leaf: Leaf) -> bool:
         """Return True iff `leaf` is part of a slice with non-trivial exprs."""
@@ -1258,24 +1643,36 @@ class Line:
 
             if subscript_start.type == syms.subscriptlist:
                 subscript_start = child_towards(subscript_start, leaf)
-        return subscript_start is not None and any(
-            n.type in TEST_DESCENDANTS for n in subscript_start.pre_order()
+        return subscript_start is not None and (
+            self.bracket_tracker.is_complex_subscript_part(open_lsqb, subscript_start)
         )
 
     def __str__(self) -> str:
-        """Render the line."""
+        """Render the line.
+
+        The result is kept until the line changes.  Leaves and comments added or
+        removed by the methods of the line drop it.  So does setting the depth,
+        or the prefix or value of any leaf, see :data:`pytree.leaf_edits`.
+        """
         if not self:
             return "\n"
 
-        indent = "    " * self.depth
-        leaves = iter(self.leaves)
-        first = next(leaves)
-        res = f"{first.prefix}{indent}{first.value}"
-        for leaf in leaves:
-            res += str(leaf)
-        for _, comment in self.comments:
-            res += str(comment)
-        return res + "\n"
+        key = (pytree.leaf_edits, self.depth)
+        if self._rendered is None or self._rendered[0] != key:
+            indent = "    " * self.depth
+            leaves = iter(self.leaves)
+            first = next(leaves)
+            res = [first.prefix, indent, first.value]
+            for leaf in leaves:
+                res.append(leaf.prefix)
+                res.append(leaf.value)
+            for comments in self.comments.values():
+                for comment in comments:
+                    res.append(comment.prefix)
+                    res.append(comment.value)
+            res.append("\n")
+            self._rendered = key, "".join(res)
+        return self._rendered[1]
 
     def __bool__(self) -> bool:
         """Return True if the line has leaves or comments."""
@@ -1584,25 +1981,91 @@ BRACKETS = OPENING_BRACKETS | CLOSING_BRACKETS
 ALWAYS_NO_SPACE = CLOSING_BRACKETS | {token.COMMA, STANDALONE_COMMENT}
 
 
-def whitespace(leaf: Leaf, *, complex_subscript: bool) -> str:  # noqa C901
+# Whitespace before leaves, by the types of the nodes around them that it depends
+# on, see `whitespace()`.
+WHITESPACE_TABLE: Dict[Tuple[Optional[NodeType], ...], str] = {}
+
+
+def whitespace(leaf: Leaf, *, complex_subscript: bool) -> str:
     """Return whitespace prefix if needed for the given `leaf`.
 
     `complex_subscript` signals whether the given leaf is part of a subscription
     which has non-trivial arguments, like arithmetic expressions or function calls.
+
+    Answers are looked up in `WHITESPACE_TABLE` and only worked out by
+    :func:`_whitespace` the first time.  They depend on the types of the leaf,
+    its parent and its previous sibling.  For the first child of a node, they
+    depend on the types of the leaf, its parent and grandparent, the preceding
+    leaf and that leaf's parent instead.  Answers that also depend on other
+    things are worked out every time:
+
+    * the value of names in `from ... import` (the `import` keyword);
+    * the prefix of an `=` in a typed function signature;
+    * the ancestors of a preceding star (see :func:`is_vararg`);
+    * what precedes a preceding `>>` (the Python 2 print chevron).
     """
-    NO = ""
-    SPACE = " "
-    DOUBLESPACE = "  "
     t = leaf.type
-    p = leaf.parent
-    v = leaf.value
     if t in ALWAYS_NO_SPACE:
-        return NO
+        return ""
 
     if t == token.COMMENT:
-        return DOUBLESPACE
+        return "  "
 
+    p = leaf.parent
     assert p is not None, f"INTERNAL ERROR: hand-made leaf without parent: {leaf!r}"
+    key: Optional[Tuple[Optional[NodeType], ...]] = None
+    prevp = None
+    prev = leaf.prev_sibling
+    if p.type == syms.import_from and t == token.NAME:
+        if not prev:
+            prevp = preceding_leaf(p)
+    elif prev:
+        if p.type != syms.typedargslist or prev.type != token.EQUAL:
+            key = (t, p.type, prev.type, complex_subscript)
+    else:
+        prevp = preceding_leaf(p)
+        grandparent_type = p.parent.type if p.parent else None
+        if not prevp:
+            key = (t, p.type, grandparent_type, None, None, complex_subscript)
+        elif prevp.type not in STARS and prevp.type != token.RIGHTSHIFT:
+            prevp_parent_type = prevp.parent.type if prevp.parent else None
+            if prevp.type != token.EQUAL or prevp_parent_type != syms.typedargslist:
+                key = (
+                    t,
+                    p.type,
+                    grandparent_type,
+                    prevp.type,
+                    prevp_parent_type,
+                    complex_subscript,
+                )
+    if key is None:
+        return _whitespace(leaf, p, prev, prevp, complex_subscript=complex_subscript)
+
+    result = WHITESPACE_TABLE.get(key)
+    if result is None:
+        result = _whitespace(leaf, p, prev, prevp, complex_subscript=complex_subscript)
+        WHITESPACE_TABLE[key] = result
+    return result
+
+
+def _whitespace(  # noqa C901
+    leaf: Leaf,
+    p: Node,
+    prev: Optional[LN],
+    prevp: Optional[Leaf],
+    *,
+    complex_subscript: bool,
+) -> str:
+    """Work out the whitespace prefix for `leaf` from its surroundings.
+
+    `p` is the parent of the leaf and `prev` its previous sibling.  If there is
+    none, `prevp` is the leaf that precedes `p`.  Comments and leaves that never
+    get whitespace are handled by :func:`whitespace`.
+    """
+    NO = ""
+    SPACE = " "
+    t = leaf.type
+    v = leaf.value
     if t == token.COLON and p.type not in {
         syms.subscript,
         syms.subscriptlist,
@@ -1610,9 +2073,7 @@ def whitespace(leaf: Leaf, *, complex_subscript: bool) -> str:  # noqa C901
     }:
         return NO
 
-    prev = leaf.prev_sibling
     if not prev:
-        prevp = preceding_leaf(p)
         if not prevp or prevp.type in OPENING_BRACKETS:
             return NO
 
@@ -1700,7 +2161,6 @@ def whitespace(leaf: Leaf, *, complex_subscript: bool) -> str:  # noqa C901
     elif p.type == syms.tname:
         # type names
         if not prev:
-            prevp = preceding_leaf(p)
             if not prevp or prevp.type != token.COMMA:
                 return NO
 
@@ -1711,7 +2171,6 @@ def whitespace(leaf: Leaf, *, complex_subscript: bool) -> str:  # noqa C901
 
         if not prev:
             if t == token.DOT:
-                prevp = preceding_leaf(p)
                 if not prevp or prevp.type != token.NUMBER:
                     return NO
 
@@ -1727,7 +2186,6 @@ def whitespace(leaf: Leaf, *, complex_subscript: bool) -> str:  # noqa C901
             return NO
 
         if not prev:
-            prevp = preceding_leaf(p)
             if not prevp or prevp.type == token.LPAR:
                 return NO
 
@@ -1742,7 +2200,6 @@ def whitespace(leaf: Leaf, *, complex_subscript: bool) -> str:  # noqa C901
         if prev:
             return NO
 
-        prevp = preceding_leaf(p)
         if not prevp or prevp.type == token.AT or prevp.type == token.DOT:
             return NO
 
@@ -1778,7 +2235,6 @@ def whitespace(leaf: Leaf, *, complex_subscript: bool) -> str:  # noqa C901
     elif p.type in {syms.factor, syms.star_expr}:
         # unary ops
         if not prev:
-            prevp = preceding_leaf(p)
             if not prevp or prevp.type in OPENING_BRACKETS:
                 return NO
 
@@ -1822,20 +2278,35 @@ def preceding_leaf(node: Optional[LN]) -> Optional[Leaf]:
             if isinstance(res, Leaf):
                 return res
 
-            try:
-                return list(res.leaves())[-1]
-
-            except IndexError:
-                return None
+            return last_leaf_of(res)
 
         node = node.parent
     return None
 
 
+def first_leaf_of(node: LN) -> Leaf:
+    """Return the first leaf of `node`, which may be `node` itself."""
+    while isinstance(node, Node):
+        node = node.children[0]
+    return node
+
+
+def last_leaf_of(node: LN) -> Optional[Leaf]:
+    """Return the last leaf of `node`, which may be `node` itself, if any."""
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, Leaf):
+            return node
+
+        stack.extend(node.children)
+    return None
+
+
 def child_towards(ancestor: Node, descendant: LN) -> Optional[LN]:
     """Return the child of `ancestor` that contains `descendant`."""
     node: Optional[LN] = descendant
-    while node and node.parent != ancestor:
+    while node and node.parent is not ancestor:
         node = node.parent
     return node
 
@@ -1993,7 +2464,7 @@ def generate_comments(leaf: LN) -> Iterator[Leaf]:
     Inline comments are emitted as regular token.COMMENT leaves.  Standalone
     are emitted with a fake STANDALONE_COMMENT token identifier.
     """
-    for pc in list_comments(leaf.prefix, is_endmarker=leaf.type == token.ENDMARKER):
+    for pc in prefix_comments(leaf, is_endmarker=leaf.type == token.ENDMARKER):
         yield Leaf(pc.type, pc.value, prefix="\n" * pc.newlines)
 
 
@@ -2035,6 +2506,45 @@ def list_comments(prefix: str, *, is_endmarker: bool) -> List[ProtoComment]:
     return result
 
 
+def prefix_comments(node: LN, *, is_endmarker: bool) -> List[ProtoComment]:
+    """Return the comments in the prefix of `node`, like :func:`list_comments`.
+
+    The parser records where the tokenizer found comments on every leaf, so
+    unless the prefix was changed since, there's no need to scan it line by line.
+    """
+    leaf = node
+    while isinstance(leaf, Node):
+        if not leaf.children:
+            return []
+
+        leaf = leaf.children[0]
+    if leaf.comments is None:
+        return list_comments(leaf.prefix, is_endmarker=is_endmarker)
+
+    result: List[ProtoComment] = []
+    prefix = leaf.prefix
+    consumed = 0
+    for start, end in leaf.comments:
+        nlines = prefix.count("\n", consumed, start)
+        if consumed == 0 and nlines == 0 and not is_endmarker:
+            comment_type = token.COMMENT  # simple trailing comment
+        else:
+            comment_type = STANDALONE_COMMENT
+        # All lines before the comment are empty, save for backslash continuations.
+        nlines -= prefix.count("\\\n", consumed, start)
+        nlines -= prefix.count("\\\r\n", consumed, start)
+        consumed = prefix.find("\n", end) + 1 or len(prefix) + 1
+        result.append(
+            ProtoComment(
+                type=comment_type,
+                value=make_comment(prefix[start:end]),
+                newlines=nlines,
+                consumed=consumed,
+            )
+        )
+    return result
+
+
 def make_comment(content: str) -> str:
     """Return a consistently formatted comment from the given `content` string.
 
@@ -2339,10 +2849,10 @@ def delimiter_split(line: Line, py36: bool = False) -> Iterator[Line]:
             current_line = Line(depth=line.depth, inside_brackets=line.inside_brackets)
             current_line.append(leaf)
 
-    for index, leaf in enumerate(line.leaves):
+    for leaf in line.leaves:
         yield from append_to_line(leaf)
 
-        for comment_after in line.comments_after(leaf, index):
+        for comment_after in line.comments_after(leaf):
             yield from append_to_line(comment_after)
 
         lowest_depth = min(lowest_depth, leaf.bracket_depth)
@@ -2385,10 +2895,10 @@ def standalone_comment_split(line: Line, py36: bool = False) -> Iterator[Line]:
             current_line = Line(depth=line.depth, inside_brackets=line.inside_brackets)
             current_line.append(leaf)
 
-    for index, leaf in enumerate(line.leaves):
+    for leaf in line.leaves:
         yield from append_to_line(leaf)
 
-        for comment_after in line.comments_after(leaf, index):
+        for comment_after in line.comments_after(leaf):
             yield from append_to_line(comment_after)
 
     if current_line:
@@ -2576,7 +3086,7 @@ def normalize_invisible_parens(node: Node, parens_after: Set[str]) -> None:
     Standardizes on visible parentheses for single-element tuples, and keeps
     existing visible parentheses for other tuples and generator expressions.
     """
-    for pc in list_comments(node.prefix, is_endmarker=False):
+    for pc in prefix_comments(node, is_endmarker=False):
         if pc.value in FMT_OFF:
             # This `node` has a prefix with `# fmt: off`, don't mess with parens.
             return
@@ -2629,7 +3139,7 @@ def convert_one_fmt_off_pair(node: Node) -> bool:
     """
     for leaf in node.leaves():
         previous_consumed = 0
-        for comment in list_comments(leaf.prefix, is_endmarker=False):
+        for comment in prefix_comments(leaf, is_endmarker=False):
             if comment.value in FMT_OFF:
                 # We only want standalone comments. If there's no previous leaf or
                 # the previous leaf is indentation, it's a standalone comment in
@@ -2683,7 +3193,7 @@ def generate_ignored_nodes(leaf: Leaf) -> Iterator[LN]:
     """
     container: Optional[LN] = container_of(leaf)
     while container is not None and container.type != token.ENDMARKER:
-        for comment in list_comments(container.prefix, is_endmarker=False):
+        for comment in prefix_comments(container, is_endmarker=False):
             if comment.value in FMT_ON:
                 return
 
@@ -3278,15 +3788,17 @@ def diff(a: str, b: str, a_name: str, b_name: str) -> str:
     )
 
 
-def cancel(tasks: Iterable[asyncio.Task]) -> None:
+def cancel(tasks: Iterable["asyncio.Task"]) -> None:
     """asyncio signal handler that cancels all `tasks` and reports to stderr."""
     err("Aborted!")
     for task in tasks:
         task.cancel()
 
 
-def shutdown(loop: BaseEventLoop) -> None:
+def shutdown(loop: "BaseEventLoop") -> None:
     """Cancel all pending tasks on `loop`, wait for them, and close the loop."""
+    import asyncio
+
     try:
         # This part is borrowed from asyncio/runners.py in Python 3.7b2.
         to_cancel = [task for task in asyncio.Task.all_tasks(loop) if not task.done()]
@@ -3351,7 +3863,7 @@ def enumerate_with_length(
             return  # Multiline strings, we can't continue.
 
         comment: Optional[Leaf]
-        for comment in line.comments_after(leaf, index):
+        for comment in line.comments_after(leaf):
             length += len(comment.value)
 
         yield index, leaf, length
@@ -3555,6 +4067,68 @@ def write_cache(
         pass
 
 
+def get_grammar_cache_file() -> Path:
+    return CACHE_DIR / "grammars.pickle"
+
+
+def read_grammar_cache() -> GrammarCache:
+    """Read the cache of grammars known to parse files if it is well formed.
+
+    Unlike the formatting cache, it doesn't depend on line length or mode.
+    """
+    cache_file = get_grammar_cache_file()
+    if not cache_file.exists():
+        return {}
+
+    with cache_file.open("rb") as fobj:
+        try:
+            cache: GrammarCache = pickle.load(fobj)
+        except pickle.UnpicklingError:
+            return {}
+
+    return cache
+
+
+def get_grammar_hint(cache: GrammarCache, src: Path) -> GrammarIndex:
+    """Return the index in `GRAMMARS` that parsed `src`, unless it changed since.
+
+    Files that are not in the cache get 0, the first grammar to try by default.
+    """
+    src = src.resolve()
+    if src not in cache:
+        return 0
+
+    info, grammar_index = cache[src]
+    if info != get_cache_info(src):
+        return 0
+
+    return grammar_index
+
+
+def write_grammar_cache(
+    cache: GrammarCache, grammars: Dict[Path, GrammarIndex]
+) -> None:
+    """Update the grammar cache file with the grammars that parsed `grammars`.
+
+    Entries for files parsed by the first grammar are dropped, that's the default.
+    """
+    cache_file = get_grammar_cache_file()
+    try:
+        if not CACHE_DIR.exists():
+            CACHE_DIR.mkdir(parents=True)
+        new_cache = dict(cache)
+        for src, grammar_index in grammars.items():
+            src = src.resolve()
+            if grammar_index:
+                new_cache[src] = get_cache_info(src), grammar_index
+            else:
+                new_cache.pop(src, None)
+        with cache_file.open("wb") as fobj:
+            pickle.dump(new_cache, fobj, protocol=pickle.HIGHEST_PROTOCOL)
+    except OSError:
+        pass
+
+
 def patch_click() -> None:
     """Make Click not crash.
 
@@ -0,0 +1,1911 @@
+# Generated by blib2to3/pgen2/driver.py from the grammar file, do not edit.
+# Regenerate with: python -m blib2to3.pgen2.driver blib2to3/*Grammar.txt
+
+SOURCE_HASH = '2dbb4f0f514c28fa59f594579e0ba0e8f382b6d94c0302607780d884f9320354'
+TABLES = {'dfas': {256: ([[(1, 1), (2, 0), (3, 0)], [(0, 1)]],
+                {1: 1,
+                 2: 1,
+                 4: 1,
+                 5: 1,
+                 6: 1,
+                 7: 1,
+                 8: 1,
+                 9: 1,
+                 10: 1,
+                 11: 1,
+                 12: 1,
+                 13: 1,
+                 14: 1,
+                 15: 1,
+                 16: 1,
+                 17: 1,
+                 18: 1,
+                 19: 1,
+                 20: 1,
+                 21: 1,
+                 22: 1,
+                 23: 1,
+                 24: 1,
+                 25: 1,
+                 26: 1,
+                 27: 1,
+                 28: 1,
+                 29: 1,
+                 30: 1,
+                 31: 1,
+                 32: 1,
+                 33: 1,
+                 34: 1,
+                 35: 1,
+                 36: 1,
+                 37: 1,
+                 38: 1,
+                 39: 1,
+                 40: 1,
+                 41: 1}),
+          257: ([[(42, 1)], [(43, 0), (0, 1)]],
+                {4: 1,
+                 6: 1,
+                 7: 1,
+                 8: 1,
+                 10: 1,
+                 11: 1,
+                 35: 1,
+                 36: 1,
+                 38: 1,
+                 39: 1,
+                 40: 1,
+                 41: 1}),
+          258: ([[(44, 1)], [(45, 0), (0, 1)]],
+                {4: 1,
+                 6: 1,
+                 7: 1,
+                 8: 1,
+                 10: 1,
+                 11: 1,
+                 26: 1,
+                 35: 1,
+                 36: 1,
+                 38: 1,
+                 39: 1,
+                 40: 1,
+                 41: 1}),
+          259: ([[(46, 1)], [(47, 2)], [(48, 3), (0, 2)], [(47, 4)], [(0, 4)]],
+                {46: 1}),
+          260: ([[(49, 1)], [(50, 2), (0, 1)], [(49, 1), (0, 2)]],
+                {4: 1,
+                 5: 1,
+                 6: 1,
+                 7: 1,
+                 8: 1,
+                 10: 1,
+                 11: 1,
+                 24: 1,
+                 26: 1,
+                 35: 1,
+                 36: 1,
+                 38: 1,
+                 39: 1,
+                 40: 1,
+                 41: 1,
+                 51: 1}),
+          261: ([[(5, 1), (51, 1), (47, 2)],
+                 [(47, 3)],
+                 [(48, 1), (52, 3), (0, 2)],
+                 [(0, 3)]],
+                {4: 1,
+                 5: 1,
+                 6: 1,
+                 7: 1,
+                 8: 1,
+                 10: 1,
+                 11: 1,
+                 24: 1,
+                 26: 1,
+                 35: 1,
+                 36: 1,
+                 38: 1,
+                 39: 1,
+                 40: 1,
+                 41: 1,
+                 51: 1}),
+          262: ([[(53, 1)], [(6, 0), (7, 0), (0, 1)]],
+                {4: 1,
+                 6: 1,
+                 7: 1,
+                 8: 1,
+                 10: 1,
+                 11: 1,
+                 35: 1,
+                 36: 1,
+                 38: 1,
+                 39: 1,
+                 40: 1,
+                 41: 1}),
+          263: ([[(12, 1)], [(47, 2)], [(50, 3), (0, 2)], [(47, 4)], [(0, 4)]],
+                {12: 1}),
+          264: ([[(37, 1)], [(54, 2)], [(0, 2)]], {37: 1}),
+          265: ([[(37, 1)], [(55, 2), (54, 2), (56, 2)], [(0, 2)]], {37: 1}),
+          266: ([[(4, 1),
+                  (8, 2),
+                  (10, 3),
+                  (11, 4),
+                  (35, 5),
+                  (39, 6),
+                  (40, 6),
+                  (41, 7)],
+                 [(57, 6), (58, 8), (59, 8)],
+                 [(8, 9)],
+                 [(60, 6), (61, 10)],
+                 [(62, 11)],
+                 [(63, 6), (64, 12)],
+                 [(0, 6)],
+                 [(41, 7), (0, 7)],
+                 [(57, 6)],
+                 [(8, 6)],
+                 [(60, 6)],
+                 [(11, 6)],
+                 [(63, 6)]],
+                {4: 1, 8: 1, 10: 1, 11: 1, 35: 1, 39: 1, 40: 1, 41: 1}),
+          267: ([[(65, 1),
+                  (66, 1),
+                  (67, 1),
+                  (68, 1),
+                  (69, 1),
+                  (70, 1),
+                  (71, 1),
+                  (72, 1),
+                  (73, 1),
+                  (74, 1),
+                  (75, 1),
+                  (76, 1),
+                  (77, 1)],
+                 [(0, 1)]],
+                {65: 1,
+                 66: 1,
+                 67: 1,
+                 68: 1,
+                 69: 1,
+                 70: 1,
+                 71: 1,
+                 72: 1,
+                 73: 1,
+                 74: 1,
+                 75: 1,
+                 76: 1,
+                 77: 1}),
+          268: ([[(13, 1)], [(0, 1)]], {13: 1}),
+          269: ([[(14, 1)],
+                 [(39, 2)],
+                 [(4, 3), (46, 4)],
+                 [(57, 5), (78, 6)],
+                 [(79, 7)],
+                 [(46, 4)],
+                 [(57, 5)],
+                 [(0, 7)]],
+                {14: 1}),
+          270: ([[(19, 1), (37, 2)],
+                 [(80, 3)],
+                 [(19, 1)],
+                 [(81, 4)],
+                 [(82, 5)],
+                 [(83, 6), (0, 5)],
+                 [(0, 6)]],
+                {19: 1, 37: 1}),
+          271: ([[(22, 1)], [(84, 2)], [(83, 3), (0, 2)], [(0, 3)]], {22: 1}),
+          272: ([[(52, 1), (85, 1)], [(0, 1)]], {19: 1, 22: 1, 37: 1}),
+          273: ([[(86, 1),
+                  (87, 1),
+                  (88, 1),
+                  (86, 1),
+                  (89, 1),
+                  (90, 1),
+                  (91, 1),
+                  (81, 1),
+                  (92, 2),
+                  (26, 3)],
+                 [(0, 1)],
+                 [(26, 1), (0, 2)],
+                 [(81, 1)]],
+                {26: 1,
+                 81: 1,
+                 86: 1,
+                 87: 1,
+                 88: 1,
+                 89: 1,
+                 90: 1,
+                 91: 1,
+                 92: 1}),
+          274: ([[(93, 1)], [(94, 0), (0, 1)]],
+                {4: 1,
+                 6: 1,
+                 7: 1,
+                 8: 1,
+                 10: 1,
+                 11: 1,
+                 35: 1,
+                 36: 1,
+                 38: 1,
+                 39: 1,
+                 40: 1,
+                 41: 1}),
+          275: ([[(95, 1),
+                  (96, 1),
+                  (97, 1),
+                  (55, 1),
+                  (54, 1),
+                  (98, 1),
+                  (99, 1),
+                  (100, 1),
+                  (56, 1)],
+                 [(0, 1)]],
+                {9: 1, 14: 1, 16: 1, 19: 1, 22: 1, 31: 1, 32: 1, 33: 1, 37: 1}),
+          276: ([[(15, 1)], [(0, 1)]], {15: 1}),
+          277: ([[(101, 1)], [(102, 2), (96, 2), (54, 2)], [(0, 2)]], {9: 1}),
+          278: ([[(9, 1)],
+                 [(103, 2)],
+                 [(4, 3), (2, 4)],
+                 [(57, 5), (78, 6)],
+                 [(0, 4)],
+                 [(2, 4)],
+                 [(57, 5)]],
+                {9: 1}),
+          279: ([[(104, 1)], [(104, 1), (0, 1)]], {9: 1}),
+          280: ([[(17, 1)], [(80, 2)], [(0, 2)]], {17: 1}),
+          281: ([[(51, 1), (105, 2), (47, 3)],
+                 [(93, 4)],
+                 [(50, 5), (52, 6), (0, 2)],
+                 [(50, 5), (46, 7), (52, 6), (0, 3)],
+                 [(50, 8), (52, 6), (0, 4)],
+                 [(105, 9), (47, 9), (0, 5)],
+                 [(0, 6)],
+                 [(47, 4)],
+                 [(51, 10), (47, 11), (0, 8)],
+                 [(50, 5), (0, 9)],
+                 [(93, 12)],
+                 [(46, 13)],
+                 [(50, 8), (0, 12)],
+                 [(47, 12)]],
+                {4: 1,
+                 5: 1,
+                 6: 1,
+                 7: 1,
+                 8: 1,
+                 10: 1,
+                 11: 1,
+                 24: 1,
+                 26: 1,
+                 35: 1,
+                 36: 1,
+                 38: 1,
+                 39: 1,
+                 40: 1,
+                 41: 1,
+                 51: 1}),
+          282: ([[(103, 1)], [(106, 2), (0, 1)], [(39, 3)], [(0, 3)]], {39: 1}),
+          283: ([[(107, 1)], [(50, 0), (0, 1)]], {39: 1}),
+          284: ([[(39, 1)], [(8, 0), (0, 1)]], {39: 1}),
+          285: ([[(39, 1)], [(0, 1)]], {39: 1}),
+          286: ([[(108, 1)], [(1, 2), (2, 1)], [(0, 2)]],
+                {4: 1,
+                 6: 1,
+                 7: 1,
+                 8: 1,
+                 10: 1,
+                 11: 1,
+                 24: 1,
+                 26: 1,
+                 35: 1,
+                 36: 1,
+                 38: 1,
+                 39: 1,
+                 40: 1,
+                 41: 1}),
+          287: ([[(109, 1)],
+                 [(47, 2), (0, 1)],
+                 [(50, 3), (106, 3), (0, 2)],
+                 [(47, 4)],
+                 [(0, 4)]],
+                {109: 1}),
+          288: ([[(18, 1)],
+                 [(93, 2)],
+                 [(81, 3), (0, 2)],
+                 [(47, 4)],
+                 [(50, 5), (0, 4)],
+                 [(47, 6)],
+                 [(0, 6)]],
+                {18: 1}),
+          289: ([[(110, 1)], [(111, 0), (0, 1)]],
+                {4: 1,
+                 6: 1,
+                 7: 1,
+                 8: 1,
+                 10: 1,
+                 11: 1,
+                 35: 1,
+                 36: 1,
+                 38: 1,
+                 39: 1,
+                 40: 1,
+                 41: 1}),
+          290: ([[(112, 1)],
+                 [(48, 2), (113, 3), (114, 4), (0, 1)],
+                 [(112, 5), (59, 5)],
+                 [(0, 3)],
+                 [(108, 3), (59, 3)],
+                 [(48, 2), (0, 5)]],
+                {4: 1,
+                 5: 1,
+                 6: 1,
+                 7: 1,
+                 8: 1,
+                 10: 1,
+                 11: 1,
+                 24: 1,
+                 26: 1,
+                 35: 1,
+                 36: 1,
+                 38: 1,
+                 39: 1,
+                 40: 1,
+                 41: 1}),
+          291: ([[(93, 1), (105, 1)],
+                 [(50, 2), (0, 1)],
+                 [(93, 1), (105, 1), (0, 2)]],
+                {4: 1,
+                 5: 1,
+                 6: 1,
+                 7: 1,
+                 8: 1,
+                 10: 1,
+                 11: 1,
+                 35: 1,
+                 36: 1,
+                 38: 1,
+                 39: 1,
+                 40: 1,
+                 41: 1}),
+          292: ([[(6, 1), (7, 1), (36, 1), (115, 2)], [(116, 2)], [(0, 2)]],
+                {4: 1,
+                 6: 1,
+                 7: 1,
+                 8: 1,
+                 10: 1,
+                 11: 1,
+                 35: 1,
+                 36: 1,
+                 38: 1,
+                 39: 1,
+                 40: 1,
+                 41: 1}),
+          293: ([[(117, 1), (118, 1), (119, 1), (120, 1), (121, 1)], [(0, 1)]],
+                {13: 1, 15: 1, 29: 1, 30: 1, 34: 1}),
+          294: ([[(19, 1)],
+                 [(80, 2)],
+                 [(81, 3)],
+                 [(108, 4)],
+                 [(46, 5)],
+                 [(79, 6)],
+                 [(122, 7), (0, 6)],
+                 [(46, 8)],
+                 [(79, 9)],
+                 [(0, 9)]],
+                {19: 1}),
+          295: ([[(16, 1)],
+                 [(39, 2)],
+                 [(123, 3)],
+                 [(124, 4), (46, 5)],
+                 [(47, 6)],
+                 [(79, 7)],
+                 [(46, 5)],
+                 [(0, 7)]],
+                {16: 1}),
+          296: ([[(21, 1), (25, 1)], [(39, 2)], [(50, 1), (0, 2)]],
+                {21: 1, 25: 1}),
+          297: ([[(22, 1)],
+                 [(47, 2)],
+                 [(46, 3)],
+                 [(79, 4)],
+                 [(125, 1), (122, 5), (0, 4)],
+                 [(46, 6)],
+                 [(79, 7)],
+                 [(0, 7)]],
+                {22: 1}),
+          298: ([[(39, 1)], [(106, 2), (0, 1)], [(39, 3)], [(0, 3)]], {39: 1}),
+          299: ([[(126, 1)], [(50, 2), (0, 1)], [(126, 1), (0, 2)]], {39: 1}),
+          300: ([[(20, 1)],
+                 [(8, 2), (103, 3)],
+                 [(8, 2), (23, 4), (103, 3)],
+                 [(23, 4)],
+                 [(4, 5), (5, 6), (127, 6)],
+                 [(127, 7)],
+                 [(0, 6)],
+                 [(57, 6)]],
+                {20: 1}),
+          301: ([[(23, 1)], [(128, 2)], [(0, 2)]], {23: 1}),
+          302: ([[(129, 1), (130, 1)], [(0, 1)]], {20: 1, 23: 1}),
+          303: ([[(24, 1)],
+                 [(46, 2), (131, 3)],
+                 [(47, 4)],
+                 [(46, 2)],
+                 [(0, 4)]],
+                {24: 1}),
+          304: ([[(105, 1), (47, 1)],
+                 [(50, 2), (132, 3), (0, 1)],
+                 [(105, 4), (47, 4), (0, 2)],
+                 [(0, 3)],
+                 [(50, 2), (0, 4)]],
+                {4: 1,
+                 5: 1,
+                 6: 1,
+                 7: 1,
+                 8: 1,
+                 10: 1,
+                 11: 1,
+                 24: 1,
+                 26: 1,
+                 35: 1,
+                 36: 1,
+                 38: 1,
+                 39: 1,
+                 40: 1,
+                 41: 1}),
+          305: ([[(26, 1), (133, 2)], [(44, 2)], [(0, 2)]],
+                {4: 1,
+                 6: 1,
+                 7: 1,
+                 8: 1,
+                 10: 1,
+                 11: 1,
+                 26: 1,
+                 35: 1,
+                 36: 1,
+                 38: 1,
+                 39: 1,
+                 40: 1,
+                 41: 1}),
+          306: ([[(19, 1), (37, 2)],
+                 [(80, 3)],
+                 [(19, 1)],
+                 [(81, 4)],
+                 [(134, 5)],
+                 [(135, 6), (0, 5)],
+                 [(0, 6)]],
+                {19: 1, 37: 1}),
+          307: ([[(22, 1)], [(84, 2)], [(135, 3), (0, 2)], [(0, 3)]], {22: 1}),
+          308: ([[(132, 1), (136, 1)], [(0, 1)]], {19: 1, 22: 1, 37: 1}),
+          309: ([[(24, 1)],
+                 [(46, 2), (131, 3)],
+                 [(84, 4)],
+                 [(46, 2)],
+                 [(0, 4)]],
+                {24: 1}),
+          310: ([[(137, 1), (82, 1)], [(0, 1)]],
+                {4: 1,
+                 6: 1,
+                 7: 1,
+                 8: 1,
+                 10: 1,
+                 11: 1,
+                 24: 1,
+                 26: 1,
+                 35: 1,
+                 36: 1,
+                 38: 1,
+                 39: 1,
+                 40: 1,
+                 41: 1}),
+          311: ([[(138, 1)], [(139, 0), (0, 1)]],
+                {4: 1,
+                 6: 1,
+                 7: 1,
+                 8: 1,
+                 10: 1,
+                 11: 1,
+                 26: 1,
+                 35: 1,
+                 36: 1,
+                 38: 1,
+                 39: 1,
+                 40: 1,
+                 41: 1}),
+          312: ([[(4, 1)], [(57, 2), (140, 3)], [(0, 2)], [(57, 2)]], {4: 1}),
+          313: ([[(27, 1)], [(0, 1)]], {27: 1}),
+          314: ([[(38, 1), (141, 2)],
+                 [(141, 2)],
+                 [(51, 3), (142, 2), (0, 2)],
+                 [(116, 4)],
+                 [(0, 4)]],
+                {4: 1, 8: 1, 10: 1, 11: 1, 35: 1, 38: 1, 39: 1, 40: 1, 41: 1}),
+          315: ([[(28, 1)],
+                 [(143, 2), (47, 3), (0, 1)],
+                 [(47, 4)],
+                 [(50, 5), (0, 3)],
+                 [(50, 6), (0, 4)],
+                 [(47, 3), (0, 5)],
+                 [(47, 7)],
+                 [(50, 8), (0, 7)],
+                 [(47, 7), (0, 8)]],
+                {28: 1}),
+          316: ([[(29, 1)],
+                 [(47, 2), (0, 1)],
+                 [(50, 3), (20, 4), (0, 2)],
+                 [(47, 5)],
+                 [(47, 6)],
+                 [(50, 4), (0, 5)],
+                 [(0, 6)]],
+                {29: 1}),
+          317: ([[(30, 1)], [(108, 2), (0, 1)], [(0, 2)]], {30: 1}),
+          318: ([[(144, 1)], [(145, 0), (143, 0), (0, 1)]],
+                {4: 1,
+                 6: 1,
+                 7: 1,
+                 8: 1,
+                 10: 1,
+                 11: 1,
+                 35: 1,
+                 36: 1,
+                 38: 1,
+                 39: 1,
+                 40: 1,
+                 41: 1}),
+          319: ([[(146, 1)], [(147, 2), (2, 3)], [(2, 3), (146, 1)], [(0, 3)]],
+                {4: 1,
+                 5: 1,
+                 6: 1,
+                 7: 1,
+                 8: 1,
+                 10: 1,
+                 11: 1,
+                 12: 1,
+                 13: 1,
+                 15: 1,
+                 17: 1,
+                 18: 1,
+                 20: 1,
+                 21: 1,
+                 23: 1,
+                 24: 1,
+                 25: 1,
+                 26: 1,
+                 27: 1,
+                 28: 1,
+                 29: 1,
+                 30: 1,
+                 34: 1,
+                 35: 1,
+                 36: 1,
+                 38: 1,
+                 39: 1,
+                 40: 1,
+                 41: 1}),
+          320: ([[(2, 1), (148, 2), (149, 1)], [(0, 1)], [(2, 1)]],
+                {2: 1,
+                 4: 1,
+                 5: 1,
+                 6: 1,
+                 7: 1,
+                 8: 1,
+                 9: 1,
+                 10: 1,
+                 11: 1,
+                 12: 1,
+                 13: 1,
+                 14: 1,
+                 15: 1,
+                 16: 1,
+                 17: 1,
+                 18: 1,
+                 19: 1,
+                 20: 1,
+                 21: 1,
+                 22: 1,
+                 23: 1,
+                 24: 1,
+                 25: 1,
+                 26: 1,
+                 27: 1,
+                 28: 1,
+                 29: 1,
+                 30: 1,
+                 31: 1,
+                 32: 1,
+                 33: 1,
+                 34: 1,
+                 35: 1,
+                 36: 1,
+                 37: 1,
+                 38: 1,
+                 39: 1,
+                 40: 1,
+                 41: 1}),
+          321: ([[(46, 1)], [(47, 2), (0, 1)], [(0, 2)]], {46: 1}),
+          322: ([[(150, 1),
+                  (151, 1),
+                  (152, 1),
+                  (153, 1),
+                  (154, 1),
+                  (155, 1),
+                  (156, 1),
+                  (157, 1),
+                  (158, 1)],
+                 [(0, 1)]],
+                {4: 1,
+                 5: 1,
+                 6: 1,
+                 7: 1,
+                 8: 1,
+                 10: 1,
+                 11: 1,
+                 12: 1,
+                 13: 1,
+                 15: 1,
+                 17: 1,
+                 18: 1,
+                 20: 1,
+                 21: 1,
+                 23: 1,
+                 24: 1,
+                 25: 1,
+                 26: 1,
+                 27: 1,
+                 28: 1,
+                 29: 1,
+                 30: 1,
+                 34: 1,
+                 35: 1,
+                 36: 1,
+                 38: 1,
+                 39: 1,
+                 40: 1,
+                 41: 1}),
+          323: ([[(5, 1)], [(93, 2)], [(0, 2)]], {5: 1}),
+          324: ([[(148, 1), (149, 1)], [(0, 1)]],
+                {4: 1,
+                 5: 1,
+                 6: 1,
+                 7: 1,
+                 8: 1,
+                 9: 1,
+                 10: 1,
+                 11: 1,
+                 12: 1,
+                 13: 1,
+                 14: 1,
+                 15: 1,
+                 16: 1,
+                 17: 1,
+                 18: 1,
+                 19: 1,
+                 20: 1,
+                 21: 1,
+                 22: 1,
+                 23: 1,
+                 24: 1,
+                 25: 1,
+                 26: 1,
+                 27: 1,
+                 28: 1,
+                 29: 1,
+                 30: 1,
+                 31: 1,
+                 32: 1,
+                 33: 1,
+                 34: 1,
+                 35: 1,
+                 36: 1,
+                 37: 1,
+                 38: 1,
+                 39: 1,
+                 40: 1,
+                 41: 1}),
+          325: ([[(46, 1), (47, 2)],
+                 [(159, 3), (47, 4), (0, 1)],
+                 [(46, 1), (0, 2)],
+                 [(0, 3)],
+                 [(159, 3), (0, 4)]],
+                {4: 1,
+                 6: 1,
+                 7: 1,
+                 8: 1,
+                 10: 1,
+                 11: 1,
+                 24: 1,
+                 26: 1,
+                 35: 1,
+                 36: 1,
+                 38: 1,
+                 39: 1,
+                 40: 1,
+                 41: 1,
+                 46: 1}),
+          326: ([[(160, 1)], [(50, 2), (0, 1)], [(160, 1), (0, 2)]],
+                {4: 1,
+                 6: 1,
+                 7: 1,
+                 8: 1,
+                 10: 1,
+                 11: 1,
+                 24: 1,
+                 26: 1,
+                 35: 1,
+                 36: 1,
+                 38: 1,
+                 39: 1,
+                 40: 1,
+                 41: 1,
+                 46: 1}),
+          327: ([[(2, 1), (149, 2)],
+                 [(161, 3)],
+                 [(0, 2)],
+                 [(3, 4)],
+                 [(162, 2), (3, 4)]],
+                {2: 1,
+                 4: 1,
+                 5: 1,
+                 6: 1,
+                 7: 1,
+                 8: 1,
+                 10: 1,
+                 11: 1,
+                 12: 1,
+                 13: 1,
+                 15: 1,
+                 17: 1,
+                 18: 1,
+                 20: 1,
+                 21: 1,
+                 23: 1,
+                 24: 1,
+                 25: 1,
+                 26: 1,
+                 27: 1,
+                 28: 1,
+                 29: 1,
+                 30: 1,
+                 34: 1,
+                 35: 1,
+                 36: 1,
+                 38: 1,
+                 39: 1,
+                 40: 1,
+                 41: 1}),
+          328: ([[(116, 1)],
+                 [(163, 0), (5, 0), (164, 0), (165, 0), (9, 0), (0, 1)]],
+                {4: 1,
+                 6: 1,
+                 7: 1,
+                 8: 1,
+                 10: 1,
+                 11: 1,
+                 35: 1,
+                 36: 1,
+                 38: 1,
+                 39: 1,
+                 40: 1,
+                 41: 1}),
+          329: ([[(166, 1), (82, 2)],
+                 [(0, 1)],
+                 [(22, 3), (0, 2)],
+                 [(82, 4)],
+                 [(122, 5)],
+                 [(47, 1)]],
+                {4: 1,
+                 6: 1,
+                 7: 1,
+                 8: 1,
+                 10: 1,
+                 11: 1,
+                 24: 1,
+                 26: 1,
+                 35: 1,
+                 36: 1,
+                 38: 1,
+                 39: 1,
+                 40: 1,
+                 41: 1}),
+          330: ([[(47, 1)], [(50, 2), (0, 1)], [(47, 1), (0, 2)]],
+                {4: 1,
+                 6: 1,
+                 7: 1,
+                 8: 1,
+                 10: 1,
+                 11: 1,
+                 24: 1,
+                 26: 1,
+                 35: 1,
+                 36: 1,
+                 38: 1,
+                 39: 1,
+                 40: 1,
+                 41: 1}),
+          331: ([[(47, 1)], [(50, 0), (0, 1)]],
+                {4: 1,
+                 6: 1,
+                 7: 1,
+                 8: 1,
+                 10: 1,
+                 11: 1,
+                 24: 1,
+                 26: 1,
+                 35: 1,
+                 36: 1,
+                 38: 1,
+                 39: 1,
+                 40: 1,
+                 41: 1}),
+          332: ([[(105, 1), (47, 1)],
+                 [(50, 2), (132, 3), (0, 1)],
+                 [(105, 4), (47, 4), (0, 2)],
+                 [(0, 3)],
+                 [(50, 2), (0, 4)]],
+                {4: 1,
+                 5: 1,
+                 6: 1,
+                 7: 1,
+                 8: 1,
+                 10: 1,
+                 11: 1,
+                 24: 1,
+                 26: 1,
+                 35: 1,
+                 36: 1,
+                 38: 1,
+                 39: 1,
+                 40: 1,
+                 41: 1}),
+          333: ([[(84, 1)],
+                 [(50, 2), (0, 1)],
+                 [(84, 3)],
+                 [(50, 4), (0, 3)],
+                 [(84, 3), (0, 4)]],
+                {4: 1,
+                 6: 1,
+                 7: 1,
+                 8: 1,
+                 10: 1,
+                 11: 1,
+                 24: 1,
+                 26: 1,
+                 35: 1,
+                 36: 1,
+                 38: 1,
+                 39: 1,
+                 40: 1,
+                 41: 1}),
+          334: ([[(105, 1), (47, 1)],
+                 [(50, 2), (0, 1)],
+                 [(105, 1), (47, 1), (0, 2)]],
+                {4: 1,
+                 5: 1,
+                 6: 1,
+                 7: 1,
+                 8: 1,
+                 10: 1,
+                 11: 1,
+                 24: 1,
+                 26: 1,
+                 35: 1,
+                 36: 1,
+                 38: 1,
+                 39: 1,
+                 40: 1,
+                 41: 1}),
+          335: ([[(4, 1), (167, 2)], [(168, 3)], [(0, 2)], [(57, 2)]],
+                {4: 1, 39: 1}),
+          336: ([[(169, 1)], [(50, 2), (0, 1)], [(169, 1), (0, 2)]],
+                {4: 1, 39: 1}),
+          337: ([[(39, 1)], [(46, 2), (0, 1)], [(47, 3)], [(0, 3)]], {39: 1}),
+          338: ([[(4, 1), (8, 2), (10, 3)],
+                 [(57, 4), (78, 5)],
+                 [(39, 4)],
+                 [(170, 6)],
+                 [(0, 4)],
+                 [(57, 4)],
+                 [(60, 4)]],
+                {4: 1, 8: 1, 10: 1}),
+          339: ([[(31, 1)],
+                 [(46, 2)],
+                 [(79, 3)],
+                 [(171, 4), (172, 5)],
+                 [(46, 6)],
+                 [(46, 7)],
+                 [(79, 8)],
+                 [(79, 9)],
+                 [(0, 8)],
+                 [(122, 10), (171, 4), (172, 5), (0, 9)],
+                 [(46, 11)],
+                 [(79, 12)],
+                 [(171, 4), (0, 12)]],
+                {31: 1}),
+          340: ([[(5, 1), (51, 2), (169, 3)],
+                 [(50, 4), (167, 5), (0, 1)],
+                 [(167, 6)],
+                 [(50, 7), (48, 8), (0, 3)],
+                 [(51, 2), (167, 9), (0, 4)],
+                 [(50, 4), (0, 5)],
+                 [(50, 10), (0, 6)],
+                 [(5, 1), (51, 2), (169, 3), (0, 7)],
+                 [(47, 11)],
+                 [(50, 4), (48, 12), (0, 9)],
+                 [(0, 10)],
+                 [(50, 7), (0, 11)],
+                 [(47, 5)]],
+                {4: 1, 5: 1, 39: 1, 51: 1}),
+          341: ([[(5, 1), (51, 2), (173, 3)],
+                 [(50, 4), (174, 5), (0, 1)],
+                 [(174, 6)],
+                 [(50, 7), (48, 8), (0, 3)],
+                 [(51, 2), (174, 9), (0, 4)],
+                 [(50, 4), (0, 5)],
+                 [(50, 10), (0, 6)],
+                 [(5, 1), (51, 2), (173, 3), (0, 7)],
+                 [(47, 11)],
+                 [(50, 4), (48, 12), (0, 9)],
+                 [(0, 10)],
+                 [(50, 7), (0, 11)],
+                 [(47, 5)]],
+                {4: 1, 5: 1, 39: 1, 51: 1}),
+          342: ([[(4, 1), (174, 2)], [(175, 3)], [(0, 2)], [(57, 2)]],
+                {4: 1, 39: 1}),
+          343: ([[(173, 1)], [(50, 2), (0, 1)], [(173, 1), (0, 2)]],
+                {4: 1, 39: 1}),
+          344: ([[(39, 1)], [(0, 1)]], {39: 1}),
+          345: ([[(32, 1)],
+                 [(47, 2)],
+                 [(46, 3)],
+                 [(79, 4)],
+                 [(122, 5), (0, 4)],
+                 [(46, 6)],
+                 [(79, 7)],
+                 [(0, 7)]],
+                {32: 1}),
+          346: ([[(47, 1)], [(106, 2), (0, 1)], [(93, 3)], [(0, 3)]],
+                {4: 1,
+                 6: 1,
+                 7: 1,
+                 8: 1,
+                 10: 1,
+                 11: 1,
+                 24: 1,
+                 26: 1,
+                 35: 1,
+                 36: 1,
+                 38: 1,
+                 39: 1,
+                 40: 1,
+                 41: 1}),
+          347: ([[(33, 1)],
+                 [(176, 2)],
+                 [(50, 1), (46, 3)],
+                 [(79, 4)],
+                 [(0, 4)]],
+                {33: 1}),
+          348: ([[(106, 1)], [(93, 2)], [(0, 2)]], {106: 1}),
+          349: ([[(177, 1)], [(178, 0), (0, 1)]],
+                {4: 1,
+                 6: 1,
+                 7: 1,
+                 8: 1,
+                 10: 1,
+                 11: 1,
+                 35: 1,
+                 36: 1,
+                 38: 1,
+                 39: 1,
+                 40: 1,
+                 41: 1}),
+          350: ([[(20, 1), (108, 2)], [(47, 2)], [(0, 2)]],
+                {4: 1,
+                 6: 1,
+                 7: 1,
+                 8: 1,
+                 10: 1,
+                 11: 1,
+                 20: 1,
+                 24: 1,
+                 26: 1,
+                 35: 1,
+                 36: 1,
+                 38: 1,
+                 39: 1,
+                 40: 1,
+                 41: 1}),
+          351: ([[(34, 1)], [(179, 2), (0, 1)], [(0, 2)]], {34: 1}),
+          352: ([[(59, 1)], [(0, 1)]], {34: 1})},
+ 'keywords': {'and': 45,
+              'as': 106,
+              'assert': 12,
+              'break': 13,
+              'class': 14,
+              'continue': 15,
+              'def': 16,
+              'del': 17,
+              'elif': 125,
+              'else': 122,
+              'except': 109,
+              'exec': 18,
+              'finally': 171,
+              'for': 19,
+              'from': 20,
+              'global': 21,
+              'if': 22,
+              'import': 23,
+              'in': 81,
+              'is': 92,
+              'lambda': 24,
+              'nonlocal': 25,
+              'not': 26,
+              'or': 139,
+              'pass': 27,
+              'print': 28,
+              'raise': 29,
+              'return': 30,
+              'try': 31,
+              'while': 32,
+              'with': 33,
+              'yield': 34},
+ 'labels': [(0, 'EMPTY'),
+            (0, None),
+            (4, None),
+            (324, None),
+            (7, None),
+            (16, None),
+            (14, None),
+            (15, None),
+            (23, None),
+            (50, None),
+            (9, None),
+            (25, None),
+            (1, 'assert'),
+            (1, 'break'),
+            (1, 'class'),
+            (1, 'continue'),
+            (1, 'def'),
+            (1, 'del'),
+            (1, 'exec'),
+            (1, 'for'),
+            (1, 'from'),
+            (1, 'global'),
+            (1, 'if'),
+            (1, 'import'),
+            (1, 'lambda'),
+            (1, 'nonlocal'),
+            (1, 'not'),
+            (1, 'pass'),
+            (1, 'print'),
+            (1, 'raise'),
+            (1, 'return'),
+            (1, 'try'),
+            (1, 'while'),
+            (1, 'with'),
+            (1, 'yield'),
+            (26, None),
+            (32, None),
+            (57, None),
+            (56, None),
+            (1, None),
+            (2, None),
+            (3, None),
+            (318, None),
+            (19, None),
+            (305, None),
+            (1, 'and'),
+            (11, None),
+            (329, None),
+            (22, None),
+            (261, None),
+            (12, None),
+            (36, None),
+            (270, None),
+            (328, None),
+            (295, None),
+            (294, None),
+            (347, None),
+            (8, None),
+            (332, None),
+            (351, None),
+            (10, None),
+            (304, None),
+            (331, None),
+            (27, None),
+            (281, None),
+            (41, None),
+            (42, None),
+            (47, None),
+            (39, None),
+            (37, None),
+            (38, None),
+            (49, None),
+            (40, None),
+            (45, None),
+            (46, None),
+            (51, None),
+            (44, None),
+            (43, None),
+            (260, None),
+            (327, None),
+            (291, None),
+            (1, 'in'),
+            (311, None),
+            (272, None),
+            (310, None),
+            (271, None),
+            (29, None),
+            (20, None),
+            (30, None),
+            (28, None),
+            (21, None),
+            (31, None),
+            (1, 'is'),
+            (289, None),
+            (273, None),
+            (265, None),
+            (269, None),
+            (277, None),
+            (297, None),
+            (339, None),
+            (345, None),
+            (279, None),
+            (264, None),
+            (284, None),
+            (278, None),
+            (323, None),
+            (1, 'as'),
+            (282, None),
+            (330, None),
+            (1, 'except'),
+            (349, None),
+            (18, None),
+            (334, None),
+            (259, None),
+            (267, None),
+            (314, None),
+            (292, None),
+            (268, None),
+            (276, None),
+            (316, None),
+            (317, None),
+            (352, None),
+            (1, 'else'),
+            (312, None),
+            (55, None),
+            (1, 'elif'),
+            (298, None),
+            (299, None),
+            (283, None),
+            (300, None),
+            (301, None),
+            (341, None),
+            (306, None),
+            (274, None),
+            (333, None),
+            (308, None),
+            (307, None),
+            (309, None),
+            (258, None),
+            (1, 'or'),
+            (340, None),
+            (266, None),
+            (338, None),
+            (35, None),
+            (262, None),
+            (34, None),
+            (322, None),
+            (13, None),
+            (275, None),
+            (319, None),
+            (263, None),
+            (280, None),
+            (288, None),
+            (290, None),
+            (293, None),
+            (296, None),
+            (302, None),
+            (313, None),
+            (315, None),
+            (321, None),
+            (325, None),
+            (5, None),
+            (6, None),
+            (24, None),
+            (17, None),
+            (48, None),
+            (303, None),
+            (337, None),
+            (336, None),
+            (335, None),
+            (326, None),
+            (1, 'finally'),
+            (287, None),
+            (342, None),
+            (344, None),
+            (343, None),
+            (346, None),
+            (257, None),
+            (33, None),
+            (350, None)],
+ 'number2symbol': {256: 'file_input',
+                   257: 'and_expr',
+                   258: 'and_test',
+                   259: 'annassign',
+                   260: 'arglist',
+                   261: 'argument',
+                   262: 'arith_expr',
+                   263: 'assert_stmt',
+                   264: 'async_funcdef',
+                   265: 'async_stmt',
+                   266: 'atom',
+                   267: 'augassign',
+                   268: 'break_stmt',
+                   269: 'classdef',
+                   270: 'comp_for',
+                   271: 'comp_if',
+                   272: 'comp_iter',
+                   273: 'comp_op',
+                   274: 'comparison',
+                   275: 'compound_stmt',
+                   276: 'continue_stmt',
+                   277: 'decorated',
+                   278: 'decorator',
+                   279: 'decorators',
+                   280: 'del_stmt',
+                   281: 'dictsetmaker',
+                   282: 'dotted_as_name',
+                   283: 'dotted_as_names',
+                   284: 'dotted_name',
+                   285: 'encoding_decl',
+                   286: 'eval_input',
+                   287: 'except_clause',
+                   288: 'exec_stmt',
+                   289: 'expr',
+                   290: 'expr_stmt',
+                   291: 'exprlist',
+                   292: 'factor',
+                   293: 'flow_stmt',
+                   294: 'for_stmt',
+                   295: 'funcdef',
+                   296: 'global_stmt',
+                   297: 'if_stmt',
+                   298: 'import_as_name',
+                   299: 'import_as_names',
+                   300: 'import_from',
+                   301: 'import_name',
+                   302: 'import_stmt',
+                   303: 'lambdef',
+                   304: 'listmaker',
+                   305: 'not_test',
+                   306: 'old_comp_for',
+                   307: 'old_comp_if',
+                   308: 'old_comp_iter',
+                   309: 'old_lambdef',
+                   310: 'old_test',
+                   311: 'or_test',
+                   312: 'parameters',
+                   313: 'pass_stmt',
+                   314: 'power',
+                   315: 'print_stmt',
+                   316: 'raise_stmt',
+                   317: 'return_stmt',
+                   318: 'shift_expr',
+                   319: 'simple_stmt',
+                   320: 'single_input',
+                   321: 'sliceop',
+                   322: 'small_stmt',
+                   323: 'star_expr',
+                   324: 'stmt',
+                   325: 'subscript',
+                   326: 'subscriptlist',
+                   327: 'suite',
+                   328: 'term',
+                   329: 'test',
+                   330: 'testlist',
+                   331: 'testlist1',
+                   332: 'testlist_gexp',
+                   333: 'testlist_safe',
+                   334: 'testlist_star_expr',
+                   335: 'tfpdef',
+                   336: 'tfplist',
+                   337: 'tname',
+                   338: 'trailer',
+                   339: 'try_stmt',
+                   340: 'typedargslist',
+                   341: 'varargslist',
+                   342: 'vfpdef',
+                   343: 'vfplist',
+                   344: 'vname',
+                   345: 'while_stmt',
+                   346: 'with_item',
+                   347: 'with_stmt',
+                   348: 'with_var',
+                   349: 'xor_expr',
+                   350: 'yield_arg',
+                   351: 'yield_expr',
+                   352: 'yield_stmt'},
+ 'start': 256,
+ 'states': [[[(1, 1), (2, 0), (3, 0)], [(0, 1)]],
+            [[(42, 1)], [(43, 0), (0, 1)]],
+            [[(44, 1)], [(45, 0), (0, 1)]],
+            [[(46, 1)], [(47, 2)], [(48, 3), (0, 2)], [(47, 4)], [(0, 4)]],
+            [[(49, 1)], [(50, 2), (0, 1)], [(49, 1), (0, 2)]],
+            [[(5, 1), (51, 1), (47, 2)],
+             [(47, 3)],
+             [(48, 1), (52, 3), (0, 2)],
+             [(0, 3)]],
+            [[(53, 1)], [(6, 0), (7, 0), (0, 1)]],
+            [[(12, 1)], [(47, 2)], [(50, 3), (0, 2)], [(47, 4)], [(0, 4)]],
+            [[(37, 1)], [(54, 2)], [(0, 2)]],
+            [[(37, 1)], [(55, 2), (54, 2), (56, 2)], [(0, 2)]],
+            [[(4, 1),
+              (8, 2),
+              (10, 3),
+              (11, 4),
+              (35, 5),
+              (39, 6),
+              (40, 6),
+              (41, 7)],
+             [(57, 6), (58, 8), (59, 8)],
+             [(8, 9)],
+             [(60, 6), (61, 10)],
+             [(62, 11)],
+             [(63, 6), (64, 12)],
+             [(0, 6)],
+             [(41, 7), (0, 7)],
+             [(57, 6)],
+             [(8, 6)],
+             [(60, 6)],
+             [(11, 6)],
+             [(63, 6)]],
+            [[(65, 1),
+              (66, 1),
+              (67, 1),
+              (68, 1),
+              (69, 1),
+              (70, 1),
+              (71, 1),
+              (72, 1),
+              (73, 1),
+              (74, 1),
+              (75, 1),
+              (76, 1),
+              (77, 1)],
+             [(0, 1)]],
+            [[(13, 1)], [(0, 1)]],
+            [[(14, 1)],
+             [(39, 2)],
+             [(4, 3), (46, 4)],
+             [(57, 5), (78, 6)],
+             [(79, 7)],
+             [(46, 4)],
+             [(57, 5)],
+             [(0, 7)]],
+            [[(19, 1), (37, 2)],
+             [(80, 3)],
+             [(19, 1)],
+             [(81, 4)],
+             [(82, 5)],
+             [(83, 6), (0, 5)],
+             [(0, 6)]],
+            [[(22, 1)], [(84, 2)], [(83, 3), (0, 2)], [(0, 3)]],
+            [[(52, 1), (85, 1)], [(0, 1)]],
+            [[(86, 1),
+              (87, 1),
+              (88, 1),
+              (86, 1),
+              (89, 1),
+              (90, 1),
+              (91, 1),
+              (81, 1),
+              (92, 2),
+              (26, 3)],
+             [(0, 1)],
+             [(26, 1), (0, 2)],
+             [(81, 1)]],
+            [[(93, 1)], [(94, 0), (0, 1)]],
+            [[(95, 1),
+              (96, 1),
+              (97, 1),
+              (55, 1),
+              (54, 1),
+              (98, 1),
+              (99, 1),
+              (100, 1),
+              (56, 1)],
+             [(0, 1)]],
+            [[(15, 1)], [(0, 1)]],
+            [[(101, 1)], [(102, 2), (96, 2), (54, 2)], [(0, 2)]],
+            [[(9, 1)],
+             [(103, 2)],
+             [(4, 3), (2, 4)],
+             [(57, 5), (78, 6)],
+             [(0, 4)],
+             [(2, 4)],
+             [(57, 5)]],
+            [[(104, 1)], [(104, 1), (0, 1)]],
+            [[(17, 1)], [(80, 2)], [(0, 2)]],
+            [[(51, 1), (105, 2), (47, 3)],
+             [(93, 4)],
+             [(50, 5), (52, 6), (0, 2)],
+             [(50, 5), (46, 7), (52, 6), (0, 3)],
+             [(50, 8), (52, 6), (0, 4)],
+             [(105, 9), (47, 9), (0, 5)],
+             [(0, 6)],
+             [(47, 4)],
+             [(51, 10), (47, 11), (0, 8)],
+             [(50, 5), (0, 9)],
+             [(93, 12)],
+             [(46, 13)],
+             [(50, 8), (0, 12)],
+             [(47, 12)]],
+            [[(103, 1)], [(106, 2), (0, 1)], [(39, 3)], [(0, 3)]],
+            [[(107, 1)], [(50, 0), (0, 1)]],
+            [[(39, 1)], [(8, 0), (0, 1)]],
+            [[(39, 1)], [(0, 1)]],
+            [[(108, 1)], [(1, 2), (2, 1)], [(0, 2)]],
+            [[(109, 1)],
+             [(47, 2), (0, 1)],
+             [(50, 3), (106, 3), (0, 2)],
+             [(47, 4)],
+             [(0, 4)]],
+            [[(18, 1)],
+             [(93, 2)],
+             [(81, 3), (0, 2)],
+             [(47, 4)],
+             [(50, 5), (0, 4)],
+             [(47, 6)],
+             [(0, 6)]],
+            [[(110, 1)], [(111, 0), (0, 1)]],
+            [[(112, 1)],
+             [(48, 2), (113, 3), (114, 4), (0, 1)],
+             [(112, 5), (59, 5)],
+             [(0, 3)],
+             [(108, 3), (59, 3)],
+             [(48, 2), (0, 5)]],
+            [[(93, 1), (105, 1)],
+             [(50, 2), (0, 1)],
+             [(93, 1), (105, 1), (0, 2)]],
+            [[(6, 1), (7, 1), (36, 1), (115, 2)], [(116, 2)], [(0, 2)]],
+            [[(117, 1), (118, 1), (119, 1), (120, 1), (121, 1)], [(0, 1)]],
+            [[(19, 1)],
+             [(80, 2)],
+             [(81, 3)],
+             [(108, 4)],
+             [(46, 5)],
+             [(79, 6)],
+             [(122, 7), (0, 6)],
+             [(46, 8)],
+             [(79, 9)],
+             [(0, 9)]],
+            [[(16, 1)],
+             [(39, 2)],
+             [(123, 3)],
+             [(124, 4), (46, 5)],
+             [(47, 6)],
+             [(79, 7)],
+             [(46, 5)],
+             [(0, 7)]],
+            [[(21, 1), (25, 1)], [(39, 2)], [(50, 1), (0, 2)]],
+            [[(22, 1)],
+             [(47, 2)],
+             [(46, 3)],
+             [(79, 4)],
+             [(125, 1), (122, 5), (0, 4)],
+             [(46, 6)],
+             [(79, 7)],
+             [(0, 7)]],
+            [[(39, 1)], [(106, 2), (0, 1)], [(39, 3)], [(0, 3)]],
+            [[(126, 1)], [(50, 2), (0, 1)], [(126, 1), (0, 2)]],
+            [[(20, 1)],
+             [(8, 2), (103, 3)],
+             [(8, 2), (23, 4), (103, 3)],
+             [(23, 4)],
+             [(4, 5), (5, 6), (127, 6)],
+             [(127, 7)],
+             [(0, 6)],
+             [(57, 6)]],
+            [[(23, 1)], [(128, 2)], [(0, 2)]],
+            [[(129, 1), (130, 1)], [(0, 1)]],
+            [[(24, 1)], [(46, 2), (131, 3)], [(47, 4)], [(46, 2)], [(0, 4)]],
+            [[(105, 1), (47, 1)],
+             [(50, 2), (132, 3), (0, 1)],
+             [(105, 4), (47, 4), (0, 2)],
+             [(0, 3)],
+             [(50, 2), (0, 4)]],
+            [[(26, 1), (133, 2)], [(44, 2)], [(0, 2)]],
+            [[(19, 1), (37, 2)],
+             [(80, 3)],
+             [(19, 1)],
+             [(81, 4)],
+             [(134, 5)],
+             [(135, 6), (0, 5)],
+             [(0, 6)]],
+            [[(22, 1)], [(84, 2)], [(135, 3), (0, 2)], [(0, 3)]],
+            [[(132, 1), (136, 1)], [(0, 1)]],
+            [[(24, 1)], [(46, 2), (131, 3)], [(84, 4)], [(46, 2)], [(0, 4)]],
+            [[(137, 1), (82, 1)], [(0, 1)]],
+            [[(138, 1)], [(139, 0), (0, 1)]],
+            [[(4, 1)], [(57, 2), (140, 3)], [(0, 2)], [(57, 2)]],
+            [[(27, 1)], [(0, 1)]],
+            [[(38, 1), (141, 2)],
+             [(141, 2)],
+             [(51, 3), (142, 2), (0, 2)],
+             [(116, 4)],
+             [(0, 4)]],
+            [[(28, 1)],
+             [(143, 2), (47, 3), (0, 1)],
+             [(47, 4)],
+             [(50, 5), (0, 3)],
+             [(50, 6), (0, 4)],
+             [(47, 3), (0, 5)],
+             [(47, 7)],
+             [(50, 8), (0, 7)],
+             [(47, 7), (0, 8)]],
+            [[(29, 1)],
+             [(47, 2), (0, 1)],
+             [(50, 3), (20, 4), (0, 2)],
+             [(47, 5)],
+             [(47, 6)],
+             [(50, 4), (0, 5)],
+             [(0, 6)]],
+            [[(30, 1)], [(108, 2), (0, 1)], [(0, 2)]],
+            [[(144, 1)], [(145, 0), (143, 0), (0, 1)]],
+            [[(146, 1)], [(147, 2), (2, 3)], [(2, 3), (146, 1)], [(0, 3)]],
+            [[(2, 1), (148, 2), (149, 1)], [(0, 1)], [(2, 1)]],
+            [[(46, 1)], [(47, 2), (0, 1)], [(0, 2)]],
+            [[(150, 1),
+              (151, 1),
+              (152, 1),
+              (153, 1),
+              (154, 1),
+              (155, 1),
+              (156, 1),
+              (157, 1),
+              (158, 1)],
+             [(0, 1)]],
+            [[(5, 1)], [(93, 2)], [(0, 2)]],
+            [[(148, 1), (149, 1)], [(0, 1)]],
+            [[(46, 1), (47, 2)],
+             [(159, 3), (47, 4), (0, 1)],
+             [(46, 1), (0, 2)],
+             [(0, 3)],
+             [(159, 3), (0, 4)]],
+            [[(160, 1)], [(50, 2), (0, 1)], [(160, 1), (0, 2)]],
+            [[(2, 1), (149, 2)],
+             [(161, 3)],
+             [(0, 2)],
+             [(3, 4)],
+             [(162, 2), (3, 4)]],
+            [[(116, 1)],
+             [(163, 0), (5, 0), (164, 0), (165, 0), (9, 0), (0, 1)]],
+            [[(166, 1), (82, 2)],
+             [(0, 1)],
+             [(22, 3), (0, 2)],
+             [(82, 4)],
+             [(122, 5)],
+             [(47, 1)]],
+            [[(47, 1)], [(50, 2), (0, 1)], [(47, 1), (0, 2)]],
+            [[(47, 1)], [(50, 0), (0, 1)]],
+            [[(105, 1), (47, 1)],
+             [(50, 2), (132, 3), (0, 1)],
+             [(105, 4), (47, 4), (0, 2)],
+             [(0, 3)],
+             [(50, 2), (0, 4)]],
+            [[(84, 1)],
+             [(50, 2), (0, 1)],
+             [(84, 3)],
+             [(50, 4), (0, 3)],
+             [(84, 3), (0, 4)]],
+            [[(105, 1), (47, 1)],
+             [(50, 2), (0, 1)],
+             [(105, 1), (47, 1), (0, 2)]],
+            [[(4, 1), (167, 2)], [(168, 3)], [(0, 2)], [(57, 2)]],
+            [[(169, 1)], [(50, 2), (0, 1)], [(169, 1), (0, 2)]],
+            [[(39, 1)], [(46, 2), (0, 1)], [(47, 3)], [(0, 3)]],
+            [[(4, 1), (8, 2), (10, 3)],
+             [(57, 4), (78, 5)],
+             [(39, 4)],
+             [(170, 6)],
+             [(0, 4)],
+             [(57, 4)],
+             [(60, 4)]],
+            [[(31, 1)],
+             [(46, 2)],
+             [(79, 3)],
+             [(171, 4), (172, 5)],
+             [(46, 6)],
+             [(46, 7)],
+             [(79, 8)],
+             [(79, 9)],
+             [(0, 8)],
+             [(122, 10), (171, 4), (172, 5), (0, 9)],
+             [(46, 11)],
+             [(79, 12)],
+             [(171, 4), (0, 12)]],
+            [[(5, 1), (51, 2), (169, 3)],
+             [(50, 4), (167, 5), (0, 1)],
+             [(167, 6)],
+             [(50, 7), (48, 8), (0, 3)],
+             [(51, 2), (167, 9), (0, 4)],
+             [(50, 4), (0, 5)],
+             [(50, 10), (0, 6)],
+             [(5, 1), (51, 2), (169, 3), (0, 7)],
+             [(47, 11)],
+             [(50, 4), (48, 12), (0, 9)],
+             [(0, 10)],
+             [(50, 7), (0, 11)],
+             [(47, 5)]],
+            [[(5, 1), (51, 2), (173, 3)],
+             [(50, 4), (174, 5), (0, 1)],
+             [(174, 6)],
+             [(50, 7), (48, 8), (0, 3)],
+             [(51, 2), (174, 9), (0, 4)],
+             [(50, 4), (0, 5)],
+             [(50, 10), (0, 6)],
+             [(5, 1), (51, 2), (173, 3), (0, 7)],
+             [(47, 11)],
+             [(50, 4), (48, 12), (0, 9)],
+             [(0, 10)],
+             [(50, 7), (0, 11)],
+             [(47, 5)]],
+            [[(4, 1), (174, 2)], [(175, 3)], [(0, 2)], [(57, 2)]],
+            [[(173, 1)], [(50, 2), (0, 1)], [(173, 1), (0, 2)]],
+            [[(39, 1)], [(0, 1)]],
+            [[(32, 1)],
+             [(47, 2)],
+             [(46, 3)],
+             [(79, 4)],
+             [(122, 5), (0, 4)],
+             [(46, 6)],
+             [(79, 7)],
+             [(0, 7)]],
+            [[(47, 1)], [(106, 2), (0, 1)], [(93, 3)], [(0, 3)]],
+            [[(33, 1)], [(176, 2)], [(50, 1), (46, 3)], [(79, 4)], [(0, 4)]],
+            [[(106, 1)], [(93, 2)], [(0, 2)]],
+            [[(177, 1)], [(178, 0), (0, 1)]],
+            [[(20, 1), (108, 2)], [(47, 2)], [(0, 2)]],
+            [[(34, 1)], [(179, 2), (0, 1)], [(0, 2)]],
+            [[(59, 1)], [(0, 1)]]],
+ 'symbol2label': {'and_expr': 177,
+                  'and_test': 138,
+                  'annassign': 113,
+                  'arglist': 78,
+                  'argument': 49,
+                  'arith_expr': 144,
+                  'assert_stmt': 150,
+                  'async_funcdef': 102,
+                  'async_stmt': 95,
+                  'atom': 141,
+                  'augassign': 114,
+                  'break_stmt': 117,
+                  'classdef': 96,
+                  'comp_for': 52,
+                  'comp_if': 85,
+                  'comp_iter': 83,
+                  'comp_op': 94,
+                  'comparison': 133,
+                  'compound_stmt': 148,
+                  'continue_stmt': 118,
+                  'decorated': 97,
+                  'decorator': 104,
+                  'decorators': 101,
+                  'del_stmt': 151,
+                  'dictsetmaker': 64,
+                  'dotted_as_name': 107,
+                  'dotted_as_names': 128,
+                  'dotted_name': 103,
+                  'except_clause': 172,
+                  'exec_stmt': 152,
+                  'expr': 93,
+                  'expr_stmt': 153,
+                  'exprlist': 80,
+                  'factor': 116,
+                  'flow_stmt': 154,
+                  'for_stmt': 55,
+                  'funcdef': 54,
+                  'global_stmt': 155,
+                  'if_stmt': 98,
+                  'import_as_name': 126,
+                  'import_as_names': 127,
+                  'import_from': 129,
+                  'import_name': 130,
+                  'import_stmt': 156,
+                  'lambdef': 166,
+                  'listmaker': 61,
+                  'not_test': 44,
+                  'old_comp_for': 132,
+                  'old_comp_if': 136,
+                  'old_comp_iter': 135,
+                  'old_lambdef': 137,
+                  'old_test': 84,
+                  'or_test': 82,
+                  'parameters': 123,
+                  'pass_stmt': 157,
+                  'power': 115,
+                  'print_stmt': 158,
+                  'raise_stmt': 119,
+                  'return_stmt': 120,
+                  'shift_expr': 42,
+                  'simple_stmt': 149,
+                  'sliceop': 159,
+                  'small_stmt': 146,
+                  'star_expr': 105,
+                  'stmt': 3,
+                  'subscript': 160,
+                  'subscriptlist': 170,
+                  'suite': 79,
+                  'term': 53,
+                  'test': 47,
+                  'testlist': 108,
+                  'testlist1': 62,
+                  'testlist_gexp': 58,
+                  'testlist_safe': 134,
+                  'testlist_star_expr': 112,
+                  'tfpdef': 169,
+                  'tfplist': 168,
+                  'tname': 167,
+                  'trailer': 142,
+                  'try_stmt': 99,
+                  'typedargslist': 140,
+                  'varargslist': 131,
+                  'vfpdef': 173,
+                  'vfplist': 175,
+                  'vname': 174,
+                  'while_stmt': 100,
+                  'with_item': 176,
+                  'with_stmt': 56,
+                  'xor_expr': 110,
+                  'yield_arg': 179,
+                  'yield_expr': 59,
+                  'yield_stmt': 121},
+ 'symbol2number': {'and_expr': 257,
+                   'and_test': 258,
+                   'annassign': 259,
+                   'arglist': 260,
+                   'argument': 261,
+                   'arith_expr': 262,
+                   'assert_stmt': 263,
+                   'async_funcdef': 264,
+                   'async_stmt': 265,
+                   'atom': 266,
+                   'augassign': 267,
+                   'break_stmt': 268,
+                   'classdef': 269,
+                   'comp_for': 270,
+                   'comp_if': 271,
+                   'comp_iter': 272,
+                   'comp_op': 273,
+                   'comparison': 274,
+                   'compound_stmt': 275,
+                   'continue_stmt': 276,
+                   'decorated': 277,
+                   'decorator': 278,
+                   'decorators': 279,
+                   'del_stmt': 280,
+                   'dictsetmaker': 281,
+                   'dotted_as_name': 282,
+                   'dotted_as_names': 283,
+                   'dotted_name': 284,
+                   'encoding_decl': 285,
+                   'eval_input': 286,
+                   'except_clause': 287,
+                   'exec_stmt': 288,
+                   'expr': 289,
+                   'expr_stmt': 290,
+                   'exprlist': 291,
+                   'factor': 292,
+                   'file_input': 256,
+                   'flow_stmt': 293,
+                   'for_stmt': 294,
+                   'funcdef': 295,
+                   'global_stmt': 296,
+                   'if_stmt': 297,
+                   'import_as_name': 298,
+                   'import_as_names': 299,
+                   'import_from': 300,
+                   'import_name': 301,
+                   'import_stmt': 302,
+                   'lambdef': 303,
+                   'listmaker': 304,
+                   'not_test': 305,
+                   'old_comp_for': 306,
+                   'old_comp_if': 307,
+                   'old_comp_iter': 308,
+                   'old_lambdef': 309,
+                   'old_test': 310,
+                   'or_test': 311,
+                   'parameters': 312,
+                   'pass_stmt': 313,
+                   'power': 314,
+                   'print_stmt': 315,
+                   'raise_stmt': 316,
+                   'return_stmt': 317,
+                   'shift_expr': 318,
+                   'simple_stmt': 319,
+                   'single_input': 320,
+                   'sliceop': 321,
+                   'small_stmt': 322,
+                   'star_expr': 323,
+                   'stmt': 324,
+                   'subscript': 325,
+                   'subscriptlist': 326,
+                   'suite': 327,
+                   'term': 328,
+                   'test': 329,
+                   'testlist': 330,
+                   'testlist1': 331,
+                   'testlist_gexp': 332,
+                   'testlist_safe': 333,
+                   'testlist_star_expr': 334,
+                   'tfpdef': 335,
+                   'tfplist': 336,
+                   'tname': 337,
+                   'trailer': 338,
+                   'try_stmt': 339,
+                   'typedargslist': 340,
+                   'varargslist': 341,
+                   'vfpdef': 342,
+                   'vfplist': 343,
+                   'vname': 344,
+                   'while_stmt': 345,
+                   'with_item': 346,
+                   'with_stmt': 347,
+                   'with_var': 348,
+                   'xor_expr': 349,
+                   'yield_arg': 350,
+                   'yield_expr': 351,
+                   'yield_stmt': 352},
+ 'tokens': {0: 1,
+            1: 39,
+            2: 40,
+            3: 41,
+            4: 2,
+            5: 161,
+            6: 162,
+            7: 4,
+            8: 57,
+            9: 10,
+            10: 60,
+            11: 46,
+            12: 50,
+            13: 147,
+            14: 6,
+            15: 7,
+            16: 5,
+            17: 164,
+            18: 111,
+            19: 43,
+            20: 87,
+            21: 90,
+            22: 48,
+            23: 8,
+            24: 163,
+            25: 11,
+            26: 35,
+            27: 63,
+            28: 89,
+            29: 86,
+            30: 88,
+            31: 91,
+            32: 36,
+            33: 178,
+            34: 145,
+            35: 143,
+            36: 51,
+            37: 69,
+            38: 70,
+            39: 68,
+            40: 72,
+            41: 65,
+            42: 66,
+            43: 77,
+            44: 76,
+            45: 73,
+            46: 74,
+            47: 67,
+            48: 165,
+            49: 71,
+            50: 9,
+            51: 75,
+            55: 124,
+            56: 38,
+            57: 37}}
@@ -0,0 +1,124 @@
+# Generated by blib2to3/pgen2/driver.py from the grammar file, do not edit.
+# Regenerate with: python -m blib2to3.pgen2.driver blib2to3/*Grammar.txt
+
+SOURCE_HASH = 'ee5ba5db3b6722a0e2fbe2560ebc1c883e72328ef9c3b4da1c7c5d1cc649bce3'
+TABLES = {'dfas': {256: ([[(1, 1)], [(2, 2)], [(0, 2)]], {3: 1, 4: 1, 5: 1, 6: 1, 7: 1}),
+          257: ([[(8, 1), (9, 1)], [(8, 1), (9, 1), (0, 1)]],
+                {3: 1, 4: 1, 5: 1, 6: 1, 7: 1}),
+          258: ([[(10, 1)], [(11, 0), (0, 1)]], {3: 1, 4: 1, 5: 1, 6: 1, 7: 1}),
+          259: ([[(12, 1)], [(1, 2)], [(13, 3)], [(0, 3)]], {12: 1}),
+          260: ([[(5, 1)],
+                 [(3, 2), (6, 3), (7, 4)],
+                 [(1, 5)],
+                 [(14, 4), (0, 3)],
+                 [(0, 4)],
+                 [(15, 4)]],
+                {5: 1}),
+          261: ([[(16, 1), (17, 1), (18, 2)],
+                 [(0, 1)],
+                 [(19, 3)],
+                 [(20, 4), (21, 1)],
+                 [(19, 5)],
+                 [(21, 1)]],
+                {16: 1, 17: 1, 18: 1}),
+          262: ([[(3, 1), (4, 2), (6, 3), (7, 4)],
+                 [(1, 5)],
+                 [(1, 6)],
+                 [(22, 7), (14, 4), (23, 8), (0, 3)],
+                 [(23, 8), (0, 4)],
+                 [(15, 4)],
+                 [(24, 8)],
+                 [(3, 1), (4, 2), (6, 9), (7, 4)],
+                 [(0, 8)],
+                 [(14, 4), (23, 8), (0, 9)]],
+                {3: 1, 4: 1, 6: 1, 7: 1})},
+ 'keywords': {'not': 5},
+ 'labels': [(0, 'EMPTY'),
+            (258, None),
+            (0, None),
+            (7, None),
+            (9, None),
+            (1, 'not'),
+            (1, None),
+            (3, None),
+            (260, None),
+            (262, None),
+            (257, None),
+            (18, None),
+            (20, None),
+            (21, None),
+            (259, None),
+            (8, None),
+            (16, None),
+            (14, None),
+            (26, None),
+            (2, None),
+            (12, None),
+            (27, None),
+            (22, None),
+            (261, None),
+            (10, None)],
+ 'number2symbol': {256: 'Matcher',
+                   257: 'Alternative',
+                   258: 'Alternatives',
+                   259: 'Details',
+                   260: 'NegatedUnit',
+                   261: 'Repeater',
+                   262: 'Unit'},
+ 'start': 256,
+ 'states': [[[(1, 1)], [(2, 2)], [(0, 2)]],
+            [[(8, 1), (9, 1)], [(8, 1), (9, 1), (0, 1)]],
+            [[(10, 1)], [(11, 0), (0, 1)]],
+            [[(12, 1)], [(1, 2)], [(13, 3)], [(0, 3)]],
+            [[(5, 1)],
+             [(3, 2), (6, 3), (7, 4)],
+             [(1, 5)],
+             [(14, 4), (0, 3)],
+             [(0, 4)],
+             [(15, 4)]],
+            [[(16, 1), (17, 1), (18, 2)],
+             [(0, 1)],
+             [(19, 3)],
+             [(20, 4), (21, 1)],
+             [(19, 5)],
+             [(21, 1)]],
+            [[(3, 1), (4, 2), (6, 3), (7, 4)],
+             [(1, 5)],
+             [(1, 6)],
+             [(22, 7), (14, 4), (23, 8), (0, 3)],
+             [(23, 8), (0, 4)],
+             [(15, 4)],
+             [(24, 8)],
+             [(3, 1), (4, 2), (6, 9), (7, 4)],
+             [(0, 8)],
+             [(14, 4), (23, 8), (0, 9)]]],
+ 'symbol2label': {'Alternative': 10,
+                  'Alternatives': 1,
+                  'Details': 14,
+                  'NegatedUnit': 8,
+                  'Repeater': 23,
+                  'Unit': 9},
+ 'symbol2number': {'Alternative': 257,
+                   'Alternatives': 258,
+                   'Details': 259,
+                   'Matcher': 256,
+                   'NegatedUnit': 260,
+                   'Repeater': 261,
+                   'Unit': 262},
+ 'tokens': {0: 2,
+            1: 6,
+            2: 19,
+            3: 7,
+            7: 3,
+            8: 15,
+            9: 4,
+            10: 24,
+            12: 20,
+            14: 17,
+            16: 16,
+            18: 11,
+            20: 12,
+            21: 13,
+            22: 22,
+            26: 18,
+            27: 21}}
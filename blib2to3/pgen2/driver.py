@@ -17,6 +17,8 @@ __all__ = ["Driver", "load_grammar"]
 
 # Python imports
 import codecs
+import hashlib
+import importlib
 import io
 import os
 import logging
@@ -24,22 +26,29 @@ import pkgutil
 import sys
 
 # Pgen imports
-from . import grammar, parse, token, tokenize, pgen
+from . import grammar, parse, token, tokenize
 
 
 class Driver(object):
 
-    def __init__(self, grammar, convert=None, logger=None):
+    def __init__(self, grammar, convert=None, logger=None,
+                 collect_used_names=True, track_changes=True):
         self.grammar = grammar
         if logger is None:
             logger = logging.getLogger()
         self.logger = logger
         self.convert = convert
+        self.collect_used_names = collect_used_names
+        self.track_changes = track_changes
 
     def parse_tokens(self, tokens, debug=False):
         """Parse a series of tokens and return the syntax tree."""
+        if isinstance(tokens, tokenize.TokenBuffer):
+            return self._parse_token_buffer(tokens, debug)
+
         # XXX Move the prefix computation into a wrapper around tokenize.
-        p = parse.Parser(self.grammar, self.convert)
+        p = parse.Parser(self.grammar, self.convert, self.collect_used_names,
+                         self.track_changes)
         p.setup()
         lineno = 1
         column = 0
@@ -95,6 +104,95 @@ class Driver(object):
                                    type, value, (prefix, start))
         return p.rootnode
 
+    def _parse_token_buffer(self, tokens, debug=False):
+        """Parse a TokenBuffer without materializing per-token tuples.
+
+        Since the buffer knows the absolute offset of every token, the
+        prefix of a token is a single slice of the source, running from the
+        end of the previous significant token to its own start.  COMMENT and
+        NL tokens are simply skipped and end up inside that slice.  The
+        offsets of the comments within it are passed on to the parser.
+
+        To keep the tree small, names, operators and prefixes without
+        comments are interned, and the tokens of a line share one lineno.
+        """
+        p = parse.Parser(self.grammar, self.convert, self.collect_used_names,
+                         self.track_changes)
+        p.setup()
+        source = tokens.source
+        row_offsets = tokens.row_offsets.tolist()
+        skipped = {tokenize.COMMENT, tokenize.NL}
+        interned = {tokenize.NAME, tokenize.OP}
+        lineno = 0
+        indent_columns = []
+        comments = []  # COMMENT tokens not attached to a leaf yet
+        type = value = start = None
+        prefix = ""
+        prefix_start = 0
+        for i, (type, s_offset, e_offset, s_lineno) in enumerate(zip(
+                tokens.types, tokens.starts, tokens.ends, tokens.srows)):
+            if type in skipped:
+                if type == tokenize.COMMENT:
+                    comments.append(i)
+                continue
+            if s_lineno != lineno:
+                lineno = s_lineno
+            start = lineno, s_offset - row_offsets[lineno - 1]
+            value = source[s_offset:e_offset]
+            prefix = source[prefix_start:s_offset]
+            if type in interned:
+                value = sys.intern(value)
+            if type == token.OP:
+                type = grammar.opmap[value]
+            if debug:
+                self.logger.debug("%s %r (prefix=%r)",
+                                  token.tok_name[type], value, prefix)
+            spans = ()
+            if type == token.INDENT:
+                # The indentation itself goes to the prefix of the next token.
+                indent_columns.append(len(value))
+                prefix = value = ""
+            elif type == token.DEDENT:
+                _indent_col = indent_columns.pop()
+                prefix, _ = self._partially_consume_prefix(prefix, _indent_col)
+                if comments:
+                    spans = self._take_comments(
+                        tokens, comments, prefix_start, prefix_start + len(prefix))
+                prefix_start += len(prefix)
+            else:
+                if comments:
+                    spans = self._take_comments(
+                        tokens, comments, prefix_start, s_offset)
+                prefix_start = e_offset
+            if not spans:
+                prefix = sys.intern(prefix)
+            if p.addtoken(type, value, (prefix, start), spans):
+                if debug:
+                    self.logger.debug("Stop.")
+                break
+        else:
+            tokens.raise_error()
+            # We never broke out -- EOF is too soon (how can this happen???)
+            raise parse.ParseError("incomplete input",
+                                   type, value, (prefix, start))
+        return p.rootnode
+
+    def _take_comments(self, tokens, comments, prefix_start, prefix_end):
+        """Remove the comments before `prefix_end` from `comments`.
+
+        Returns a tuple of their (start, end) offsets relative to
+        `prefix_start`.
+        """
+        starts = tokens.starts
+        ends = tokens.ends
+        count = 0
+        while count < len(comments) and starts[comments[count]] < prefix_end:
+            count += 1
+        spans = tuple((starts[i] - prefix_start, ends[i] - prefix_start)
+                      for i in comments[:count])
+        del comments[:count]
+        return spans
+
     def parse_stream_raw(self, stream, debug=False):
         """Parse a stream and return the syntax tree."""
         tokens = tokenize.generate_tokens(stream.readline)
@@ -111,37 +209,34 @@ class Driver(object):
 
     def parse_string(self, text, debug=False):
         """Parse a string and return the syntax tree."""
-        tokens = tokenize.generate_tokens(io.StringIO(text).readline)
+        tokens = tokenize.tokenize_string(text)
         return self.parse_tokens(tokens, debug)
 
     def _partially_consume_prefix(self, prefix, column):
-        lines = []
-        current_line = ""
-        current_column = 0
-        wait_for_nl = False
-        for char in prefix:
-            current_line += char
-            if wait_for_nl:
-                if char == '\n':
-                    if current_line.strip() and current_column < column:
-                        res = ''.join(lines)
-                        return res, prefix[len(res):]
-
-                    lines.append(current_line)
-                    current_line = ""
-                    current_column = 0
-                    wait_for_nl = False
-            elif char == ' ':
-                current_column += 1
-            elif char == '\t':
-                current_column += 4
-            elif char == '\n':
-                # unexpected empty line
-                current_column = 0
-            else:
-                # indent is finished
-                wait_for_nl = True
-        return ''.join(lines), current_line
+        """Split `prefix` where its lines stop being indented past `column`.
+
+        Returns a tuple of the leading lines that still belong to the block
+        being dedented and the rest of the prefix.  Lines made only of
+        blanks are attached to the line that follows them.
+        """
+        consumed = 0  # end of the lines that belong to the deeper block
+        pos = 0
+        while True:
+            end = prefix.find('\n', pos)
+            if end == -1:
+                break
+
+            line = prefix[pos:end]
+            stripped = line.lstrip(' \t')
+            if stripped:
+                indent = line[:len(line) - len(stripped)]
+                width = len(indent) + 3 * indent.count('\t')
+                if width < column and stripped.strip():
+                    break
+
+                consumed = end + 1
+            pos = end + 1
+        return prefix[:consumed], prefix[consumed:]
 
 
 def _generate_pickle_name(gt, cache_dir=None):
@@ -155,6 +250,21 @@ def _generate_pickle_name(gt, cache_dir=None):
         return name
 
 
+def _generate_tables_name(gt):
+    """Return the name of the module holding the tables of grammar file `gt`.
+
+    Unlike pickles, the module does not depend on the Python version.
+    """
+    head, tail = os.path.splitext(os.path.basename(gt))
+    return head.lower() + "_tables"
+
+
+def _source_hash(gt):
+    """Return the hash of grammar file `gt` kept in its tables module."""
+    with open(gt, encoding="utf8") as f:
+        return hashlib.sha256(f.read().encode("utf8")).hexdigest()
+
+
 def load_grammar(gt="Grammar.txt", gp=None,
                  save=True, force=False, logger=None):
     """Load the grammar (maybe from a pickle)."""
@@ -162,6 +272,8 @@ def load_grammar(gt="Grammar.txt", gp=None,
         logger = logging.getLogger()
     gp = _generate_pickle_name(gt) if gp is None else gp
     if force or not _newer(gp, gt):
+        from . import pgen
+
         logger.info("Generating grammar tables from %s", gt)
         g = pgen.generate_grammar(gt)
         if save:
@@ -186,16 +298,39 @@ def _newer(a, b):
 
 
 def load_packaged_grammar(package, grammar_source, cache_dir=None):
-    """Normally, loads a pickled grammar by doing
+    """Normally, loads the grammar tables generated into a module of *package*
+    whose name is computed from *grammar_source* (see main()).  If
+    *grammar_source* is an extant file that changed since the module was
+    generated, the module is ignored.
+
+    If there is no such module, loads a pickled grammar by doing
         pkgutil.get_data(package, pickled_grammar)
     where *pickled_grammar* is computed from *grammar_source* by adding the
     Python version and using a ``.pickle`` extension.
 
-    However, if *grammar_source* is an extant file, load_grammar(grammar_source)
-    is called instead. This facilitates using a packaged grammar file when needed
-    but preserves load_grammar's automatic regeneration behavior when possible.
+    However, in that case, if *grammar_source* is an extant file,
+    load_grammar(grammar_source) is called instead. This facilitates using a
+    packaged grammar file when needed but preserves load_grammar's automatic
+    regeneration behavior when possible.
 
     """
+    try:
+        module = importlib.import_module(
+            "." + _generate_tables_name(grammar_source), package
+        )
+    except ImportError:
+        pass
+    else:
+        source_hash = getattr(module, "SOURCE_HASH", None)
+        if (not os.path.isfile(grammar_source) or
+                source_hash == _source_hash(grammar_source)):
+            g = grammar.Grammar()
+            g.load_tables(module.TABLES)
+            return g
+
+        logging.getLogger().info("%s is out of date, ignoring it",
+                                 module.__name__)
+
     if os.path.isfile(grammar_source):
         gp = _generate_pickle_name(grammar_source, cache_dir) if cache_dir else None
         return load_grammar(grammar_source, gp=gp)
@@ -207,16 +342,21 @@ def load_packaged_grammar(package, grammar_source, cache_dir=None):
 
 
 def main(*args):
-    """Main program, when run as a script: produce grammar pickle files.
+    """Main program, when run as a script: produce grammar table modules.
 
-    Calls load_grammar for each argument, a path to a grammar text file.
+    Calls load_grammar for each argument, a path to a grammar text file, and
+    writes the tables next to it, both as a pickle file and as the module
+    load_packaged_grammar looks for.
     """
     if not args:
         args = sys.argv[1:]
     logging.basicConfig(level=logging.INFO, stream=sys.stdout,
                         format='%(message)s')
     for gt in args:
-        load_grammar(gt, save=True, force=True)
+        g = load_grammar(gt, save=True, force=True)
+        gm = os.path.join(os.path.dirname(gt), _generate_tables_name(gt) + ".py")
+        logging.info("Writing grammar tables to %s", gm)
+        g.dump_module(gm, _source_hash(gt))
     return True
 
 if __name__ == "__main__":
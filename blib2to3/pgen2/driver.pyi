@@ -14,11 +14,17 @@ class Driver:
     grammar: Grammar
     logger: Logger
     convert: _Convert
-    def __init__(self, grammar: Grammar, convert: Optional[_Convert] = ..., logger: Optional[Logger] = ...) -> None: ...
+    collect_used_names: bool
+    track_changes: bool
+    def __init__(self, grammar: Grammar, convert: Optional[_Convert] = ..., logger: Optional[Logger] = ..., collect_used_names: bool = ..., track_changes: bool = ...) -> None: ...
     def parse_tokens(self, tokens: Iterable[Any], debug: bool = ...) -> _NL: ...
     def parse_stream_raw(self, stream: IO[Text], debug: bool = ...) -> _NL: ...
     def parse_stream(self, stream: IO[Text], debug: bool = ...) -> _NL: ...
     def parse_file(self, filename: _Path, encoding: Optional[Text] = ..., debug: bool = ...) -> _NL: ...
     def parse_string(self, text: Text, debug: bool = ...) -> _NL: ...
+    def _partially_consume_prefix(self, prefix: Text, column: int) -> Tuple[Text, Text]: ...
 
+def _generate_tables_name(gt: Text) -> Text: ...
+def _source_hash(gt: Text) -> Text: ...
 def load_grammar(gt: Text = ..., gp: Optional[Text] = ..., save: bool = ..., force: bool = ..., logger: Optional[Logger] = ...) -> Grammar: ...
+def load_packaged_grammar(package: Text, grammar_source: Text, cache_dir: Optional[_Path] = ...) -> Grammar: ...
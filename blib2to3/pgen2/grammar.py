@@ -31,8 +31,11 @@ class Grammar(object):
     The load() method reads the tables from a pickle file, which is
     much faster than the other ways offered by subclasses.  The pickle
     file is written by calling dump() (after loading the grammar
-    tables using a subclass).  The report() method prints a readable
-    representation of the tables to stdout, for debugging.
+    tables using a subclass).  The dump_module() method writes the same
+    tables as a Python module of literals instead, which does not depend
+    on the Python version and is loaded with load_tables().  The report()
+    method prints a readable representation of the tables to stdout, for
+    debugging.
 
     The instance variables are as follows:
 
@@ -71,6 +74,11 @@ class Grammar(object):
 
     tokens        -- a dict mapping token numbers to arc labels.
 
+    The parsing engine doesn't walk the DFAs directly; get_transitions()
+    derives a table of parser actions from them on first use.  It is not
+    written out by dump(), and it is shared with the grammars made by
+    without_keywords(), which refer to this one as their base.
+
     """
 
     def __init__(self):
@@ -83,21 +91,49 @@ class Grammar(object):
         self.tokens = {}
         self.symbol2label = {}
         self.start = 256
+        self.transitions = None
+        self.base = None
+
+    def tables(self):
+        """Return a dict of the grammar tables, made of builtin types only."""
+        return {
+            k: v
+            for k, v in self.__dict__.items()
+            if k not in ("transitions", "base")
+        }
+
+    def load_tables(self, tables):
+        """Load the grammar tables from a dict returned by tables()."""
+        self.__dict__.update(tables)
 
     def dump(self, filename):
         """Dump the grammar tables to a pickle file."""
         with open(filename, "wb") as f:
-            pickle.dump(self.__dict__, f, pickle.HIGHEST_PROTOCOL)
+            pickle.dump(self.tables(), f, pickle.HIGHEST_PROTOCOL)
+
+    def dump_module(self, filename, source_hash=None):
+        """Dump the grammar tables to a Python module defining TABLES.
+
+        The module also defines SOURCE_HASH, the hash of the grammar file the
+        tables were generated from, if given.
+        """
+        from pprint import pformat
+        with open(filename, "w", encoding="utf8") as f:
+            f.write(_MODULE_HEADER)
+            if source_hash is not None:
+                f.write("SOURCE_HASH = %r\n" % source_hash)
+            f.write("TABLES = ")
+            f.write(pformat(self.tables()))
+            f.write("\n")
 
     def load(self, filename):
         """Load the grammar tables from a pickle file."""
         with open(filename, "rb") as f:
-            d = pickle.load(f)
-        self.__dict__.update(d)
+            self.load_tables(pickle.load(f))
 
     def loads(self, pkl):
         """Load the grammar tables from a pickle bytes object."""
-        self.__dict__.update(pickle.loads(pkl))
+        self.load_tables(pickle.loads(pkl))
 
     def copy(self):
         """
@@ -112,6 +148,53 @@ class Grammar(object):
         new.start = self.start
         return new
 
+    def without_keywords(self, *names):
+        """Return a grammar in which `names` are plain names, not keywords.
+
+        Unlike copy(), the new grammar shares the tables with this one,
+        including the parser action tables of get_transitions().  Only the
+        keywords dict is its own.
+        """
+        new = self.__class__.__new__(self.__class__)
+        new.__dict__.update(self.__dict__)
+        new.keywords = {k: v for k, v in self.keywords.items() if k not in names}
+        new.base = self if self.base is None else self.base
+        return new
+
+    def get_transitions(self):
+        """Return the parser action tables, computing them on first use.
+
+        The result maps every symbol number to a list indexed by DFA state.
+        Each state is an (actions, accepting, accept_only) tuple: actions
+        maps labels to (symbol, newstate) pairs, where symbol is 0 to shift
+        a token or the number of the nonterminal to push; accepting tells
+        whether the state may be popped, and accept_only whether it must
+        be.  Labels are resolved in arc order, like a scan of the arcs with
+        the first sets of nonterminals would.
+        """
+        if self.transitions is None and self.base is not None:
+            self.transitions = self.base.get_transitions()
+        if self.transitions is None:
+            transitions = {}
+            for symbol, (states, first) in self.dfas.items():
+                table = []
+                for state, arcs in enumerate(states):
+                    actions = {}
+                    for i, newstate in arcs:
+                        t = self.labels[i][0]
+                        if t < 256:
+                            if i:
+                                actions.setdefault(i, (0, newstate))
+                        else:
+                            for ilabel in self.dfas[t][1]:
+                                actions.setdefault(ilabel, (t, newstate))
+                    table.append((actions,
+                                  (0, state) in arcs,
+                                  arcs == [(0, state)]))
+                transitions[symbol] = table
+            self.transitions = transitions
+        return self.transitions
+
     def report(self):
         """Dump the grammar tables to standard output, for debugging."""
         from pprint import pprint
@@ -128,6 +211,13 @@ class Grammar(object):
         print("start", self.start)
 
 
+_MODULE_HEADER = '''\
+# Generated by blib2to3/pgen2/driver.py from the grammar file, do not edit.
+# Regenerate with: python -m blib2to3.pgen2.driver blib2to3/*Grammar.txt
+
+'''
+
+
 # Map from operator to number (since tokenize doesn't do this)
 
 opmap_raw = """
@@ -8,6 +8,9 @@ _P = TypeVar('_P')
 _Label = Tuple[int, Optional[Text]]
 _DFA = List[List[Tuple[int, int]]]
 _DFAS = Tuple[_DFA, Dict[int, int]]
+_Actions = Dict[int, Tuple[int, int]]
+_Table = List[Tuple[_Actions, bool, bool]]
+_Transitions = Dict[int, _Table]
 
 class Grammar:
     symbol2number: Dict[Text, int]
@@ -19,10 +22,18 @@ class Grammar:
     tokens: Dict[int, int]
     symbol2label: Dict[Text, int]
     start: int
+    transitions: Optional[_Transitions]
+    base: Optional[Grammar]
     def __init__(self) -> None: ...
+    def tables(self) -> Dict[Text, Any]: ...
+    def load_tables(self, tables: Dict[Text, Any]) -> None: ...
     def dump(self, filename: _Path) -> None: ...
+    def dump_module(self, filename: _Path, source_hash: Optional[Text] = ...) -> None: ...
     def load(self, filename: _Path) -> None: ...
+    def loads(self, pkl: bytes) -> None: ...
     def copy(self: _P) -> _P: ...
+    def without_keywords(self: _P, *names: Text) -> _P: ...
+    def get_transitions(self) -> _Transitions: ...
     def report(self) -> None: ...
 
 opmap_raw: Text
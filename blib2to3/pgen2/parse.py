@@ -12,6 +12,7 @@ how this parsing engine works.
 
 # Local imports
 from . import token
+from .. import pytree
 
 class ParseError(Exception):
     """Exception to signal the parser is stuck."""
@@ -54,7 +55,8 @@ class Parser(object):
 
     """
 
-    def __init__(self, grammar, convert=None):
+    def __init__(self, grammar, convert=None, collect_used_names=True,
+                 track_changes=True):
         """Constructor.
 
         The grammar argument is a grammar.Grammar instance; see the
@@ -82,9 +84,22 @@ class Parser(object):
         An abstract syntax tree node may be anything; this is entirely
         up to the converter function.
 
+        If the converter is pytree.convert, the parser creates the pytree
+        Leaf and Node objects itself, the way convert() would, without
+        going through concrete syntax tree tuples for tokens.
+
+        Unless collect_used_names is false, the set of all NAME tokens seen
+        is made available as the used_names attribute of the root node.
+
+        If track_changes is false, the pytree nodes the parser creates
+        itself do not track changes; see pytree.Base.changed().
+
         """
         self.grammar = grammar
         self.convert = convert or (lambda grammar, node: node)
+        self.build_tree = convert is pytree.convert
+        self.collect_used_names = collect_used_names
+        self.track_changes = track_changes
 
     def setup(self, start=None):
         """Prepare for parsing.
@@ -101,68 +116,70 @@ class Parser(object):
         """
         if start is None:
             start = self.grammar.start
-        # Each stack entry is a tuple: (dfa, state, node).
+        self.transitions = self.grammar.get_transitions()
+        # Each stack entry is a tuple: (table, state, node), where table is
+        # the list of per-state actions for the node's symbol; see
+        # Grammar.get_transitions().
         # A node is a tuple: (type, value, context, children),
         # where children is a list of nodes or None, and context may be None.
         newnode = (start, None, None, [])
-        stackentry = (self.grammar.dfas[start], 0, newnode)
+        stackentry = (self.transitions[start], 0, newnode)
         self.stack = [stackentry]
         self.rootnode = None
-        self.used_names = set() # Aliased to self.rootnode.used_names in pop()
+        # Aliased to self.rootnode.used_names in pop()
+        self.used_names = set() if self.collect_used_names else None
 
-    def addtoken(self, type, value, context):
-        """Add a token; return True iff this is the end of the program."""
+    def addtoken(self, type, value, context, comments=None):
+        """Add a token; return True iff this is the end of the program.
+
+        If given, comments holds the (start, end) offsets of the comments in
+        the prefix of the token, which end up on its pytree.Leaf.
+        """
         # Map from token to label
         ilabel = self.classify(type, value, context)
         # Loop until the token is shifted; may raise exceptions
         while True:
-            dfa, state, node = self.stack[-1]
-            states, first = dfa
-            arcs = states[state]
-            # Look for a state with this label
-            for i, newstate in arcs:
-                t, v = self.grammar.labels[i]
-                if ilabel == i:
-                    # Look it up in the list of labels
-                    assert t < 256
-                    # Shift a token; we're done with it
-                    self.shift(type, value, newstate, context)
-                    # Pop while we are in an accept-only state
-                    state = newstate
-                    while states[state] == [(0, state)]:
-                        self.pop()
-                        if not self.stack:
-                            # Done parsing!
-                            return True
-                        dfa, state, node = self.stack[-1]
-                        states, first = dfa
-                    # Done with this token
-                    return False
-                elif t >= 256:
-                    # See if it's a symbol and if we're in its first set
-                    itsdfa = self.grammar.dfas[t]
-                    itsstates, itsfirst = itsdfa
-                    if ilabel in itsfirst:
-                        # Push a symbol
-                        self.push(t, self.grammar.dfas[t], newstate, context)
-                        break # To continue the outer while loop
-            else:
-                if (0, state) in arcs:
+            table, state, node = self.stack[-1]
+            actions, accepting, accept_only = table[state]
+            action = actions.get(ilabel)
+            if action is None:
+                if accepting:
                     # An accepting state, pop it and try something else
                     self.pop()
                     if not self.stack:
                         # Done parsing, but another token is input
                         raise ParseError("too much input",
                                          type, value, context)
-                else:
-                    # No success finding a transition
-                    raise ParseError("bad input", type, value, context)
+                    continue
+
+                # No success finding a transition
+                raise ParseError("bad input", type, value, context)
+
+            symbol, newstate = action
+            if symbol:
+                # Push a symbol and continue with its table
+                self.push(symbol, self.transitions[symbol], newstate, context)
+                continue
+
+            # Shift a token; we're done with it
+            self.shift(type, value, newstate, context, comments)
+            # Pop while we are in an accept-only state
+            state = newstate
+            while table[state][2]:
+                self.pop()
+                if not self.stack:
+                    # Done parsing!
+                    return True
+                table, state, node = self.stack[-1]
+            # Done with this token
+            return False
 
     def classify(self, type, value, context):
         """Turn a token into a label.  (Internal)"""
         if type == token.NAME:
             # Keep a listing of all used names
-            self.used_names.add(value)
+            if self.used_names is not None:
+                self.used_names.add(value)
             # Check for reserved words
             ilabel = self.grammar.keywords.get(value)
             if ilabel is not None:
@@ -172,30 +189,50 @@ class Parser(object):
             raise ParseError("bad token", type, value, context)
         return ilabel
 
-    def shift(self, type, value, newstate, context):
+    def shift(self, type, value, newstate, context, comments=None):
         """Shift a token.  (Internal)"""
-        dfa, state, node = self.stack[-1]
-        newnode = (type, value, context, None)
-        newnode = self.convert(self.grammar, newnode)
-        if newnode is not None:
+        table, state, node = self.stack[-1]
+        if self.build_tree:
+            newnode = pytree.Leaf(type, value, context=context,
+                                  comments=comments)
+            if not self.track_changes:
+                newnode.was_changed = None
             node[-1].append(newnode)
-        self.stack[-1] = (dfa, newstate, node)
+        else:
+            newnode = (type, value, context, None)
+            newnode = self.convert(self.grammar, newnode)
+            if newnode is not None:
+                node[-1].append(newnode)
+        self.stack[-1] = (table, newstate, node)
 
-    def push(self, type, newdfa, newstate, context):
+    def push(self, type, newtable, newstate, context):
         """Push a nonterminal.  (Internal)"""
-        dfa, state, node = self.stack[-1]
+        table, state, node = self.stack[-1]
         newnode = (type, None, context, [])
-        self.stack[-1] = (dfa, newstate, node)
-        self.stack.append((newdfa, 0, newnode))
+        self.stack[-1] = (table, newstate, node)
+        self.stack.append((newtable, 0, newnode))
 
     def pop(self):
         """Pop a nonterminal.  (Internal)"""
-        popdfa, popstate, popnode = self.stack.pop()
-        newnode = self.convert(self.grammar, popnode)
+        poptable, popstate, popnode = self.stack.pop()
+        if self.build_tree:
+            type, value, context, children = popnode
+            if len(children) == 1:
+                # Collapse nodes with a single child, like pytree.convert()
+                newnode = children[0]
+            else:
+                newnode = pytree.Node(type, children, context=context)
+                if not self.track_changes:
+                    newnode.was_changed = None
+        else:
+            newnode = self.convert(self.grammar, popnode)
         if newnode is not None:
             if self.stack:
-                dfa, state, node = self.stack[-1]
+                table, state, node = self.stack[-1]
                 node[-1].append(newnode)
             else:
                 self.rootnode = newnode
-                self.rootnode.used_names = self.used_names
+                # A Leaf is only the root of an empty file, without names.
+                if self.used_names is not None and not isinstance(
+                        newnode, pytree.Leaf):
+                    self.rootnode.used_names = self.used_names
@@ -2,8 +2,8 @@
 
 from typing import Any, Dict, List, Optional, Sequence, Set, Text, Tuple
 
-from blib2to3.pgen2.grammar import Grammar, _DFAS
-from blib2to3.pytree import _NL, _Convert, _RawNode
+from blib2to3.pgen2.grammar import Grammar, _Table, _Transitions
+from blib2to3.pytree import _NL, _Comments, _Convert, _RawNode
 
 _Context = Sequence[Any]
 
@@ -17,13 +17,17 @@ class ParseError(Exception):
 class Parser:
     grammar: Grammar
     convert: _Convert
-    stack: List[Tuple[_DFAS, int, _RawNode]]
+    build_tree: bool
+    collect_used_names: bool
+    track_changes: bool
+    transitions: _Transitions
+    stack: List[Tuple[_Table, int, _RawNode]]
     rootnode: Optional[_NL]
-    used_names: Set[Text]
-    def __init__(self, grammar: Grammar, convert: Optional[_Convert] = ...) -> None: ...
+    used_names: Optional[Set[Text]]
+    def __init__(self, grammar: Grammar, convert: Optional[_Convert] = ..., collect_used_names: bool = ..., track_changes: bool = ...) -> None: ...
     def setup(self, start: Optional[int] = ...) -> None: ...
-    def addtoken(self, type: int, value: Optional[Text], context: _Context) -> bool: ...
+    def addtoken(self, type: int, value: Optional[Text], context: _Context, comments: Optional[_Comments] = ...) -> bool: ...
     def classify(self, type: int, value: Optional[Text], context: _Context) -> int: ...
-    def shift(self, type: int, value: Optional[Text], newstate: int, context: _Context) -> None: ...
-    def push(self, type: int, newdfa: _DFAS, newstate: int, context: _Context) -> None: ...
+    def shift(self, type: int, value: Optional[Text], newstate: int, context: _Context, comments: Optional[_Comments] = ...) -> None: ...
+    def push(self, type: int, newtable: _Table, newstate: int, context: _Context) -> None: ...
     def pop(self) -> None: ...
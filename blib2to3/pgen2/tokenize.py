@@ -14,6 +14,12 @@ repeatedly to get the next line of input (or "" for EOF).  It generates
     the ending (row, column) indices of the token (a 2-tuple of ints)
     the original line (string)
 
+generate_tokens_from_string(text) produces the same 5-tuples for a source
+that is already in memory as a single string.  Instead of pulling lines
+through a readline-like callable it keeps one position cursor across the
+whole buffer, which is cheaper for large inputs.  tokenize_string(text)
+returns the same tokens stored compactly in a TokenBuffer.
+
 It is designed to match the working of the Python tokenizer exactly, except
 that it produces COMMENT tokens for comments and gives type OP for all
 operators
@@ -30,12 +36,14 @@ __credits__ = \
     'GvR, ESR, Tim Peters, Thomas Wouters, Fred Drake, Skip Montanaro'
 
 import re
+from array import array
 from codecs import BOM_UTF8, lookup
 from blib2to3.pgen2.token import *
 
 from . import token
 __all__ = [x for x in dir(token) if x[0] != '_'] + ["tokenize",
-           "generate_tokens", "untokenize"]
+           "generate_tokens", "generate_tokens_from_string",
+           "tokenize_string", "TokenBuffer", "untokenize"]
 del token
 
 try:
@@ -107,8 +115,17 @@ ContStr = group(_litprefix + r"'[^\n'\\]*(?:\\.[^\n'\\]*)*" +
 PseudoExtras = group(r'\\\r?\n', Comment, Triple)
 PseudoToken = Whitespace + group(PseudoExtras, Number, Funny, ContStr, Name)
 
+# The same tokens as PseudoToken, with the most common ones tried first:
+# names that are not string prefixes, then operators, brackets and periods
+# that do not start a number.
+FastPseudoToken = Whitespace + group(r"[^\W\d]\w*(?![\w'\"])",
+                                     Operator, Bracket, r'\r?\n', r'[:;,`@]',
+                                     r'\.(?!\d)', PseudoExtras, Number,
+                                     ContStr, Name)
+
 tokenprog = re.compile(Token, re.UNICODE)
 pseudoprog = re.compile(PseudoToken, re.UNICODE)
+fastpseudoprog = re.compile(FastPseudoToken, re.UNICODE)
 single3prog = re.compile(Single3)
 double3prog = re.compile(Double3)
 
@@ -352,7 +369,10 @@ def generate_tokens(readline):
     """
     lnum = parenlev = continued = 0
     numchars = '0123456789'
-    contstr, needcont = '', 0
+    # Pieces of a continued string and of the lines it spans are collected
+    # in lists and joined once, at the closing quote.  Concatenating them
+    # line by line makes long multi-line strings quadratic.
+    contstr, needcont = [], 0
     contline = None
     indents = [0]
 
@@ -376,19 +396,22 @@ def generate_tokens(readline):
             endmatch = endprog.match(line)
             if endmatch:
                 pos = end = endmatch.end(0)
-                yield (STRING, contstr + line[:end],
-                       strstart, (lnum, end), contline + line)
-                contstr, needcont = '', 0
+                contstr.append(line[:end])
+                contline.append(line)
+                yield (STRING, ''.join(contstr),
+                       strstart, (lnum, end), ''.join(contline))
+                contstr, needcont = [], 0
                 contline = None
             elif needcont and line[-2:] != '\\\n' and line[-3:] != '\\\r\n':
-                yield (ERRORTOKEN, contstr + line,
-                           strstart, (lnum, len(line)), contline)
-                contstr = ''
+                contstr.append(line)
+                yield (ERRORTOKEN, ''.join(contstr),
+                           strstart, (lnum, len(line)), ''.join(contline))
+                contstr = []
                 contline = None
                 continue
             else:
-                contstr = contstr + line
-                contline = contline + line
+                contstr.append(line)
+                contline.append(line)
                 continue
 
         elif parenlev == 0 and not continued:  # new statement
@@ -486,8 +509,8 @@ def generate_tokens(readline):
                         yield (STRING, token, spos, (lnum, pos), line)
                     else:
                         strstart = (lnum, start)           # multiple lines
-                        contstr = line[start:]
-                        contline = line
+                        contstr = [line[start:]]
+                        contline = [line]
                         break
                 elif initial in single_quoted or \
                     token[:2] in single_quoted or \
@@ -496,8 +519,8 @@ def generate_tokens(readline):
                         strstart = (lnum, start)
                         endprog = (endprogs[initial] or endprogs[token[1]] or
                                    endprogs[token[2]])
-                        contstr, needcont = line[start:], 1
-                        contline = line
+                        contstr, needcont = [line[start:]], 1
+                        contline = [line]
                         break
                     else:                                  # ordinary string
                         if stashed:
@@ -561,6 +584,341 @@ def generate_tokens(readline):
         yield (DEDENT, '', (lnum, 0), (lnum, 0), '')
     yield (ENDMARKER, '', (lnum, 0), (lnum, 0), '')
 
+class TokenBuffer(object):
+    """A compact, column-oriented sequence of tokens over a single source.
+
+    Instead of one 5-tuple per token, token types, absolute start and end
+    offsets and row numbers are stored in parallel arrays.  Token strings
+    and line text are sliced out of `source` only when asked for.  Indexing
+    and iteration still produce the 5-tuples generate_tokens() would, for
+    compatibility.
+
+    If tokenizing stopped early, `error` holds the exception to raise after
+    the last token; see tokenize_string().
+    """
+
+    def __init__(self, source):
+        self.source = source
+        self.error = None
+        self.types = array('B')
+        self.starts = array('q')
+        self.ends = array('q')
+        self.srows = array('l')
+        self.erows = array('l')
+        # offset of the first character of every physical line, by row - 1
+        self.row_offsets = array('q')
+
+    def extend(self, tokens):
+        """Append tokens given as a flat list of (type, start, end, srow,
+        erow) runs.
+
+        The tokenizer collects them in one list and hands them over in one
+        go, which is a lot cheaper than appending to every array per token.
+        """
+        self.types.extend(tokens[0::5])
+        self.starts.extend(tokens[1::5])
+        self.ends.extend(tokens[2::5])
+        self.srows.extend(tokens[3::5])
+        self.erows.extend(tokens[4::5])
+
+    def __len__(self):
+        return len(self.types)
+
+    def value(self, i):
+        return self.source[self.starts[i]:self.ends[i]]
+
+    def start(self, i):
+        srow = self.srows[i]
+        return srow, self.starts[i] - self.row_offsets[srow - 1]
+
+    def end(self, i):
+        erow = self.erows[i]
+        return erow, self.ends[i] - self.row_offsets[erow - 1]
+
+    def line(self, i):
+        return self._line(self.types[i], self.srows[i], self.erows[i])
+
+    def _line(self, type, srow, erow):
+        row_offsets = self.row_offsets
+        if erow >= len(row_offsets):
+            return ''  # DEDENT and ENDMARKER at the end of the source
+
+        if type == ERRORTOKEN and srow != erow:
+            # an unterminated continued string: generate_tokens() reports
+            # the lines before the one it gave up on
+            erow -= 1
+        return self.source[row_offsets[srow - 1]:row_offsets[erow]]
+
+    def __getitem__(self, i):
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError("token index out of range")
+        return (self.types[i], self.value(i), self.start(i), self.end(i),
+                self.line(i))
+
+    def __iter__(self):
+        source = self.source
+        row_offsets = self.row_offsets.tolist()
+        line_row = line = None
+        for type, start, end, srow, erow in zip(self.types, self.starts,
+                                                self.ends, self.srows,
+                                                self.erows):
+            if srow != line_row or srow != erow:
+                line = self._line(type, srow, erow)
+                line_row = srow if srow == erow else None
+            yield (type, source[start:end],
+                   (srow, start - row_offsets[srow - 1]),
+                   (erow, end - row_offsets[erow - 1]), line)
+        self.raise_error()
+
+    def raise_error(self):
+        """Raise the error that stopped tokenizing, if any."""
+        if self.error is not None:
+            raise self.error.with_traceback(None)
+
+def tokenize_string(text):
+    """
+    The tokenize_string() function requires one argument, the entire source
+    as a string, and returns a TokenBuffer holding all of its tokens.  The
+    tokens are exactly those generate_tokens() would produce when called
+    with io.StringIO(text).readline.
+
+    Rather than slicing each physical line out of a stream and re-matching
+    from its start, the regular expressions are run over the whole buffer,
+    bounded by the end of the current line.  Positions are tracked as
+    absolute offsets into `text`; columns are derived from the offsets of
+    the line starts recorded in the buffer.
+
+    If the source cannot be tokenized, the buffer holds the tokens found
+    before the problem and the exception is stored as its `error`.  It is
+    raised by whoever consumes the buffer past its last token, which is
+    where generate_tokens() would have raised it.
+    """
+    tokens = TokenBuffer(text)
+    found = []
+    try:
+        _tokenize_into(tokens, found.extend)
+    except (TokenError, IndentationError) as e:
+        tokens.error = e
+    tokens.extend(found)
+    return tokens
+
+def _tokenize_into(tokens, add):
+    text = tokens.source
+    row_offsets = tokens.row_offsets
+    lnum = parenlev = continued = 0
+    numchars = '0123456789'
+    contstart, needcont = None, 0   # absolute offset of a continued string
+    indents = [0]
+    text_len = len(text)
+    lstart = max = 0                # bounds of the current physical line
+
+    # 'stashed' and 'async_*' are used for async/await parsing
+    stashed = None
+    async_def = False
+    async_def_indent = 0
+    async_def_nl = False
+
+    while 1:                                   # loop over lines in buffer
+        lstart = max
+        if lstart < text_len:
+            max = text.find('\n', lstart) + 1 or text_len
+        line = text[lstart:max]
+        lnum = lnum + 1
+        row_offsets.append(lstart)
+        pos = lstart
+
+        if contstart is not None:              # continued string
+            if not line:
+                raise TokenError("EOF in multi-line string", strstart)
+            endmatch = endprog.match(text, lstart, max)
+            if endmatch:
+                pos = end = endmatch.end(0)
+                add((STRING, contstart, end, strstart[0], lnum))
+                contstart, needcont = None, 0
+            elif needcont and line[-2:] != '\\\n' and line[-3:] != '\\\r\n':
+                add((ERRORTOKEN, contstart, max, strstart[0], lnum))
+                contstart = None
+                continue
+            else:
+                continue
+
+        elif parenlev == 0 and not continued:  # new statement
+            if not line: break
+            column = 0
+            while pos < max:                   # measure leading whitespace
+                if text[pos] == ' ': column = column + 1
+                elif text[pos] == '\t': column = (column//tabsize + 1)*tabsize
+                elif text[pos] == '\f': column = 0
+                else: break
+                pos = pos + 1
+            if pos == max: break
+
+            if stashed:
+                add(stashed)
+                stashed = None
+
+            if text[pos] in '\r\n':            # skip blank lines
+                add((NL, pos, max, lnum, lnum))
+                continue
+
+            if text[pos] == '#':               # skip comments
+                nl_pos = pos + len(text[pos:max].rstrip('\r\n'))
+                add((COMMENT, pos, nl_pos, lnum, lnum))
+                add((NL, nl_pos, max, lnum, lnum))
+                continue
+
+            if column > indents[-1]:           # count indents
+                indents.append(column)
+                add((INDENT, lstart, pos, lnum, lnum))
+
+            while column < indents[-1]:        # count dedents
+                if column not in indents:
+                    raise IndentationError(
+                        "unindent does not match any outer indentation level",
+                        ("<tokenize>", lnum, pos - lstart, line))
+                indents = indents[:-1]
+
+                if async_def and async_def_indent >= indents[-1]:
+                    async_def = False
+                    async_def_nl = False
+                    async_def_indent = 0
+
+                add((DEDENT, pos, pos, lnum, lnum))
+
+            if async_def and async_def_nl and async_def_indent >= indents[-1]:
+                async_def = False
+                async_def_nl = False
+                async_def_indent = 0
+
+        else:                                  # continued statement
+            if not line:
+                raise TokenError("EOF in multi-line statement", (lnum, 0))
+            continued = 0
+
+        while pos < max:
+            pseudomatch = fastpseudoprog.match(text, pos, max)
+            if pseudomatch:                                # scan for tokens
+                start, end = pseudomatch.span(1)
+                pos = end
+                token, initial = text[start:end], text[start]
+
+                # Names and operators are the most common tokens, so they
+                # are tested for early.  They are told apart from strings,
+                # which may start with a prefix, by their last character.
+                if initial.isidentifier() and token[-1] not in '\'"\n':
+                    if token in ('async', 'await'):
+                        if async_def:
+                            add((ASYNC if token == 'async' else AWAIT,
+                                 start, end, lnum, lnum))
+                            continue
+
+                    tok = (NAME, start, end, lnum, lnum)
+                    if token == 'async' and not stashed:
+                        stashed = tok
+                        continue
+
+                    if token == 'def':
+                        if (stashed
+                                and stashed[0] == NAME
+                                and text[stashed[1]:stashed[2]] == 'async'):
+
+                            async_def = True
+                            async_def_indent = indents[-1]
+
+                            add((ASYNC,) + stashed[1:])
+                            stashed = None
+
+                    if stashed:
+                        add(stashed)
+                        stashed = None
+
+                    add(tok)
+                elif initial in numchars or \
+                   (initial == '.' and token != '.'):      # ordinary number
+                    add((NUMBER, start, end, lnum, lnum))
+                elif initial in '\r\n':
+                    newline = NEWLINE
+                    if parenlev > 0:
+                        newline = NL
+                    elif async_def:
+                        async_def_nl = True
+                    if stashed:
+                        add(stashed)
+                        stashed = None
+                    add((newline, start, end, lnum, lnum))
+
+                elif initial == '#':
+                    assert not token.endswith("\n")
+                    if stashed:
+                        add(stashed)
+                        stashed = None
+                    add((COMMENT, start, end, lnum, lnum))
+                elif initial == '\\':                      # continued stmt
+                    # This yield is new; needed for better idempotency:
+                    if stashed:
+                        add(stashed)
+                        stashed = None
+                    add((NL, start, pos, lnum, lnum))
+                    continued = 1
+                elif token[-1] not in '\'"\n':    # operators and brackets
+                    if initial in '([{': parenlev = parenlev + 1
+                    elif initial in ')]}': parenlev = parenlev - 1
+                    if stashed:
+                        add(stashed)
+                        stashed = None
+                    add((OP, start, end, lnum, lnum))
+                elif token in triple_quoted:
+                    endprog = endprogs[token]
+                    endmatch = endprog.match(text, pos, max)
+                    if endmatch:                           # all on one line
+                        pos = endmatch.end(0)
+                        if stashed:
+                            add(stashed)
+                            stashed = None
+                        add((STRING, start, pos, lnum, lnum))
+                    else:
+                        strstart = (lnum, start - lstart)  # multiple lines
+                        contstart = start
+                        break
+                elif initial in single_quoted or \
+                    token[:2] in single_quoted or \
+                    token[:3] in single_quoted:
+                    if token[-1] == '\n':                  # continued string
+                        strstart = (lnum, start - lstart)
+                        endprog = (endprogs[initial] or endprogs[token[1]] or
+                                   endprogs[token[2]])
+                        contstart, needcont = start, 1
+                        break
+                    else:                                  # ordinary string
+                        if stashed:
+                            add(stashed)
+                            stashed = None
+                        add((STRING, start, end, lnum, lnum))
+            else:
+                add((ERRORTOKEN, pos, pos + 1, lnum, lnum))
+                pos = pos + 1
+
+    if stashed:
+        add(stashed)
+        stashed = None
+
+    eof = row_offsets[lnum - 1]
+    for indent in indents[1:]:                 # pop remaining indent levels
+        add((DEDENT, eof, eof, lnum, lnum))
+    add((ENDMARKER, eof, eof, lnum, lnum))
+
+def generate_tokens_from_string(text):
+    """
+    The generate_tokens_from_string() function requires one argument, the
+    entire source as a string.  It produces exactly the same 5-tuples as
+    generate_tokens() called with io.StringIO(text).readline.
+
+    The whole source is tokenized up front by tokenize_string().
+    """
+    return iter(tokenize_string(text))
+
 if __name__ == '__main__':                     # testing
     import sys
     if len(sys.argv) > 1: tokenize(open(sys.argv[1]).readline)
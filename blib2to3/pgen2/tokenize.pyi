@@ -1,7 +1,8 @@
 # Stubs for lib2to3.pgen2.tokenize (Python 3.6)
 # NOTE: Only elements from __all__ are present.
 
-from typing import Callable, Iterable, Iterator, List, Text, Tuple
+from array import array
+from typing import Callable, Iterable, Iterator, List, Optional, Text, Tuple
 from blib2to3.pgen2.token import *  # noqa
 
 
@@ -28,3 +29,26 @@ def untokenize(iterable: Iterable[_TokenInfo]) -> Text: ...
 def generate_tokens(
     readline: Callable[[], Text]
 ) -> Iterator[_TokenInfo]: ...
+def generate_tokens_from_string(text: Text) -> Iterator[_TokenInfo]: ...
+
+class TokenBuffer:
+    source: Text
+    types: array[int]
+    starts: array[int]
+    ends: array[int]
+    srows: array[int]
+    erows: array[int]
+    row_offsets: array[int]
+    error: Optional[Exception]
+    def __init__(self, source: Text) -> None: ...
+    def extend(self, tokens: List[int]) -> None: ...
+    def __len__(self) -> int: ...
+    def value(self, i: int) -> Text: ...
+    def start(self, i: int) -> _Coord: ...
+    def end(self, i: int) -> _Coord: ...
+    def line(self, i: int) -> Text: ...
+    def __getitem__(self, i: int) -> _TokenInfo: ...
+    def __iter__(self) -> Iterator[_TokenInfo]: ...
+    def raise_error(self) -> None: ...
+
+def tokenize_string(text: Text) -> TokenBuffer: ...
@@ -5,6 +5,7 @@
 
 # Python imports
 import os
+import sys
 
 # Local imports
 from .pgen2 import token
@@ -17,6 +18,9 @@ _PATTERN_GRAMMAR_FILE = os.path.join(os.path.dirname(__file__),
                                      "PatternGrammar.txt")
 
 
+_cache_dir = None
+
+
 class Symbols(object):
 
     def __init__(self, grammar):
@@ -30,12 +34,19 @@ class Symbols(object):
 
 
 def initialize(cache_dir=None):
+    """Load the Python grammar and make the variants of it.
+
+    The variants only differ in keywords and share the tables of
+    `python_grammar`, so they cost next to nothing to make.  On Python 3.7+
+    the pattern grammar is not loaded here; see initialize_pattern_grammar().
+    """
     global python_grammar
     global python_grammar_no_print_statement
     global python_grammar_no_print_statement_no_exec_statement
     global python_symbols
-    global pattern_grammar
-    global pattern_symbols
+    global _cache_dir
+
+    _cache_dir = cache_dir
 
     # Python 2
     python_grammar = driver.load_packaged_grammar("blib2to3", _GRAMMAR_FILE,
@@ -44,14 +55,34 @@ def initialize(cache_dir=None):
     python_symbols = Symbols(python_grammar)
 
     # Python 2 + from __future__ import print_function
-    python_grammar_no_print_statement = python_grammar.copy()
-    del python_grammar_no_print_statement.keywords["print"]
+    python_grammar_no_print_statement = python_grammar.without_keywords("print")
 
     # Python 3
-    python_grammar_no_print_statement_no_exec_statement = python_grammar.copy()
-    del python_grammar_no_print_statement_no_exec_statement.keywords["print"]
-    del python_grammar_no_print_statement_no_exec_statement.keywords["exec"]
+    python_grammar_no_print_statement_no_exec_statement = (
+        python_grammar.without_keywords("print", "exec"))
+
+    if sys.version_info < (3, 7):
+        # No module __getattr__ (PEP 562) to load it on first access.
+        initialize_pattern_grammar(cache_dir)
+
+
+def initialize_pattern_grammar(cache_dir=None):
+    """Load the grammar of lib2to3 fixer patterns.
+
+    On Python 3.7+ this happens on first access to `pattern_grammar` or
+    `pattern_symbols`.
+    """
+    global pattern_grammar
+    global pattern_symbols
 
     pattern_grammar = driver.load_packaged_grammar("blib2to3", _PATTERN_GRAMMAR_FILE,
                                                    cache_dir)
     pattern_symbols = Symbols(pattern_grammar)
+
+
+def __getattr__(name):
+    if name in ("pattern_grammar", "pattern_symbols"):
+        initialize_pattern_grammar(_cache_dir)
+        return globals()[name]
+
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
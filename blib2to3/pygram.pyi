@@ -121,4 +121,5 @@ python_grammar_no_print_statement_no_exec_statement: Grammar
 python_grammar_no_exec_statement: Grammar
 pattern_grammar: Grammar
 
-def initialize(cache_dir: Union[str, os.PathLike, None]) -> None: ...
+def initialize(cache_dir: Union[str, os.PathLike, None] = ...) -> None: ...
+def initialize_pattern_grammar(cache_dir: Union[str, os.PathLike, None] = ...) -> None: ...
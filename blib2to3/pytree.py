@@ -17,6 +17,10 @@ from io import StringIO
 
 HUGE = 0x7FFFFFFF  # maximum repeat count, default max
 
+# How many times the prefix or value of a leaf was set after it was made.
+# Text rendered from leaves earlier is stale if this has changed since.
+leaf_edits = 0
+
 _type_reprs = {}
 def type_repr(type_num):
     global _type_reprs
@@ -37,14 +41,17 @@ class Base(object):
     template pattern.
 
     A node may be a subnode of at most one parent.
+
+    Nodes and leaves use __slots__ since a tree holds a lot of them.  The
+    bookkeeping of lib2to3 fixers (fixers_applied, was_checked) is gone.
     """
 
-    # Default values for instance variables
-    type = None    # int: token number (< 256) or symbol number (>= 256)
-    parent = None  # Parent node pointer, or None
-    children = ()  # Tuple of subnodes
-    was_changed = False
-    was_checked = False
+    __slots__ = (
+        "type",         # int: token number (< 256) or symbol number (>= 256)
+        "parent",       # Parent node pointer, or None
+        "was_changed",  # None if the node does not track changes, see changed()
+        "_index",       # Position in parent.children, see _position()
+    )
 
     def __new__(cls, *args, **kwds):
         """Constructor that prevents Base from being instantiated."""
@@ -82,6 +89,14 @@ class Base(object):
         """
         raise NotImplementedError
 
+    def render(self):
+        """
+        Return the source code of the node and its descendants.
+
+        This must be implemented by the concrete subclass.
+        """
+        raise NotImplementedError
+
     def post_order(self):
         """
         Return a post-order iterator for the tree.
@@ -117,7 +132,7 @@ class Base(object):
         assert found, (self.children, self, new)
         self.parent.children = l_children
         self.parent.changed()
-        self.parent.invalidate_sibling_maps()
+        self.parent.update_sibling_maps()
         for x in new:
             x.parent = self.parent
         self.parent = None
@@ -132,7 +147,14 @@ class Base(object):
         return node.lineno
 
     def changed(self):
-        if self.was_changed:
+        """
+        Mark the invocant and its ancestors as changed.
+
+        Nodes made by a parser with track_changes=False have was_changed set
+        to None instead of False, which makes this return at once: neither
+        they nor their ancestors get marked.
+        """
+        if self.was_changed is not False:
             return
         if self.parent:
             self.parent.changed()
@@ -144,13 +166,27 @@ class Base(object):
         parent's children before it was removed.
         """
         if self.parent:
-            for i, node in enumerate(self.parent.children):
-                if node is self:
-                    del self.parent.children[i]
-                    self.parent.changed()
-                    self.parent.invalidate_sibling_maps()
-                    self.parent = None
-                    return i
+            i = self._position()
+            del self.parent.children[i]
+            self.parent.changed()
+            self.parent.update_sibling_maps(i)
+            self.parent = None
+            return i
+
+    def _position(self):
+        """
+        Return the index of the invocant in its parent's children list.
+
+        The methods that change children keep it up to date.  If the list was
+        changed directly instead, the children get renumbered here.
+        """
+        children = self.parent.children
+        i = self._index
+        if i >= len(children) or children[i] is not self:
+            self.parent.update_sibling_maps()
+            i = self._index
+            assert children[i] is self, (children, self)
+        return i
 
     @property
     def next_sibling(self):
@@ -161,9 +197,9 @@ class Base(object):
         if self.parent is None:
             return None
 
-        if self.parent.next_sibling_map is None:
-            self.parent.update_sibling_maps()
-        return self.parent.next_sibling_map[id(self)]
+        i = self._position() + 1
+        children = self.parent.children
+        return children[i] if i < len(children) else None
 
     @property
     def prev_sibling(self):
@@ -174,13 +210,24 @@ class Base(object):
         if self.parent is None:
             return None
 
-        if self.parent.prev_sibling_map is None:
-            self.parent.update_sibling_maps()
-        return self.parent.prev_sibling_map[id(self)]
+        i = self._position()
+        return self.parent.children[i - 1] if i else None
 
     def leaves(self):
-        for child in self.children:
-            yield from child.leaves()
+        """Return an iterator over the leaves of the tree, left to right."""
+        # Iterators over the children of the nodes being walked, innermost
+        # last.  They see changes to the children made in the meantime, the
+        # way nested generators would, without being limited by recursion.
+        stack = [iter(self.children)]
+        while stack:
+            for node in stack[-1]:
+                if node.type < 256:
+                    yield node
+                elif node.children:
+                    stack.append(iter(node.children))
+                    break
+            else:
+                stack.pop()
 
     def depth(self):
         if self.parent is None:
@@ -205,10 +252,14 @@ class Node(Base):
 
     """Concrete implementation for interior nodes."""
 
+    __slots__ = (
+        "children",
+        "used_names",  # Set of all NAME values, on the root from the parser
+    )
+
     def __init__(self,type, children,
                  context=None,
-                 prefix=None,
-                 fixers_applied=None):
+                 prefix=None):
         """
         Initializer.
 
@@ -219,17 +270,16 @@ class Node(Base):
         """
         assert type >= 256, type
         self.type = type
+        self.parent = None
+        self.was_changed = False
+        self._index = 0
         self.children = list(children)
-        for ch in self.children:
+        for i, ch in enumerate(self.children):
             assert ch.parent is None, repr(ch)
             ch.parent = self
-        self.invalidate_sibling_maps()
+            ch._index = i
         if prefix is not None:
             self.prefix = prefix
-        if fixers_applied:
-            self.fixers_applied = fixers_applied[:]
-        else:
-            self.fixers_applied = None
 
     def __repr__(self):
         """Return a canonical string representation."""
@@ -243,7 +293,7 @@ class Node(Base):
 
         This reproduces the input source exactly.
         """
-        return "".join(map(str, self.children))
+        return self.render()
 
     if sys.version_info > (3, 0):
         __str__ = __unicode__
@@ -252,22 +302,60 @@ class Node(Base):
         """Compare two nodes for equality."""
         return (self.type, self.children) == (other.type, other.children)
 
+    def render(self):
+        """
+        Return the source code of the node and its descendants.
+
+        The leaves are collected into one list without recursion and joined
+        in one go.
+        """
+        parts = []
+        # See leaves() for the stack.
+        stack = [iter(self.children)]
+        while stack:
+            for node in stack[-1]:
+                if node.type < 256:
+                    parts.append(node.prefix)
+                    parts.append(node.value)
+                elif node.children:
+                    stack.append(iter(node.children))
+                    break
+            else:
+                stack.pop()
+        return "".join(parts)
+
     def clone(self):
         """Return a cloned (deep) copy of self."""
-        return Node(self.type, [ch.clone() for ch in self.children],
-                    fixers_applied=self.fixers_applied)
+        return Node(self.type, [ch.clone() for ch in self.children])
 
     def post_order(self):
         """Return a post-order iterator for the tree."""
-        for child in self.children:
-            yield from child.post_order()
-        yield self
+        # Like in leaves(), but each iterator goes with the node it walks.
+        stack = [(self, iter(self.children))]
+        while stack:
+            node, children = stack[-1]
+            for child in children:
+                if child.children:
+                    stack.append((child, iter(child.children)))
+                    break
+                yield child
+            else:
+                stack.pop()
+                yield node
 
     def pre_order(self):
         """Return a pre-order iterator for the tree."""
         yield self
-        for child in self.children:
-            yield from child.pre_order()
+        # See leaves() for the stack.
+        stack = [iter(self.children)]
+        while stack:
+            for node in stack[-1]:
+                yield node
+                if node.children:
+                    stack.append(iter(node.children))
+                    break
+            else:
+                stack.pop()
 
     @property
     def prefix(self):
@@ -291,8 +379,8 @@ class Node(Base):
         child.parent = self
         self.children[i].parent = None
         self.children[i] = child
+        child._index = i if i >= 0 else i + len(self.children)
         self.changed()
-        self.invalidate_sibling_maps()
 
     def insert_child(self, i, child):
         """
@@ -302,7 +390,7 @@ class Node(Base):
         child.parent = self
         self.children.insert(i, child)
         self.changed()
-        self.invalidate_sibling_maps()
+        self.update_sibling_maps(max(i, 0))
 
     def append_child(self, child):
         """
@@ -310,51 +398,67 @@ class Node(Base):
         child's parent attribute appropriately.
         """
         child.parent = self
+        child._index = len(self.children)
         self.children.append(child)
         self.changed()
-        self.invalidate_sibling_maps()
 
     def invalidate_sibling_maps(self):
-        self.prev_sibling_map = None
-        self.next_sibling_map = None
-
-    def update_sibling_maps(self):
-        self.prev_sibling_map = _prev = {}
-        self.next_sibling_map = _next = {}
-        previous = None
-        for current in self.children:
-            _prev[id(current)] = previous
-            _next[id(previous)] = current
-            previous = current
-        _next[id(current)] = None
+        """
+        Note that the children list was changed directly.  Sibling lookups
+        detect that on their own, so this just renumbers the children.
+        """
+        self.update_sibling_maps()
+
+    def update_sibling_maps(self, start=0):
+        """Renumber the children from index `start` on."""
+        children = self.children
+        for i in range(start, len(children)):
+            children[i]._index = i
 
 class Leaf(Base):
 
     """Concrete implementation for leaf nodes."""
 
-    # Default values for instance variables
-    _prefix = ""  # Whitespace and comments preceding this token in the input
-    lineno = 0    # Line where this token starts in the input
-    column = 0    # Column where this token tarts in the input
+    __slots__ = (
+        "_value",
+        "_prefix",   # Whitespace and comments preceding this token in the input
+        "lineno",    # Line where this token starts in the input
+        "column",    # Column where this token tarts in the input
+        "comments",  # (start, end) of each comment in the prefix, if known
+        # Bolted on by Black's BracketTracker
+        "bracket_depth",
+        "opening_bracket",
+    )
+
+    children = ()  # Leaves have no subnodes
 
     def __init__(self, type, value,
                  context=None,
                  prefix=None,
-                 fixers_applied=[]):
+                 comments=None):
         """
         Initializer.
 
         Takes a type constant (a token number < 256), a string value, and an
         optional context keyword argument.
+
+        The parser also passes the offsets of the comments in the prefix, as
+        found by the tokenizer.  They are forgotten when the prefix changes.
         """
         assert 0 <= type < 256, type
         if context is not None:
             self._prefix, (self.lineno, self.column) = context
+        else:
+            self._prefix = ""
+            self.lineno = self.column = 0
         self.type = type
-        self.value = value
+        self.parent = None
+        self.was_changed = False
+        self._index = 0
+        self._value = value
         if prefix is not None:
             self._prefix = prefix
-        self.fixers_applied = fixers_applied[:]
+        self.comments = comments
 
     def __repr__(self):
         """Return a canonical string representation."""
@@ -378,11 +482,14 @@ class Leaf(Base):
         """Compare two nodes for equality."""
         return (self.type, self.value) == (other.type, other.value)
 
+    def render(self):
+        """Return the source code of the leaf."""
+        return self.prefix + self.value
+
     def clone(self):
         """Return a cloned (deep) copy of self."""
         return Leaf(self.type, self.value,
-                    (self.prefix, (self.lineno, self.column)),
-                    fixers_applied=self.fixers_applied)
+                    (self.prefix, (self.lineno, self.column)))
 
     def leaves(self):
         yield self
@@ -404,8 +511,25 @@ class Leaf(Base):
 
     @prefix.setter
     def prefix(self, prefix):
-        self.changed()
+        global leaf_edits
+        if self.was_changed is False:
+            self.changed()
         self._prefix = prefix
+        self.comments = None
+        leaf_edits += 1
+
+    @property
+    def value(self):
+        """
+        The text of this token.
+        """
+        return self._value
+
+    @value.setter
+    def value(self, value):
+        global leaf_edits
+        self._value = value
+        leaf_edits += 1
 
 def convert(gr, raw_node):
     """
@@ -1,7 +1,7 @@
 # Stubs for lib2to3.pytree (Python 3.6)
 
 import sys
-from typing import Any, Callable, Dict, Iterator, List, Optional, Text, Tuple, TypeVar, Union
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Text, Tuple, TypeVar, Union
 
 from blib2to3.pgen2.grammar import Grammar
 
@@ -11,8 +11,10 @@ _Context = Tuple[Text, int, int]
 _Results = Dict[Text, _NL]
 _RawNode = Tuple[int, Text, _Context, Optional[List[_NL]]]
 _Convert = Callable[[Grammar, _RawNode], Any]
+_Comments = Tuple[Tuple[int, int], ...]
 
 HUGE: int
+leaf_edits: int
 
 def type_repr(type_num: int) -> Text: ...
 
@@ -21,11 +23,11 @@ class Base:
     parent: Optional[Node]
     prefix: Text
     children: List[_NL]
-    was_changed: bool
-    was_checked: bool
+    was_changed: Optional[bool]
     def __eq__(self, other: Any) -> bool: ...
     def _eq(self: _P, other: _P) -> bool: ...
     def clone(self: _P) -> _P: ...
+    def render(self) -> Text: ...
     def post_order(self) -> Iterator[_NL]: ...
     def pre_order(self) -> Iterator[_NL]: ...
     def replace(self, new: Union[_NL, List[_NL]]) -> None: ...
@@ -44,18 +46,20 @@ class Base:
         def set_prefix(self, prefix: Text) -> None: ...
 
 class Node(Base):
-    fixers_applied: List[Any]
-    def __init__(self, type: int, children: List[_NL], context: Optional[Any] = ..., prefix: Optional[Text] = ..., fixers_applied: Optional[List[Any]] = ...) -> None: ...
+    used_names: Set[Text]
+    def __init__(self, type: int, children: List[_NL], context: Optional[Any] = ..., prefix: Optional[Text] = ...) -> None: ...
     def set_child(self, i: int, child: _NL) -> None: ...
     def insert_child(self, i: int, child: _NL) -> None: ...
     def append_child(self, child: _NL) -> None: ...
+    def invalidate_sibling_maps(self) -> None: ...
+    def update_sibling_maps(self, start: int = ...) -> None: ...
 
 class Leaf(Base):
     lineno: int
     column: int
     value: Text
-    fixers_applied: List[Any]
-    def __init__(self, type: int, value: Text, context: Optional[_Context] = ..., prefix: Optional[Text] = ..., fixers_applied: List[Any] = ...) -> None: ...
+    comments: Optional[_Comments]
+    def __init__(self, type: int, value: Text, context: Optional[_Context] = ..., prefix: Optional[Text] = ..., comments: Optional[_Comments] = ...) -> None: ...
     # bolted on attributes by Black
     bracket_depth: int
     opening_bracket: Leaf
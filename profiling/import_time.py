@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""Benchmark `import black` using `python -X importtime`.
+
+Runs a fresh interpreter a number of times and reports the best cumulative
+import time of `black` together with the modules that took the longest to
+import on their own.  Usage:
+
+    python profiling/import_time.py [--runs N] [--top N]
+"""
+import argparse
+from pathlib import Path
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def import_times() -> Dict[str, Tuple[int, int]]:
+    """Return {module: (self_us, cumulative_us)} for one `import black`."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import black"],
+        cwd=str(ROOT),
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        check=True,
+    )
+    times: Dict[str, Tuple[int, int]] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        if not self_us.strip().isdigit():
+            continue  # the header line
+
+        times[name.strip()] = (int(self_us), int(cumulative_us))
+    return times
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--top", type=int, default=15)
+    args = parser.parse_args()
+
+    best: Dict[str, Tuple[int, int]] = {}
+    for _ in range(args.runs):
+        times = import_times()
+        if not best or times["black"][1] < best["black"][1]:
+            best = times
+    slowest: List[Tuple[str, Tuple[int, int]]] = sorted(
+        best.items(), key=lambda item: item[1][0], reverse=True
+    )
+    print(f"import black: {best['black'][1] / 1000:.1f} ms (best of {args.runs})")
+    print(f"{len(best)} modules imported; slowest by self time:")
+    for name, (self_us, cumulative_us) in slowest[: args.top]:
+        print(f"  {self_us / 1000:8.2f} ms  {cumulative_us / 1000:8.2f} ms  {name}")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,19 +3,23 @@ import asyncio
 from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from functools import partial
-from io import BytesIO, TextIOWrapper
+from io import BytesIO, StringIO, TextIOWrapper
 import os
 from pathlib import Path
 import re
+import subprocess
 import sys
 from tempfile import TemporaryDirectory
-from typing import Any, BinaryIO, Generator, List, Tuple, Iterator
+from typing import Any, BinaryIO, Dict, Generator, Iterable, List, Tuple, Iterator
 import unittest
 from unittest.mock import patch, MagicMock
 
 from click import unstyle
 from click.testing import CliRunner
 
+from blib2to3 import pytree
+from blib2to3.pgen2 import driver, grammar, pgen, token, tokenize
+
 import black
 
 
@@ -54,6 +58,17 @@ def read_data(name: str, data: bool = True) -> Tuple[str, str]:
     return "".join(_input).strip() + "\n", "".join(_output).strip() + "\n"
 
 
+def tree_contents(node: pytree.Base, positions: bool = True) -> Any:
+    """Return the types, values, prefixes and positions of all nodes in `node`."""
+    if isinstance(node, pytree.Leaf):
+        if not positions:
+            return node.type, node.value, node.prefix
+
+        return node.type, node.value, node.prefix, node.lineno, node.column
+
+    return node.type, [tree_contents(child, positions) for child in node.children]
+
+
 @contextmanager
 def cache_dir(exists: bool = True) -> Iterator[Path]:
     with TemporaryDirectory() as workspace:
@@ -140,6 +155,91 @@ class BlackTestCase(unittest.TestCase):
             os.unlink(tmp_file)
         self.assertFormatEqual(expected, actual)
 
+    def test_format_str_iter(self) -> None:
+        source, expected = read_data("function")
+        chunks = list(black.format_str_iter(source, line_length=ll))
+        self.assertGreater(len(chunks), 1)
+        self.assertFormatEqual(expected, "".join(chunks))
+        self.assertTrue(black.is_same_contents(expected, chunks))
+        self.assertFalse(black.is_same_contents(expected + "\n", chunks))
+        self.assertFalse(black.is_same_contents(expected, chunks[:-1]))
+        self.assertFalse(black.is_same_contents(source, chunks))
+        self.assertTrue(black.is_same_contents("", []))
+        tmp_file = Path(black.dump_to_file(source))
+        try:
+            self.assertTrue(ff(tmp_file, write_back=black.WriteBack.YES))
+            self.assertFalse(ff(tmp_file, write_back=black.WriteBack.YES))
+            with open(tmp_file, encoding="utf8") as f:
+                actual = f.read()
+        finally:
+            os.unlink(tmp_file)
+        self.assertFormatEqual(expected, actual)
+
+    def test_format_whitespace_only_file_in_place(self) -> None:
+        tmp_file = Path(black.dump_to_file("\n\n"))
+        try:
+            self.assertFalse(ff(tmp_file, write_back=black.WriteBack.YES))
+            with open(tmp_file, encoding="utf8") as f:
+                actual = f.read()
+        finally:
+            os.unlink(tmp_file)
+        self.assertEqual(actual, "\n\n")
+
+    def test_line_str(self) -> None:
+        node = black.lib2to3_parse("print(a, b)  # comment\n")
+        line = next(black.LineGenerator().visit(node))
+        rendered = str(line)
+        self.assertEqual(rendered, "print(a, b)  # comment\n")
+        self.assertIs(str(line), rendered)
+        line.append(black.Leaf(token.COMMENT, "# more"))
+        self.assertEqual(str(line), "print(a, b)  # comment  # more\n")
+        # Changes made to the leaves or the depth in place are noticed too.
+        line.leaves[0].value = "exec"
+        self.assertEqual(str(line), "exec(a, b)  # comment  # more\n")
+        line.leaves[1].prefix = " "
+        self.assertEqual(str(line), "exec (a, b)  # comment  # more\n")
+        line.depth += 1
+        self.assertEqual(str(line), "    exec (a, b)  # comment  # more\n")
+        rendered = str(line)
+        self.assertIs(str(line), rendered)
+        self.assertEqual(str(black.Line()), "\n")
+
+    def test_line_comments(self) -> None:
+        node = black.lib2to3_parse("x = {a,  # one\n b,  # two\n}  # three\n")
+        line = next(black.LineGenerator().visit(node))
+        self.assertEqual([leaf.value for leaf in line.leaves[-3:]], [",", "b", "}"])
+        a, comma, b, rbrace = line.leaves[-4:]
+
+        def comments_after(leaf: black.Leaf) -> List[str]:
+            return [comment.value for comment in line.comments_after(leaf)]
+
+        self.assertEqual(comments_after(a), [])
+        self.assertEqual(comments_after(comma), ["# one"])
+        # The comment after the removed trailing comma moved to `b`.
+        self.assertEqual(comments_after(b), ["# two"])
+        self.assertEqual(comments_after(rbrace), ["# three"])
+        self.assertEqual(next(line.comments_after(comma, 4)).value, "# one")
+        self.assertEqual(str(line), "x = {a, b}  # one  # two  # three\n")
+
+    def test_complex_subscript_memo(self) -> None:
+        def build(source: str) -> str:
+            line = black.Line()
+            for leaf in black.lib2to3_parse(source).leaves():
+                leaf.prefix = ""
+                line.append(leaf)
+            self.assertEqual(line.bracket_tracker._complex_subscripts, {})
+            return str(line)
+
+        pre_order = pytree.Node.pre_order
+        with patch.object(
+            pytree.Node, "pre_order", autospec=True, side_effect=pre_order
+        ) as mock:
+            self.assertEqual(build("y['a' 'b' 'c' 'd']\n"), "y['a' 'b' 'c' 'd']\n")
+            self.assertEqual(mock.call_count, 1)
+            mock.reset_mock()
+            self.assertEqual(build("y[a + 1 : b, c:d]\n"), "y[a + 1 : b, c:d]\n")
+            self.assertEqual(mock.call_count, 2)
+
     @patch("black.dump_to_file", dump_to_stderr)
     def test_self(self) -> None:
         source, expected = read_data("test_black", data=False)
@@ -149,6 +249,32 @@ class BlackTestCase(unittest.TestCase):
         black.assert_stable(source, actual, line_length=ll)
         self.assertFalse(ff(THIS_FILE))
 
+    @unittest.skipIf(sys.version_info < (3, 7), "-X importtime is new in 3.7")
+    def test_import_time(self) -> None:
+        # The modules only needed by the command line stay out of `import black`.
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", "import black"],
+            cwd=str(THIS_DIR.parent),
+            stderr=subprocess.PIPE,
+            universal_newlines=True,
+            check=True,
+        )
+        imported = {
+            line.split("|")[-1].strip()
+            for line in result.stderr.splitlines()
+            if line.startswith("import time:")
+        }
+        self.assertIn("black", imported)
+        for name in (
+            "asyncio",
+            "concurrent.futures",
+            "multiprocessing",
+            "toml",
+            "difflib",
+            "blib2to3.pgen2.pgen",
+        ):
+            self.assertNotIn(name, imported)
+
     @patch("black.dump_to_file", dump_to_stderr)
     def test_black(self) -> None:
         source, expected = read_data("../black", data=False)
@@ -787,6 +913,32 @@ class BlackTestCase(unittest.TestCase):
             f"AST print out is different. Actual version dumped to {log_name}",
         )
 
+    def test_whitespace_table(self) -> None:
+        whitespace = black.whitespace
+        mismatches = []
+
+        def checked_whitespace(leaf: black.Leaf, *, complex_subscript: bool) -> str:
+            result = whitespace(leaf, complex_subscript=complex_subscript)
+            p = leaf.parent
+            if p is not None and leaf.type not in black.ALWAYS_NO_SPACE:
+                prev = leaf.prev_sibling
+                prevp = None if prev else black.preceding_leaf(p)
+                expected = black._whitespace(
+                    leaf, p, prev, prevp, complex_subscript=complex_subscript
+                )
+                if result != expected:
+                    mismatches.append((leaf, result, expected))
+            return result
+
+        with patch.dict(black.WHITESPACE_TABLE, clear=True), patch(
+            "black.whitespace", checked_whitespace
+        ):
+            for path in sorted((THIS_DIR / "data").glob("*.py*")):
+                source, _ = read_data(path.name)
+                black.format_str(source, line_length=ll)
+            self.assertGreater(len(black.WHITESPACE_TABLE), 100)
+        self.assertEqual(mismatches, [])
+
     def test_format_file_contents(self) -> None:
         empty = ""
         with self.assertRaises(black.NothingChanged):
@@ -812,6 +964,354 @@ class BlackTestCase(unittest.TestCase):
         self.assertEqual(len(n.children), 1)
         self.assertEqual(n.children[0].type, black.token.ENDMARKER)
 
+    def test_generate_tokens_from_string(self) -> None:
+        sources = [
+            path.read_text(encoding="utf8")
+            for path in sorted((THIS_DIR / "data").glob("*.py"))
+        ]
+        sources.append((THIS_DIR.parent / "black.py").read_text(encoding="utf8"))
+        sources.extend(
+            [
+                "",
+                "x = 1",
+                "x = '''\nabc\n'''",
+                "async def f():\n\tawait x\n",
+                "x = rb'a' + f\"b\" + u'c' + x'd'\n",
+                "x = .5 + a.b[1.]\n",
+                "if x:\n    y\n  ",
+            ]
+        )
+        for src in sources:
+            expected = list(tokenize.generate_tokens(StringIO(src).readline))
+            actual = list(tokenize.generate_tokens_from_string(src))
+            self.assertEqual(expected, actual)
+        with self.assertRaises(tokenize.TokenError):
+            list(tokenize.generate_tokens_from_string("x = '''\n"))
+
+    def test_token_buffer_parse(self) -> None:
+        buffer = tokenize.tokenize_string("x = 1\n")
+        self.assertEqual(len(buffer), len(list(buffer)))
+        self.assertEqual(buffer[-1][0], black.token.ENDMARKER)
+        drv = driver.Driver(
+            black.pygram.python_grammar_no_print_statement, pytree.convert
+        )
+        sources = [
+            path.read_text(encoding="utf8")
+            for path in sorted((THIS_DIR / "data").glob("comments*.py"))
+        ]
+        sources.append("if x:\n    y = 1\n        # deep\n  # mid\n\nz = 2\n   ")
+        for source in sources:
+            tokens = tokenize.generate_tokens(StringIO(source).readline)
+            expected = drv.parse_tokens(tokens)
+            actual = drv.parse_tokens(tokenize.tokenize_string(source))
+            self.assertEqual(str(expected), str(actual))
+            self.assertEqual(
+                [(n.type, n.prefix) for n in expected.pre_order()],
+                [(n.type, n.prefix) for n in actual.pre_order()],
+            )
+
+    def test_lib2to3_parse_tokenizes_once(self) -> None:
+        source, _ = read_data("python2")
+        with patch("black.tokenize_string", wraps=black.tokenize_string) as ts:
+            node = black.lib2to3_parse(source)
+        self.assertEqual(ts.call_count, 1)
+        self.assertEqual(str(node), source)
+        # Errors from the tokenizer surface only once the parser gets there.
+        with self.assertRaises(ValueError) as e:
+            black.lib2to3_parse("x = = 1\ny = (\n")
+        self.assertEqual(str(e.exception), "Cannot parse: 1:4: x = = 1")
+        with self.assertRaises(tokenize.TokenError):
+            black.lib2to3_parse("print 1\ny = (\n")
+
+    def test_lib2to3_reparse(self) -> None:
+        source, _ = read_data("function")
+        edits = [
+            ("  return None\n", "  return 42\n"),
+            ("  return None\n", "  return None\n  # trailing\n"),
+            ("    continue\n", "    continue\n  else:\n    pass\n"),
+            ("@asyncio.coroutine\n", "@asyncio.coroutine\n@another\n"),
+            ("import asyncio\n", ""),
+            ("def func_no_args():", "def func_no_args():\n  pass\nclass C:"),
+        ]
+        for old, new in edits:
+            edited = source.replace(old, new, 1)
+            grammar_choice = black.GrammarChoice()
+            node = black.lib2to3_parse(source, grammar_choice)
+            first, last = node.children[1], node.children[-2]
+            reparsed = black.lib2to3_reparse(source, node, edited, grammar_choice)
+            expected_choice = black.GrammarChoice()
+            expected = black.lib2to3_parse(edited, expected_choice)
+            # Statements after the edit keep their positions in `source`.
+            self.assertEqual(
+                tree_contents(reparsed, positions=False),
+                tree_contents(expected, positions=False),
+            )
+            if source.count("\n") == edited.count("\n"):
+                self.assertEqual(tree_contents(reparsed), tree_contents(expected))
+            self.assertEqual(grammar_choice, expected_choice)
+            if grammar_choice.index == 0:
+                self.assertIs(reparsed.children[-2], last)
+                if old != "import asyncio\n":
+                    self.assertIs(reparsed.children[1], first)
+        grammar_choice = black.GrammarChoice()
+        node = black.lib2to3_parse(source + "# Who knows.\n", grammar_choice)
+        edited = source + "# Who cares.\n"
+        reparsed = black.lib2to3_reparse(
+            source + "# Who knows.\n", node, edited, grammar_choice
+        )
+        self.assertEqual(str(reparsed), edited)
+        grammar_choice = black.GrammarChoice()
+        node = black.lib2to3_parse(source, grammar_choice)
+        with self.assertRaises(tokenize.TokenError):
+            black.lib2to3_reparse(source, node, source + "x = (\n", grammar_choice)
+
+    def test_grammar_transitions(self) -> None:
+        python_grammar = black.pygram.python_grammar
+        transitions = python_grammar.get_transitions()
+        self.assertIs(python_grammar.get_transitions(), transitions)
+        self.assertEqual(set(transitions), set(python_grammar.dfas))
+        with TemporaryDirectory() as workspace:
+            pickle_file = os.path.join(workspace, "grammar.pickle")
+            python_grammar.dump(pickle_file)
+            loaded = grammar.Grammar()
+            loaded.load(pickle_file)
+        self.assertIsNone(loaded.transitions)
+        self.assertEqual(loaded.get_transitions(), transitions)
+
+    def test_grammar_tables_module(self) -> None:
+        blib2to3_dir = os.path.dirname(black.pygram.__file__)
+        for name in ("Grammar.txt", "PatternGrammar.txt"):
+            gt = os.path.join(blib2to3_dir, name)
+            generated = pgen.generate_grammar(gt)
+            loaded = driver.load_packaged_grammar("blib2to3", gt)
+            self.assertEqual(loaded.tables(), generated.tables(), name)
+            with TemporaryDirectory() as workspace:
+                module_file = os.path.join(workspace, "tables.py")
+                generated.dump_module(module_file, driver._source_hash(gt))
+                with open(module_file, encoding="utf8") as f:
+                    module_source = f.read()
+            namespace: Dict[str, Any] = {}
+            exec(module_source, namespace)
+            self.assertEqual(namespace["TABLES"], generated.tables(), name)
+            # The checked in module is up to date with the grammar.
+            module_name = driver._generate_tables_name(gt) + ".py"
+            with open(os.path.join(blib2to3_dir, module_name), encoding="utf8") as f:
+                self.assertEqual(f.read(), module_source, name)
+        # A module generated from another version of the grammar is ignored.
+        with TemporaryDirectory() as workspace:
+            gt = os.path.join(workspace, "Grammar.txt")
+            with open(os.path.join(blib2to3_dir, "Grammar.txt"), encoding="utf8") as f:
+                source = f.read()
+            with open(gt, "w", encoding="utf8") as f:
+                f.write(source.replace("'print'", "'echo'"))
+            loaded = driver.load_packaged_grammar("blib2to3", gt)
+            self.assertIn("echo", loaded.keywords)
+            self.assertNotIn("print", loaded.keywords)
+
+    def test_slotted_tree(self) -> None:
+        node = black.lib2to3_parse("foo = bar + bar\nprint(foo, bar)\n")
+        leaves = list(node.leaves())
+        for n in (node, *leaves):
+            self.assertFalse(hasattr(n, "__dict__"), n)
+        foos = [leaf for leaf in leaves if leaf.value == "foo"]
+        self.assertIs(foos[0].value, foos[1].value)
+        self.assertIs(leaves[0].lineno, leaves[2].lineno)
+        clone = node.clone()
+        self.assertEqual(clone, node)
+        self.assertEqual(str(clone), str(node))
+
+    def test_tree_traversal(self) -> None:
+        source, _ = read_data("expression")
+        node = black.lib2to3_parse(source)
+
+        def pre_order(n: black.LN) -> Iterator[black.LN]:
+            yield n
+            for child in n.children:
+                yield from pre_order(child)
+
+        def post_order(n: black.LN) -> Iterator[black.LN]:
+            for child in n.children:
+                yield from post_order(child)
+            yield n
+
+        def ids(nodes: Iterable[black.LN]) -> List[int]:
+            return [id(n) for n in nodes]
+
+        self.assertEqual(ids(node.pre_order()), ids(pre_order(node)))
+        self.assertEqual(ids(node.post_order()), ids(post_order(node)))
+        self.assertEqual(
+            ids(node.leaves()), ids(n for n in pre_order(node) if n.type < 256)
+        )
+        # Depth is not limited by the recursion limit.
+        depth = sys.getrecursionlimit() * 2
+        drv = driver.Driver(black.pygram.python_grammar, pytree.convert)
+        deep = drv.parse_string("x = " + "-" * depth + "1\n")
+        self.assertEqual(len(list(deep.leaves())), depth + 5)
+        self.assertEqual(len(list(deep.pre_order())), len(list(deep.post_order())))
+
+    def test_render(self) -> None:
+        source, _ = read_data("expression")
+        drv = driver.Driver(black.GRAMMARS[0], pytree.convert)
+        node = drv.parse_string(source)
+        self.assertEqual(str(node), source)
+        self.assertEqual("".join(map(str, node.children)), source)
+        stmt = node.children[1]
+        assert isinstance(stmt, pytree.Node)
+        stmt_source = stmt.render()
+        self.assertEqual(stmt_source, "'some_string'\n")
+        # Changes show up however they were made.
+        leaf = next(stmt.leaves())
+        leaf.prefix = "  "
+        leaf.value = "changed"
+        self.assertEqual(str(stmt), "  changed\n")
+        stmt.children.append(pytree.Leaf(token.NAME, "x"))
+        self.assertEqual(str(node), source.replace(stmt_source, "  changed\nx", 1))
+        # Depth is not limited by the recursion limit.
+        depth = sys.getrecursionlimit() * 2
+        code = "x = " + "-" * depth + "1\n"
+        self.assertEqual(str(drv.parse_string(code)), code)
+
+    def test_siblings(self) -> None:
+        node = black.lib2to3_parse("a, b, c\n").children[0].children[0]
+        assert isinstance(node, black.Node)
+        a, comma1, b, comma2, c = node.children
+
+        def siblings(leaf: black.LN) -> Tuple[Any, Any]:
+            return leaf.prev_sibling, leaf.next_sibling
+
+        self.assertEqual(siblings(a), (None, comma1))
+        self.assertEqual(siblings(b), (comma1, comma2))
+        self.assertEqual(siblings(c), (comma2, None))
+        d = black.Leaf(token.NAME, "d")
+        node.insert_child(0, d)
+        self.assertEqual(siblings(a), (d, comma1))
+        self.assertEqual(siblings(c), (comma2, None))
+        self.assertEqual(comma1.remove(), 2)
+        self.assertEqual(siblings(b), (a, comma2))
+        e = black.Leaf(token.NAME, "e")
+        node.set_child(-1, e)
+        self.assertEqual(siblings(e), (comma2, None))
+        f = black.Leaf(token.NAME, "f")
+        node.append_child(f)
+        self.assertEqual(siblings(e), (comma2, f))
+        g = black.Leaf(token.NAME, "g")
+        b.replace([g, d.clone()])
+        self.assertEqual(siblings(g), (a, node.children[3]))
+        # Changes made directly to the children list are noticed, too.
+        node.children.reverse()
+        self.assertEqual(siblings(f), (None, e))
+        self.assertEqual(siblings(d), (a, None))
+
+    def test_change_tracking(self) -> None:
+        source = "def f():\n    return a + b\n"
+        python_grammar = black.pygram.python_grammar
+        tracked = driver.Driver(python_grammar, pytree.convert).parse_string(source)
+        leaf = next(leaf for leaf in tracked.leaves() if leaf.value == "b")
+        leaf.prefix = "  "
+        self.assertTrue(leaf.was_changed)
+        self.assertTrue(tracked.was_changed)
+        untracked = black.lib2to3_parse(source)
+        leaf = next(leaf for leaf in untracked.leaves() if leaf.value == "b")
+        leaf.prefix = "  "
+        assert leaf.parent is not None
+        leaf.parent.append_child(black.Leaf(token.NAME, "c"))
+        self.assertEqual(str(untracked), "def f():\n    return a +  bc\n")
+        self.assertTrue(all(n.was_changed is None for n in untracked.children))
+        self.assertIsNone(leaf.was_changed)
+
+    def test_grammar_variants(self) -> None:
+        python_grammar = black.pygram.python_grammar
+        python3_grammar = (
+            black.pygram.python_grammar_no_print_statement_no_exec_statement
+        )
+        self.assertIs(python3_grammar.dfas, python_grammar.dfas)
+        self.assertIs(python3_grammar.labels, python_grammar.labels)
+        self.assertNotIn("print", python3_grammar.keywords)
+        self.assertNotIn("exec", python3_grammar.keywords)
+        self.assertIn("print", python_grammar.keywords)
+        self.assertIn("exec", python_grammar.keywords)
+        self.assertIs(
+            python3_grammar.get_transitions(), python_grammar.get_transitions()
+        )
+        no_print_grammar = python3_grammar.without_keywords("print")
+        self.assertIs(no_print_grammar.base, python_grammar)
+        if sys.version_info >= (3, 7):
+            self.assertNotIn("pattern_grammar", vars(black.pygram))
+        pattern_grammar = black.pygram.pattern_grammar
+        self.assertIn("Matcher", pattern_grammar.symbol2number)
+        self.assertIs(black.pygram.pattern_grammar, pattern_grammar)
+
+    def test_parser_builds_tree(self) -> None:
+        source, _ = read_data("function")
+        python_grammar = black.GRAMMARS[0]
+        built = driver.Driver(python_grammar, pytree.convert).parse_string(source)
+        converted = driver.Driver(
+            python_grammar, lambda gr, raw: pytree.convert(gr, raw)
+        ).parse_string(source)
+        self.assertEqual(tree_contents(built), tree_contents(converted))
+        self.assertEqual(str(built), source)
+        assert isinstance(built, pytree.Node)
+        self.assertIn("print", built.used_names)
+        bare = driver.Driver(
+            python_grammar, pytree.convert, collect_used_names=False
+        ).parse_string(source)
+        self.assertEqual(tree_contents(bare), tree_contents(built))
+        self.assertFalse(hasattr(bare, "used_names"))
+
+    def test_partially_consume_prefix(self) -> None:
+        drv = driver.Driver(black.pygram.python_grammar)
+        prefix = "    # a\n\n  \t# b\n  # c\n# d\n"
+        self.assertEqual(
+            drv._partially_consume_prefix(prefix, 4),
+            ("    # a\n\n  \t# b\n", "  # c\n# d\n"),
+        )
+        self.assertEqual(drv._partially_consume_prefix(prefix, 0), (prefix, ""))
+        self.assertEqual(drv._partially_consume_prefix("  # x", 4), ("", "  # x"))
+
+    def test_prefix_comments(self) -> None:
+        source, _ = read_data("comments2")
+        node = black.lib2to3_parse(source + "x = [  # a\n    1,  \\\n\n    # b\n]\n")
+        commented = 0
+        for leaf in node.leaves():
+            self.assertIsNotNone(leaf.comments)
+            for is_endmarker in (False, True):
+                comments = black.prefix_comments(leaf, is_endmarker=is_endmarker)
+                self.assertEqual(
+                    comments,
+                    black.list_comments(leaf.prefix, is_endmarker=is_endmarker),
+                )
+            commented += bool(leaf.comments)
+        self.assertGreater(commented, 10)
+        first = black.prefix_comments(node, is_endmarker=False)[0]
+        self.assertTrue(first.value.startswith("# Please keep __all__"))
+        leaf = next(node.leaves())
+        leaf.prefix = "# changed\n"
+        self.assertIsNone(leaf.comments)
+        self.assertEqual(
+            black.prefix_comments(node, is_endmarker=False),
+            [black.ProtoComment(black.token.COMMENT, "# changed", 0, 10)],
+        )
+
+    @patch("black.dump_to_file", dump_to_stderr)
+    def test_long_multiline_string(self) -> None:
+        # Scanning continued strings used to be quadratic in their length.
+        body = "".join(f"SELECT {i} FROM t;\n" for i in range(50000))
+        source = f'QUERY = """\n{body}"""\n'
+        for tokens in (
+            tokenize.generate_tokens(StringIO(source).readline),
+            tokenize.generate_tokens_from_string(source),
+        ):
+            type, value, start, end, line = next(tokens)
+            self.assertEqual(value, "QUERY")
+            next(tokens)
+            type, value, start, end, line = next(tokens)
+            self.assertEqual(type, tokenize.STRING)
+            self.assertEqual(value, f'"""\n{body}"""')
+            self.assertEqual((start, end), ((1, 8), (50002, 3)))
+            self.assertEqual(line, source)
+        actual = fs(source)
+        self.assertFormatEqual(source, actual)
+
     @unittest.skipIf(os.environ.get("SKIP_AST_PRINT"), "user set SKIP_AST_PRINT")
     def test_assertFormatEqual(self) -> None:
         out_lines = []
@@ -863,7 +1363,7 @@ class BlackTestCase(unittest.TestCase):
     def test_cache_multiple_files(self) -> None:
         mode = black.FileMode.AUTO_DETECT
         with cache_dir() as workspace, patch(
-            "black.ProcessPoolExecutor", new=ThreadPoolExecutor
+            "concurrent.futures.ProcessPoolExecutor", new=ThreadPoolExecutor
         ):
             one = (workspace / "one.py").resolve()
             with one.open("w") as fobj:
@@ -945,7 +1445,7 @@ class BlackTestCase(unittest.TestCase):
     def test_failed_formatting_does_not_get_cached(self) -> None:
         mode = black.FileMode.AUTO_DETECT
         with cache_dir() as workspace, patch(
-            "black.ProcessPoolExecutor", new=ThreadPoolExecutor
+            "concurrent.futures.ProcessPoolExecutor", new=ThreadPoolExecutor
         ):
             failing = (workspace / "failing.py").resolve()
             with failing.open("w") as fobj:
@@ -1009,6 +1509,51 @@ class BlackTestCase(unittest.TestCase):
             two = black.read_cache(2, mode)
             self.assertNotIn(path, two)
 
+    def test_predict_grammar(self) -> None:
+        expected = {
+            "print('hello')\n": 0,
+            "print >> sys.stderr, x\n": 0,
+            "print if x else y\n": 0,
+            "f(print, x)\n": 0,
+            "exec = 1\nexec('code')\n": 0,
+            "exec 'code' in ns\n": 1,
+            "print 'hello'\n": 2,
+            "if x: print y\n": 2,
+            "def f():\n    exec code\n    x = 1; print\n    print {}\n": 2,
+        }
+        for source, index in expected.items():
+            tokens = tokenize.tokenize_string(source)
+            self.assertEqual(black.predict_grammar(tokens), index, source)
+        choice = black.GrammarChoice()
+        black.lib2to3_parse("exec 'code'\n", choice)
+        self.assertEqual(choice.index, 1)
+        # A grammar hint is trusted even if earlier grammars would also work.
+        choice = black.GrammarChoice(2)
+        node = black.lib2to3_parse("print(a, b)\n", choice)
+        self.assertEqual(node.children[0].children[0].type, black.syms.print_stmt)
+        self.assertEqual(choice.index, 2)
+
+    def test_grammar_cache(self) -> None:
+        mode = black.FileMode.AUTO_DETECT
+        source, _ = read_data("python2")
+        with cache_dir() as workspace:
+            src = (workspace / "py2.py").resolve()
+            with src.open("w") as fobj:
+                fobj.write(source)
+            report = black.Report(check=True)
+            black.reformat_one(src, ll, True, black.WriteBack.CHECK, mode, report)
+            cache = black.read_grammar_cache()
+            self.assertEqual(cache[src], (black.get_cache_info(src), 1))
+            self.assertEqual(black.get_grammar_hint(cache, src), 1)
+            with patch("black.predict_grammar", return_value=0), patch(
+                "black.driver.Driver", wraps=black.driver.Driver
+            ) as drv:
+                black.reformat_one(src, ll, True, black.WriteBack.CHECK, mode, report)
+            self.assertEqual(drv.call_count, 1)
+            with src.open("a") as fobj:
+                fobj.write("# changed\n")
+            self.assertEqual(black.get_grammar_hint(cache, src), 0)
+
     def test_single_file_force_pyi(self) -> None:
         reg_mode = black.FileMode.AUTO_DETECT
         pyi_mode = black.FileMode.PYI